@@ -0,0 +1,85 @@
+"""add user_daily_stats analytics rollup table
+
+Revision ID: 20260610_user_daily_stats
+Revises: 20260609_qn_upload
+Create Date: 2026-06-10
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "20260610_user_daily_stats"
+down_revision: Union[str, None] = "20260609_qn_upload"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNT_COLUMNS = [
+    "total",
+    "done",
+    "in_progress",
+    "cancelled",
+    "priority_high",
+    "priority_medium",
+    "priority_low",
+    "context_work",
+    "context_learning",
+    "context_life",
+    "estimated_minutes",
+    "actual_minutes",
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_daily_stats",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("progress_date", sa.Date(), nullable=False),
+        *[
+            sa.Column(name, sa.Integer(), server_default=sa.text("0"), nullable=False)
+            for name in COUNT_COLUMNS
+        ],
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "progress_date"),
+    )
+
+    # Backfill from existing entries (same aggregation as UserDailyStatsService.rebuild)
+    op.execute(
+        sa.text(
+            """
+            INSERT INTO user_daily_stats (
+                user_id, progress_date,
+                total, done, in_progress, cancelled,
+                priority_high, priority_medium, priority_low,
+                context_work, context_learning, context_life,
+                estimated_minutes, actual_minutes, updated_at
+            )
+            SELECT
+                d.user_id,
+                d.progress_date,
+                COUNT(e.id),
+                COUNT(e.id) FILTER (WHERE e.status = 'done'),
+                COUNT(e.id) FILTER (WHERE e.status = 'in-progress'),
+                COUNT(e.id) FILTER (WHERE e.status = 'cancelled'),
+                COUNT(e.id) FILTER (WHERE e.priority = 'high'),
+                COUNT(e.id) FILTER (WHERE e.priority = 'medium'),
+                COUNT(e.id) FILTER (WHERE e.priority = 'low'),
+                COUNT(e.id) FILTER (WHERE e.context = 'work'),
+                COUNT(e.id) FILTER (WHERE e.context = 'learning'),
+                COUNT(e.id) FILTER (WHERE e.context = 'life'),
+                COALESCE(SUM(e.estimated_minutes), 0),
+                COALESCE(SUM(e.actual_minutes), 0),
+                now() AT TIME ZONE 'utc'
+            FROM daily_progress_days d
+            JOIN daily_progress_entries e ON e.daily_progress_day_id = d.id
+            GROUP BY d.user_id, d.progress_date
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_daily_stats")
@@ -0,0 +1,62 @@
+"""composite and partial indexes for daily progress / backlog queries
+
+(user_id, progress_date) on daily_progress_days and (backlog_task_id, plan_date) on
+backlog_daily_links already exist as unique indexes; they are now declared on the models.
+
+Revision ID: 20260611_dp_query_indexes
+Revises: 20260610_user_daily_stats
+Create Date: 2026-06-11
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260611_dp_query_indexes"
+down_revision: Union[str, None] = "20260610_user_daily_stats"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Entries per day filtered / counted by status; the leading column also serves
+    # plain day lookups, so the single-column index is redundant.
+    op.create_index(
+        "ix_daily_progress_entries_day_status",
+        "daily_progress_entries",
+        ["daily_progress_day_id", "status"],
+    )
+    op.drop_index("ix_daily_progress_entries_day_id", table_name="daily_progress_entries")
+
+    # Most entries are not linked to a backlog task; only index the linked ones.
+    op.drop_index("ix_daily_progress_entries_backlog_task_id", table_name="daily_progress_entries")
+    op.create_index(
+        "ix_daily_progress_entries_backlog_task_id",
+        "daily_progress_entries",
+        ["backlog_task_id"],
+        postgresql_where=sa.text("backlog_task_id IS NOT NULL"),
+    )
+
+    # Backlog list tabs filter by (user, status); monthly stats count tasks by (plan, status).
+    op.create_index("ix_backlog_tasks_user_status", "backlog_tasks", ["user_id", "status"])
+    op.create_index("ix_monthly_tasks_plan_status", "monthly_tasks", ["monthly_plan_id", "status"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_monthly_tasks_plan_status", table_name="monthly_tasks")
+    op.drop_index("ix_backlog_tasks_user_status", table_name="backlog_tasks")
+
+    op.drop_index("ix_daily_progress_entries_backlog_task_id", table_name="daily_progress_entries")
+    op.create_index(
+        "ix_daily_progress_entries_backlog_task_id",
+        "daily_progress_entries",
+        ["backlog_task_id"],
+    )
+
+    op.create_index(
+        "ix_daily_progress_entries_day_id",
+        "daily_progress_entries",
+        ["daily_progress_day_id"],
+    )
+    op.drop_index("ix_daily_progress_entries_day_status", table_name="daily_progress_entries")
@@ -0,0 +1,40 @@
+"""backlog_tasks.normalized_title for indexed duplicate detection
+
+Stored generated column lower(btrim(title)) plus (user_id, normalized_title, created_at),
+so fuzzy-duplicate counts only touch tasks with the same title.
+
+Revision ID: 20260612_backlog_norm_title
+Revises: 20260611_dp_query_indexes
+Create Date: 2026-06-12
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260612_backlog_norm_title"
+down_revision: Union[str, None] = "20260611_dp_query_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "backlog_tasks",
+        sa.Column(
+            "normalized_title",
+            sa.String(length=200),
+            sa.Computed("lower(btrim(title))", persisted=True),
+        ),
+    )
+    op.create_index(
+        "ix_backlog_tasks_user_normalized_title_created",
+        "backlog_tasks",
+        ["user_id", "normalized_title", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_backlog_tasks_user_normalized_title_created", table_name="backlog_tasks")
+    op.drop_column("backlog_tasks", "normalized_title")
@@ -0,0 +1,64 @@
+"""occurrence summary columns on backlog_tasks
+
+occurrence_count / last_plan_date / linked_dates (first three plan dates) mirror
+backlog_daily_links so backlog list and detail reads need no link scan.
+
+Revision ID: 20260613_backlog_occ_summary
+Revises: 20260612_backlog_norm_title
+Create Date: 2026-06-13
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "20260613_backlog_occ_summary"
+down_revision: Union[str, None] = "20260612_backlog_norm_title"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "backlog_tasks",
+        sa.Column("occurrence_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column("backlog_tasks", sa.Column("last_plan_date", sa.Date(), nullable=True))
+    op.add_column(
+        "backlog_tasks",
+        sa.Column(
+            "linked_dates",
+            postgresql.ARRAY(sa.Date()),
+            server_default="{}",
+            nullable=False,
+        ),
+    )
+
+    op.execute(
+        sa.text(
+            """
+            UPDATE backlog_tasks t
+            SET occurrence_count = s.occurrence_count,
+                last_plan_date = s.last_plan_date,
+                linked_dates = s.linked_dates
+            FROM (
+                SELECT
+                    backlog_task_id,
+                    COUNT(*) AS occurrence_count,
+                    MAX(plan_date) AS last_plan_date,
+                    (ARRAY_AGG(plan_date ORDER BY plan_date))[1:3] AS linked_dates
+                FROM backlog_daily_links
+                GROUP BY backlog_task_id
+            ) s
+            WHERE t.id = s.backlog_task_id
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("backlog_tasks", "linked_dates")
+    op.drop_column("backlog_tasks", "last_plan_date")
+    op.drop_column("backlog_tasks", "occurrence_count")
@@ -0,0 +1,56 @@
+"""sort-key indexes for keyset (cursor) paginated lists
+
+Each list's ORDER BY, with id as the unique tie-break, so a cursor page is an index
+range scan whatever its depth.
+
+Revision ID: 20260614_keyset_indexes
+Revises: 20260613_backlog_occ_summary
+Create Date: 2026-06-14
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260614_keyset_indexes"
+down_revision: Union[str, None] = "20260613_backlog_occ_summary"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Extends (user_id, created_at) with the id tie-break.
+    op.drop_index("ix_quick_notes_user_created", table_name="quick_notes")
+    op.create_index(
+        "ix_quick_notes_user_created",
+        "quick_notes",
+        ["user_id", "created_at", "id"],
+    )
+    op.create_index(
+        "ix_weekly_summaries_user_start_date",
+        "weekly_summaries",
+        ["user_id", "start_date", "id"],
+    )
+    op.create_index("ix_users_created_at_id", "users", ["created_at", "id"])
+    # Done tab: most recently completed first. Other tabs order by computed ranks and
+    # stay on ix_backlog_tasks_user_status.
+    op.create_index(
+        "ix_backlog_tasks_user_done_order",
+        "backlog_tasks",
+        [
+            "user_id",
+            sa.text("coalesce(completed_at, updated_at)"),
+            "created_at",
+            "id",
+        ],
+        postgresql_where=sa.text("status = 'done'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_backlog_tasks_user_done_order", table_name="backlog_tasks")
+    op.drop_index("ix_users_created_at_id", table_name="users")
+    op.drop_index("ix_weekly_summaries_user_start_date", table_name="weekly_summaries")
+    op.drop_index("ix_quick_notes_user_created", table_name="quick_notes")
+    op.create_index("ix_quick_notes_user_created", "quick_notes", ["user_id", "created_at"])
@@ -0,0 +1,48 @@
+"""pg_trgm GIN indexes for keyword search
+
+Substring (ILIKE '%q%') and word-similarity (q <% text) matches on these columns
+are served by trigram indexes instead of scanning every row: the unified search,
+the backlog / quick note list filters and the admin user search.
+
+Revision ID: 20260615_search_trgm
+Revises: 20260614_keyset_indexes
+Create Date: 2026-06-15
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "20260615_search_trgm"
+down_revision: Union[str, None] = "20260614_keyset_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRGM_INDEXES = (
+    ("ix_backlog_tasks_title_trgm", "backlog_tasks", "title"),
+    ("ix_backlog_tasks_description_trgm", "backlog_tasks", "description"),
+    ("ix_quick_notes_content_trgm", "quick_notes", "content"),
+    ("ix_daily_progress_entries_title_trgm", "daily_progress_entries", "title"),
+    ("ix_daily_summaries_content_trgm", "daily_summaries", "content"),
+    ("ix_users_username_trgm", "users", "username"),
+    ("ix_users_email_trgm", "users", "email"),
+)
+
+
+def upgrade() -> None:
+    # Ships with PostgreSQL's contrib package; creating it needs CREATE on the database.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRGM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    # The extension is left installed; other database objects may rely on it.
+    for name, table, _column in reversed(TRGM_INDEXES):
+        op.drop_index(name, table_name=table)
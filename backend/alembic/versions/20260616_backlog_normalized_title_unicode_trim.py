@@ -0,0 +1,52 @@
+"""backlog_tasks.normalized_title trims Unicode whitespace like Python's str.strip()
+
+btrim(title) only trims ASCII spaces, so titles padded with tabs, newlines or the
+full-width space U+3000 no longer matched the Python-normalized duplicate key. A
+generated column's expression cannot be altered, so the column and its index are
+recreated.
+
+Revision ID: 20260616_norm_title_trim
+Revises: 20260615_search_trgm
+Create Date: 2026-06-16
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260616_norm_title_trim"
+down_revision: Union[str, None] = "20260615_search_trgm"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_backlog_tasks_user_normalized_title_created"
+# Characters str.strip() removes, as regex escapes
+WHITESPACE = (
+    "\\u0009-\\u000d\\u001c-\\u0020\\u0085\\u00a0\\u1680\\u2000-\\u200a"
+    "\\u2028\\u2029\\u202f\\u205f\\u3000"
+)
+UNICODE_TRIM = f"lower(regexp_replace(title, '^[{WHITESPACE}]+|[{WHITESPACE}]+$', '', 'g'))"
+ASCII_TRIM = "lower(btrim(title))"
+
+
+def _recreate_normalized_title(expression: str) -> None:
+    op.drop_index(INDEX_NAME, table_name="backlog_tasks")
+    op.drop_column("backlog_tasks", "normalized_title")
+    op.add_column(
+        "backlog_tasks",
+        sa.Column(
+            "normalized_title",
+            sa.String(length=200),
+            sa.Computed(expression, persisted=True),
+        ),
+    )
+    op.create_index(INDEX_NAME, "backlog_tasks", ["user_id", "normalized_title", "created_at"])
+
+
+def upgrade() -> None:
+    _recreate_normalized_title(UNICODE_TRIM)
+
+
+def downgrade() -> None:
+    _recreate_normalized_title(ASCII_TRIM)
@@ -13,6 +13,7 @@ from app.api.v1.endpoints import (
     admin_users,
     backlog_tasks,
     quick_notes,
+    search,
 )
 
 api_router = APIRouter()
@@ -28,6 +29,7 @@ api_router.include_router(monthly_plans.router, prefix="/monthly-plans", tags=["
 api_router.include_router(daily_progress.router, prefix="/daily-progress", tags=["daily-progress"])
 api_router.include_router(backlog_tasks.router, prefix="/backlog-tasks", tags=["backlog-tasks"])
 api_router.include_router(quick_notes.router, prefix="/quick-notes", tags=["quick-notes"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
 api_router.include_router(daily_summaries.router, prefix="/daily-summaries", tags=["daily-summaries"])
 api_router.include_router(weekly_summaries.router, prefix="/weekly-summaries", tags=["weekly-summaries"])
 api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
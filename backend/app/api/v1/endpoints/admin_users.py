@@ -53,10 +53,14 @@ def admin_list_users(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     q: str | None = None,
+    cursor: str | None = Query(None, description="next_cursor from the previous page; overrides page"),
+    include_total: bool = Query(True, description="Count all matching users"),
 ):
     svc = AdminUserService(db)
-    items, total = svc.list_users(page, page_size, q)
-    return AdminUserListResponse(items=items, total=total)
+    result = svc.list_users(page, page_size, q, cursor=cursor, include_total=include_total)
+    return AdminUserListResponse(
+        items=result.items, total=result.total, next_cursor=result.next_cursor
+    )
 
 
 @router.delete("/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
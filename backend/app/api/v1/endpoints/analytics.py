@@ -1,21 +1,53 @@
 """Analytics API endpoints."""
-from typing import Optional
+from typing import Optional, Tuple
 from datetime import date, datetime, timedelta
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
 
 from app.api.v1.deps import get_db, get_current_user
+from app.cache.analytics import analytics_cache
 from app.schemas.analytics import (
     DashboardStats,
     YearlyStats,
     MonthlyStats,
     CompletionRateTrend,
     HeatmapData,
+    AnalyticsBundle,
+    AnalyticsInsights,
 )
 from app.services.analytics_service import AnalyticsService
 
 router = APIRouter()
 
+BUNDLE_VIEWS = ("dashboard", "yearly", "monthly", "heatmap", "trend")
+TREND_PERIODS = ("daily", "weekly", "monthly")
+MAX_INSIGHTS_DAYS = 366 * 20
+
+
+def _parse_date_range(
+    start_date: Optional[str], end_date: Optional[str], days: Optional[int]
+) -> Tuple[date, date]:
+    """Parse YYYY-MM-DD query dates, defaulting to the last ``days`` days."""
+    if start_date:
+        try:
+            start = datetime.strptime(start_date, "%Y-%m-%d").date()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid start_date format. Use YYYY-MM-DD")
+    else:
+        start = date.today() - timedelta(days=days)
+
+    if end_date:
+        try:
+            end = datetime.strptime(end_date, "%Y-%m-%d").date()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid end_date format. Use YYYY-MM-DD")
+    else:
+        end = date.today()
+
+    if start > end:
+        raise HTTPException(status_code=400, detail="start_date must be before end_date")
+    return start, end
+
 
 @router.get("/dashboard", response_model=DashboardStats)
 def get_dashboard_stats(
@@ -33,7 +65,13 @@ def get_dashboard_stats(
     - Total tasks and completion rate
     """
     service = AnalyticsService(db)
-    return service.get_dashboard_stats(user_id=str(current_user.id))
+    user_id = str(current_user.id)
+    return analytics_cache.get_or_compute(
+        user_id,
+        f"dashboard:{date.today().isoformat()}",
+        DashboardStats,
+        lambda: service.get_dashboard_stats(user_id=user_id),
+    )
 
 
 @router.get("/yearly/{year}", response_model=YearlyStats)
@@ -52,7 +90,13 @@ def get_yearly_stats(
     - Task completion statistics
     """
     service = AnalyticsService(db)
-    return service.get_yearly_stats(user_id=str(current_user.id), year=year)
+    user_id = str(current_user.id)
+    return analytics_cache.get_or_compute(
+        user_id,
+        f"yearly:{year}",
+        YearlyStats,
+        lambda: service.get_yearly_stats(user_id=user_id, year=year),
+    )
 
 
 @router.get("/monthly/{year}/{month}", response_model=MonthlyStats)
@@ -76,7 +120,13 @@ def get_monthly_stats(
         raise HTTPException(status_code=400, detail="Month must be between 1 and 12")
 
     service = AnalyticsService(db)
-    return service.get_monthly_stats(user_id=str(current_user.id), year=year, month=month)
+    user_id = str(current_user.id)
+    return analytics_cache.get_or_compute(
+        user_id,
+        f"monthly:{year}-{month:02d}",
+        MonthlyStats,
+        lambda: service.get_monthly_stats(user_id=user_id, year=year, month=month),
+    )
 
 
 @router.get("/completion-rate", response_model=CompletionRateTrend)
@@ -102,31 +152,13 @@ def get_completion_rate_trend(
     - Average completion rate
     - Trend direction (up, down, stable)
     """
-    if period not in ["daily", "weekly", "monthly"]:
+    if period not in TREND_PERIODS:
         raise HTTPException(
             status_code=400,
             detail="Period must be one of: daily, weekly, monthly"
         )
 
-    # Parse dates or use defaults
-    if start_date:
-        try:
-            start = datetime.strptime(start_date, "%Y-%m-%d").date()
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid start_date format. Use YYYY-MM-DD")
-    else:
-        start = date.today() - timedelta(days=days)
-
-    if end_date:
-        try:
-            end = datetime.strptime(end_date, "%Y-%m-%d").date()
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid end_date format. Use YYYY-MM-DD")
-    else:
-        end = date.today()
-
-    if start > end:
-        raise HTTPException(status_code=400, detail="start_date must be before end_date")
+    start, end = _parse_date_range(start_date, end_date, days)
 
     service = AnalyticsService(db)
     return service.get_completion_rate_trend(
@@ -158,25 +190,7 @@ def get_heatmap_data(
     - Activity levels (none, low, medium, high)
     - Task counts per day
     """
-    # Parse dates or use defaults
-    if start_date:
-        try:
-            start = datetime.strptime(start_date, "%Y-%m-%d").date()
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid start_date format. Use YYYY-MM-DD")
-    else:
-        start = date.today() - timedelta(days=days)
-
-    if end_date:
-        try:
-            end = datetime.strptime(end_date, "%Y-%m-%d").date()
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid end_date format. Use YYYY-MM-DD")
-    else:
-        end = date.today()
-
-    if start > end:
-        raise HTTPException(status_code=400, detail="start_date must be before end_date")
+    start, end = _parse_date_range(start_date, end_date, days)
 
     service = AnalyticsService(db)
     return service.get_heatmap_data(
@@ -184,3 +198,107 @@ def get_heatmap_data(
         start_date=start,
         end_date=end,
     )
+
+
+@router.get("/insights", response_model=AnalyticsInsights)
+def get_analytics_insights(
+    start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+    days: Optional[int] = Query(365, description="Number of days to include (used if start/end not provided)"),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """
+    Get long-range completion insights.
+
+    Returns:
+    - Overall completion rate and active days
+    - Rolling 7- and 30-day completion rates per day
+    - Longest and current streaks of days with completed tasks
+    - Weekday profile and linear trend of the daily completion rate
+    """
+    start, end = _parse_date_range(start_date, end_date, days)
+    if (end - start).days + 1 > MAX_INSIGHTS_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Date range must not exceed {MAX_INSIGHTS_DAYS} days"
+        )
+
+    service = AnalyticsService(db)
+    user_id = str(current_user.id)
+    return analytics_cache.get_or_compute(
+        user_id,
+        f"insights:{start.isoformat()}:{end.isoformat()}",
+        AnalyticsInsights,
+        lambda: service.get_insights(user_id, start, end),
+    )
+
+
+@router.get("/bundle", response_model=AnalyticsBundle)
+def get_analytics_bundle(
+    views: str = Query(
+        "dashboard,monthly,heatmap,trend",
+        description="Comma-separated views: dashboard, yearly, monthly, heatmap, trend",
+    ),
+    start_date: Optional[str] = Query(None, description="Heatmap/trend start date (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="Heatmap/trend end date (YYYY-MM-DD)"),
+    days: Optional[int] = Query(90, description="Number of days to include (used if start/end not provided)"),
+    period: str = Query("daily", description="Trend period: daily, weekly, or monthly"),
+    year: Optional[int] = Query(None, description="Year for yearly/monthly views (default: current)"),
+    month: Optional[int] = Query(None, description="Month for the monthly view (default: current)"),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """
+    Get several analytics views in one request.
+
+    All requested views are computed from a single load of the user's daily
+    rollup, so the dashboard needs one round trip and one scan instead of one
+    per chart.
+
+    Returns:
+    - One field per requested view (same shape as the individual endpoints)
+    """
+    requested = list(dict.fromkeys(v.strip() for v in views.split(",") if v.strip()))
+    unknown = [v for v in requested if v not in BUNDLE_VIEWS]
+    if not requested or unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"views must be a comma-separated subset of: {', '.join(BUNDLE_VIEWS)}"
+        )
+    if period not in TREND_PERIODS:
+        raise HTTPException(
+            status_code=400,
+            detail="Period must be one of: daily, weekly, monthly"
+        )
+    if month is not None and (month < 1 or month > 12):
+        raise HTTPException(status_code=400, detail="Month must be between 1 and 12")
+
+    start, end = _parse_date_range(start_date, end_date, days)
+
+    service = AnalyticsService(db)
+    user_id = str(current_user.id)
+    cache_view = ":".join([
+        "bundle",
+        date.today().isoformat(),
+        ",".join(requested),
+        start.isoformat(),
+        end.isoformat(),
+        period,
+        str(year),
+        str(month),
+    ])
+    return analytics_cache.get_or_compute(
+        user_id,
+        cache_view,
+        AnalyticsBundle,
+        lambda: service.get_bundle(
+            user_id,
+            requested,
+            start,
+            end,
+            period=period,
+            year=year,
+            month=month,
+        ),
+    )
@@ -5,16 +5,23 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.api.v1.deps import get_db, get_current_user
+from app.db.pagination import InvalidCursorError
 from app.models.user import User
 from app.models.task_context import TaskContext
 from app.models.task_priority import TaskPriority
 from app.schemas.backlog_task import (
+    BacklogTaskBatchRequest,
+    BacklogTaskBatchResult,
+    BacklogTaskBulkDelete,
+    BacklogTaskBulkDeleteResult,
     BacklogTaskCreate,
     BacklogTaskUpdate,
     BacklogTaskResponse,
     BacklogTaskDetail,
     BacklogTaskList,
     BacklogTaskSchedule,
+    BacklogTaskScheduleRange,
+    BacklogTaskScheduleRangeResult,
 )
 from app.schemas.task_data_repair import (
     DataRepairPreview,
@@ -42,7 +49,9 @@ def list_backlog_tasks(
     date_from: Optional[date] = Query(None),
     date_to: Optional[date] = Query(None),
     limit: Optional[int] = Query(None, ge=1, le=100, description="Page size; omit to return all matches"),
-    offset: int = Query(0, ge=0, description="Number of rows to skip after sorting"),
+    offset: int = Query(0, ge=0, description="Number of rows to skip after sorting; ignored with cursor"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: bool = Query(True, description="Count all matching tasks"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -55,28 +64,32 @@ def list_backlog_tasks(
         raise HTTPException(status_code=422, detail="time_field must be created, scheduled, or completed")
 
     service = BacklogTaskService(db)
-    tasks, total = service.get_user_tasks(
-        str(current_user.id),
-        tab=tab,  # type: ignore[arg-type]
-        context=context,
-        priority=priority,
-        q=q,
-        time_field=time_field,  # type: ignore[arg-type]
-        date_from=date_from,
-        date_to=date_to,
-        limit=limit,
-        offset=offset,
-    )
+    try:
+        page = service.get_user_tasks(
+            str(current_user.id),
+            tab=tab,  # type: ignore[arg-type]
+            context=context,
+            priority=priority,
+            q=q,
+            time_field=time_field,  # type: ignore[arg-type]
+            date_from=date_from,
+            date_to=date_to,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    tasks = page.items
     repair_service = TaskDataRepairService(db)
     dup_counts = repair_service.compute_fuzzy_duplicate_counts(
         str(current_user.id), [str(t.id) for t in tasks]
     )
     return BacklogTaskList(
-        tasks=[
-            service.to_response(t, possible_duplicate_count=dup_counts.get(str(t.id), 0))
-            for t in tasks
-        ],
-        total=total,
+        tasks=service.to_responses(tasks, dup_counts=dup_counts),
+        total=page.total,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -118,6 +131,44 @@ def merge_backlog_tasks(
     return service.to_response(task, possible_duplicate_count=dup_counts.get(str(task.id), 0))
 
 
+@router.post("/batch", response_model=BacklogTaskBatchResult)
+def batch_backlog_tasks(
+    body: BacklogTaskBatchRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Apply create / update / complete / schedule operations in one transaction.
+
+    results[i] belongs to operations[i]; failed items carry an error and are skipped.
+    """
+    return BacklogTaskService(db).apply_batch(str(current_user.id), body.operations)
+
+
+@router.post("/schedule-range", response_model=BacklogTaskScheduleRangeResult)
+def schedule_backlog_tasks_range(
+    schedule_in: BacklogTaskScheduleRange,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Schedule tasks across a date range and/or onto given dates, in one transaction."""
+    return BacklogTaskService(db).schedule_range(str(current_user.id), schedule_in)
+
+
+@router.post("/bulk-delete", response_model=BacklogTaskBulkDeleteResult)
+def bulk_delete_backlog_tasks(
+    body: BacklogTaskBulkDelete,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Delete several backlog tasks, with their occurrences, in one transaction."""
+    deleted = BacklogTaskService(db).delete_tasks(body.task_ids, user_id=str(current_user.id))
+    found = set(deleted)
+    return BacklogTaskBulkDeleteResult(
+        deleted=deleted,
+        not_found=[task_id for task_id in dict.fromkeys(body.task_ids) if task_id not in found],
+    )
+
+
 @router.get("/{task_id}", response_model=BacklogTaskDetail)
 def get_backlog_task(
     task_id: str,
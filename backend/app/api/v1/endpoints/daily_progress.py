@@ -1,17 +1,20 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 from datetime import date
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app.api.v1.deps import get_db, get_current_user
+from app.db.pagination import InvalidCursorError
 from app.models.user import User
 from app.models.daily_progress import DailyProgressEntryStatus
 from app.models.task_context import TaskContext
 from app.schemas.daily_progress import (
+    MAX_DAY_PAGE_SIZE,
     DailyProgressDayCreate,
     DailyProgressDayUpdate,
     DailyProgressDayResponse,
     DailyProgressDayList,
+    DailyProgressDayCountList,
     DailyProgressDayByDateResponse,
     DailyProgressEntryCreate,
     DailyProgressEntryUpdate,
@@ -24,27 +27,61 @@ from app.services.backlog_task_service import BacklogTaskService
 router = APIRouter()
 
 
-@router.get("/", response_model=DailyProgressDayList)
+@router.get("/", response_model=Union[DailyProgressDayList, DailyProgressDayCountList])
 def get_daily_progress_days(
     start_date: date = Query(None, description="Filter by start date"),
     end_date: date = Query(None, description="Filter by end date"),
     context: Optional[TaskContext] = Query(None, description="Filter entries by context"),
+    limit: Optional[int] = Query(
+        None,
+        ge=1,
+        le=MAX_DAY_PAGE_SIZE,
+        description="Days per page; defaults to 31, or 366 for a closed date range",
+    ),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    compact: bool = Query(False, description="Only per-day counts, without entries"),
+    include_total: bool = Query(True, description="Count all matching days"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get all daily progress days for the current user."""
+    """Get the current user's daily progress days, newest first, one page at a time.
+
+    total counts every matching day (null with include_total=false); follow
+    next_cursor until it is null to get every day in the range.
+    """
     service = DailyProgressService(db)
-    days = service.get_user_days(
-        user_id=str(current_user.id),
-        start_date=start_date,
-        end_date=end_date,
-    )
-    day_responses = [service.to_day_response(day, context=context) for day in days]
+    list_page = service.get_day_count_page if compact else service.get_day_page
+    try:
+        page = list_page(
+            str(current_user.id),
+            start_date=start_date,
+            end_date=end_date,
+            context=context,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+    if compact:
+        return DailyProgressDayCountList(
+            daily_progress_days=page.items,
+            total=page.total,
+            next_cursor=page.next_cursor,
+        )
+
+    day_responses = service.to_day_responses(page.items, context=context)
+    total = page.total
     if context is not None:
-        day_responses = [day for day in day_responses if day.total_tasks > 0]
+        kept = [day for day in day_responses if day.total_tasks > 0]
+        if total is not None:
+            total -= len(day_responses) - len(kept)
+        day_responses = kept
     return DailyProgressDayList(
         daily_progress_days=day_responses,
-        total=len(day_responses),
+        total=total,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 from app.core.deps import get_current_user
 from app.api.v1.deps import get_db, require_quick_notes_upload_image
 from app.core.config import settings
+from app.db.pagination import InvalidCursorError
 from app.models.user import User
 from app.schemas.quick_note import (
     QuickNoteBatchDelete,
@@ -37,7 +38,9 @@ def list_quick_notes(
     date_from: date | None = Query(None, description="Filter notes created on or after this date"),
     date_to: date | None = Query(None, description="Filter notes created on or before this date"),
     limit: int = Query(100, ge=1, le=200),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, description="Ignored when cursor is given"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    include_total: bool = Query(True, description="Count all matching notes"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -45,17 +48,23 @@ def list_quick_notes(
         raise HTTPException(status_code=422, detail="date_from must be on or before date_to")
 
     service = QuickNoteService(db)
-    notes, total = service.list_notes(
-        current_user.id,
-        q=q,
-        date_from=date_from,
-        date_to=date_to,
-        limit=limit,
-        offset=offset,
-    )
+    try:
+        page = service.list_notes(
+            current_user.id,
+            q=q,
+            date_from=date_from,
+            date_to=date_to,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
     return QuickNoteList(
-        notes=[service.to_response(note) for note in notes],
-        total=total,
+        notes=[service.to_response(note) for note in page.items],
+        total=page.total,
+        next_cursor=page.next_cursor,
     )
 
 
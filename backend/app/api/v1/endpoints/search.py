@@ -0,0 +1,38 @@
+"""Keyword search across the current user's records."""
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.api.v1.deps import get_current_user, get_db
+from app.models.user import User
+from app.schemas.search import SEARCH_TYPES, SearchResponse
+from app.services.search_service import SearchService
+
+router = APIRouter()
+
+
+@router.get("/", response_model=SearchResponse)
+def search(
+    q: str = Query(..., min_length=1, max_length=100, description="Keywords; matched as a substring or fuzzily"),
+    types: str | None = Query(
+        None,
+        description="Comma-separated subset of: backlog_task, quick_note, daily_entry, daily_summary (default all)",
+    ),
+    limit: int = Query(20, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Best matches across backlog tasks, quick notes, daily entries and daily summaries,
+    ranked by relevance, each with a snippet and highlight offsets."""
+    requested = None
+    if types is not None:
+        requested = list(dict.fromkeys(t.strip() for t in types.split(",") if t.strip()))
+        unknown = [t for t in requested if t not in SEARCH_TYPES]
+        if not requested or unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"types must be a comma-separated subset of: {', '.join(SEARCH_TYPES)}",
+            )
+    if not q.strip():
+        raise HTTPException(status_code=422, detail="q must not be blank")
+
+    return SearchService(db).search(str(current_user.id), q, types=requested, limit=limit)
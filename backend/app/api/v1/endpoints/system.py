@@ -3,9 +3,10 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from app.api.v1.deps import get_db, require_system_status_permission
+from app.cache.analytics import analytics_cache
 from app.rate_limit.ban_admin import IpBanAdminService
 from app.schemas.ip_ban import BannedIpItem, BannedIpListResponse
-from app.schemas.system_status import SystemStatusResponse
+from app.schemas.system_status import AnalyticsCacheStats, SystemStatusResponse
 from app.services.system_status_service import SystemStatusService
 
 router = APIRouter()
@@ -19,6 +20,11 @@ def get_system_status(
     return SystemStatusService(db).run()
 
 
+@router.get("/analytics-cache", response_model=AnalyticsCacheStats)
+def get_analytics_cache_stats(_user=Depends(require_system_status_permission)):
+    return AnalyticsCacheStats(**analytics_cache.stats())
+
+
 @router.get("/ip-bans", response_model=BannedIpListResponse)
 async def list_ip_bans(_user=Depends(require_system_status_permission)):
     service = IpBanAdminService.from_settings()
@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.api.v1.deps import get_db, get_current_user
+from app.db.pagination import InvalidCursorError
 from app.schemas.weekly_summary import (
     WeeklySummaryResponse,
     WeeklySummaryList,
@@ -19,8 +20,10 @@ router = APIRouter()
 @router.get("/", response_model=WeeklySummaryList)
 def get_weekly_summaries(
     year: Optional[int] = Query(None, description="筛选年份"),
-    skip: int = Query(0, ge=0, description="跳过条数"),
+    skip: int = Query(0, ge=0, description="跳过条数（传入 cursor 时忽略）"),
     limit: int = Query(20, ge=1, le=100, description="返回条数"),
+    cursor: Optional[str] = Query(None, description="上一页返回的 next_cursor"),
+    include_total: bool = Query(True, description="是否统计总数"),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user),
 ):
@@ -31,26 +34,27 @@ def get_weekly_summaries(
     - year: 筛选指定年份（可选）
     - skip: 分页跳过条数
     - limit: 分页返回条数
+    - cursor: 游标翻页，深分页与第一页开销相同
+    - include_total: 为 false 时不统计总数（total 返回 null）
     """
     service = WeeklySummaryService(db)
 
-    # 一次性获取所有符合条件的周总结（用于分页和总数统计）
-    all_summaries = service.get_user_weekly_summaries(
-        user_id=str(current_user.id),
-        year=year,
-        skip=0,
-        limit=10000  # 获取足够多的记录用于计算总数
-    )
-
-    # 计算总数
-    total = len(all_summaries)
-
-    # 应用分页
-    summaries = all_summaries[skip:skip + limit]
+    try:
+        page = service.get_user_weekly_summaries(
+            user_id=str(current_user.id),
+            year=year,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=422, detail=str(e))
 
     return WeeklySummaryList(
-        summaries=summaries,
-        total=total
+        summaries=page.items,
+        total=page.total,
+        next_cursor=page.next_cursor,
     )
 
 
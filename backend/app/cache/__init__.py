@@ -0,0 +1,14 @@
+"""Response caching infrastructure (Redis with in-process fallback)."""
+
+from app.cache.analytics import AnalyticsCache, analytics_cache, build_analytics_cache, mark_analytics_dirty
+from app.cache.store import CacheUnavailableError, InMemoryCacheStore, RedisCacheStore
+
+__all__ = [
+    "AnalyticsCache",
+    "analytics_cache",
+    "build_analytics_cache",
+    "mark_analytics_dirty",
+    "CacheUnavailableError",
+    "InMemoryCacheStore",
+    "RedisCacheStore",
+]
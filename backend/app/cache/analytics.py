@@ -0,0 +1,270 @@
+"""Per-user analytics response cache with write-driven invalidation.
+
+Cached views are keyed by (user, generation, view). Every committed write to a user's
+goals, plans, daily progress or backlog bumps that user's generation, so older entries
+are never read again and simply expire.
+
+Generations must be shared by every worker process, so Redis is the store. While it
+is unreachable, views are computed on every request rather than cached per process:
+a worker-local generation would miss writes handled by the other workers. The
+memory-only store (ANALYTICS_CACHE_USE_REDIS=false) is for single-process setups.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Callable, Optional, Set, Type, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.cache.store import CacheStore, CacheUnavailableError, InMemoryCacheStore, RedisCacheStore
+from app.models.backlog_task import BacklogTask
+from app.models.daily_progress import DailyProgressDay, DailyProgressEntry
+from app.models.monthly_plan import MonthlyPlan, MonthlyTask
+from app.models.yearly_goal import YearlyGoal
+
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_DIRTY_USERS_KEY = "analytics_cache_dirty_users"
+
+
+class AnalyticsCache:
+    """Generation-keyed cache in front of AnalyticsService.
+
+    Uses the primary (Redis) store when available and bypasses caching (computes
+    every view) while it is unreachable. Generation bumps that could not reach Redis
+    are replayed once it is back, so entries cached before the outage are not served.
+    Without a primary, the process-local fallback store is the cache.
+    """
+
+    def __init__(
+        self,
+        primary: Optional[CacheStore],
+        fallback: CacheStore,
+        *,
+        ttl_seconds: int,
+        retry_seconds: int = 30,
+        enabled: bool = True,
+    ) -> None:
+        self.primary = primary
+        self.fallback = fallback
+        self.ttl_seconds = ttl_seconds
+        self.retry_seconds = retry_seconds
+        self.enabled = enabled
+        self._primary_down_until = 0.0
+        self._pending_bumps: Set[str] = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.invalidations = 0
+        self.bypassed = 0
+
+    # ----- store selection -----
+
+    def _primary_available(self) -> bool:
+        if self.primary is None:
+            return False
+        if self._primary_down_until > time.time():
+            return False
+        if self._pending_bumps:
+            with self._lock:
+                pending, self._pending_bumps = self._pending_bumps, set()
+            try:
+                for user_id in pending:
+                    self.primary.incr(self._generation_key(user_id))
+            except CacheUnavailableError:
+                with self._lock:
+                    self._pending_bumps |= pending
+                self._mark_primary_down()
+                return False
+        return True
+
+    def _mark_primary_down(self) -> None:
+        with self._lock:
+            self.errors += 1
+            self._primary_down_until = time.time() + self.retry_seconds
+        logger.warning(
+            "Analytics cache: Redis unavailable, computing analytics uncached for %ss",
+            self.retry_seconds,
+        )
+
+    @property
+    def backend(self) -> str:
+        if self.primary is None:
+            return "memory"
+        if self._primary_down_until > time.time():
+            return "uncached (redis unavailable)"
+        return "redis"
+
+    # ----- keys -----
+
+    @staticmethod
+    def _generation_key(user_id: str) -> str:
+        return f"gen:{user_id}"
+
+    @staticmethod
+    def _view_key(user_id: str, generation: str, view: str) -> str:
+        return f"view:{user_id}:{generation}:{view}"
+
+    # ----- public API -----
+
+    def get_or_compute(
+        self,
+        user_id: str,
+        view: str,
+        model_cls: Type[ModelT],
+        compute: Callable[[], ModelT],
+    ) -> ModelT:
+        """Return the cached view for the user's current generation, computing it on a miss."""
+        if not self.enabled:
+            return compute()
+
+        user_id = str(user_id)
+        if self.primary is None:
+            return self._get_or_compute(self.fallback, user_id, view, model_cls, compute)
+        if self._primary_available():
+            try:
+                return self._get_or_compute(self.primary, user_id, view, model_cls, compute)
+            except CacheUnavailableError:
+                self._mark_primary_down()
+        # A process-local cache would miss other workers' writes; do not cache at all
+        with self._lock:
+            self.bypassed += 1
+        return compute()
+
+    def _get_or_compute(
+        self,
+        store: CacheStore,
+        user_id: str,
+        view: str,
+        model_cls: Type[ModelT],
+        compute: Callable[[], ModelT],
+    ) -> ModelT:
+        # Read the generation before computing so a concurrent write can only make
+        # this entry unreachable, never stale.
+        generation = store.get(self._generation_key(user_id)) or "0"
+        key = self._view_key(user_id, generation, view)
+
+        cached = store.get(key)
+        if cached is not None:
+            with self._lock:
+                self.hits += 1
+            return model_cls.model_validate_json(cached)
+
+        with self._lock:
+            self.misses += 1
+        result = compute()
+        store.set(key, result.model_dump_json(), self.ttl_seconds)
+        return result
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Bump the user's generation in the store serving reads."""
+        user_id = str(user_id)
+        with self._lock:
+            self.invalidations += 1
+        if self.primary is None:
+            self.fallback.incr(self._generation_key(user_id))
+            return
+        if self._primary_available():
+            try:
+                self.primary.incr(self._generation_key(user_id))
+                return
+            except CacheUnavailableError:
+                self._mark_primary_down()
+        with self._lock:
+            self._pending_bumps.add(user_id)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend,
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups * 100, 2) if lookups else 0.0,
+            "errors": self.errors,
+            "invalidations": self.invalidations,
+            "bypassed": self.bypassed,
+            "pending_invalidations": len(self._pending_bumps),
+        }
+
+    def close(self) -> None:
+        if self.primary is not None:
+            self.primary.close()
+        self.fallback.close()
+
+
+def build_analytics_cache(*, use_redis: Optional[bool] = None) -> AnalyticsCache:
+    use_redis_backend = settings.ANALYTICS_CACHE_USE_REDIS if use_redis is None else use_redis
+    primary = None
+    if use_redis_backend:
+        primary = RedisCacheStore(
+            settings.ANALYTICS_CACHE_REDIS_URL,
+            key_prefix=settings.ANALYTICS_CACHE_REDIS_KEY_PREFIX,
+        )
+    return AnalyticsCache(
+        primary,
+        InMemoryCacheStore(),
+        ttl_seconds=settings.ANALYTICS_CACHE_TTL_SECONDS,
+        retry_seconds=settings.ANALYTICS_CACHE_REDIS_RETRY_SECONDS,
+        enabled=settings.ANALYTICS_CACHE_ENABLED,
+    )
+
+
+analytics_cache = build_analytics_cache()
+
+
+# ----- write-driven invalidation -----
+
+def mark_analytics_dirty(session: Session, user_id) -> None:
+    """Invalidate the user's cached analytics when the session's transaction commits.
+
+    ORM writes to the tracked models are picked up automatically; call this for
+    Core-level statements (bulk UPDATE/INSERT) that bypass the unit of work.
+    """
+    if user_id is not None:
+        session.info.setdefault(_DIRTY_USERS_KEY, set()).add(str(user_id))
+
+
+def _owner_user_id(session: Session, obj) -> Optional[str]:
+    if isinstance(obj, (YearlyGoal, MonthlyPlan, DailyProgressDay, BacklogTask)):
+        return obj.user_id
+    if isinstance(obj, MonthlyTask):
+        parent = obj.monthly_plan or session.get(MonthlyPlan, obj.monthly_plan_id)
+        return parent.user_id if parent is not None else None
+    if isinstance(obj, DailyProgressEntry):
+        parent = obj.daily_progress_day or session.get(
+            DailyProgressDay, obj.daily_progress_day_id
+        )
+        return parent.user_id if parent is not None else None
+    return None
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_dirty_users(session: Session, flush_context, instances) -> None:
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        user_id = _owner_user_id(session, obj)
+        if user_id is not None:
+            mark_analytics_dirty(session, user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_dirty_users(session: Session) -> None:
+    if session.in_nested_transaction():
+        # A released SAVEPOINT; the data is not visible to other sessions yet
+        return
+    dirty = session.info.pop(_DIRTY_USERS_KEY, None)
+    for user_id in dirty or ():
+        analytics_cache.invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_dirty_users(session: Session) -> None:
+    session.info.pop(_DIRTY_USERS_KEY, None)
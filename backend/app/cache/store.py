@@ -0,0 +1,112 @@
+"""Key/value storage backends for response caches."""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional, Protocol
+
+
+class CacheUnavailableError(Exception):
+    """The backing cache service could not be reached."""
+
+
+class CacheStore(Protocol):
+    def get(self, key: str) -> Optional[str]: ...
+
+    def set(self, key: str, value: str, ttl_seconds: int) -> None: ...
+
+    def incr(self, key: str) -> int: ...
+
+    def close(self) -> None: ...
+
+
+class InMemoryCacheStore:
+    """Process-local store for tests, local development and Redis outages."""
+
+    def __init__(self, max_entries: int = 10000) -> None:
+        self._values: dict[str, tuple[str, float]] = {}
+        # Counters never expire or get evicted (losing one would resurrect old entries)
+        self._counters: dict[str, int] = {}
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            if key in self._counters:
+                return str(self._counters[key])
+            item = self._values.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at <= now:
+                del self._values[key]
+                return None
+            return value
+
+    def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        now = time.time()
+        with self._lock:
+            if len(self._values) >= self._max_entries:
+                self._values = {k: v for k, v in self._values.items() if v[1] > now}
+                if len(self._values) >= self._max_entries:
+                    # Still full of live entries: drop the oldest half (dicts keep insertion order)
+                    keep = list(self._values.items())[self._max_entries // 2:]
+                    self._values = dict(keep)
+            self._values[key] = (value, now + ttl_seconds)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            count = self._counters.get(key, 0) + 1
+            self._counters[key] = count
+            return count
+
+    def close(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._counters.clear()
+
+
+class RedisCacheStore:
+    """Redis-backed store; connection problems are raised as CacheUnavailableError."""
+
+    def __init__(
+        self,
+        redis_url: str,
+        key_prefix: str = "fixlife:analytics",
+        socket_timeout: float = 0.5,
+    ) -> None:
+        import redis
+
+        self._errors = (redis.RedisError,)
+        self._redis = redis.from_url(
+            redis_url,
+            decode_responses=True,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_timeout,
+        )
+        self._prefix = key_prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}:{key}"
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            return self._redis.get(self._key(key))
+        except self._errors as e:
+            raise CacheUnavailableError(str(e)) from e
+
+    def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        try:
+            self._redis.set(self._key(key), value, ex=ttl_seconds)
+        except self._errors as e:
+            raise CacheUnavailableError(str(e)) from e
+
+    def incr(self, key: str) -> int:
+        try:
+            return int(self._redis.incr(self._key(key)))
+        except self._errors as e:
+            raise CacheUnavailableError(str(e)) from e
+
+    def close(self) -> None:
+        self._redis.close()
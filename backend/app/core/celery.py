@@ -8,7 +8,7 @@ celery_app = Celery(
     "fix_life",
     broker=settings.CELERY_BROKER_URL,
     backend=settings.CELERY_RESULT_BACKEND,
-    include=["app.tasks.weekly_summary_tasks"]
+    include=["app.tasks.weekly_summary_tasks", "app.tasks.backlog_maintenance_tasks"]
 )
 
 # Configure Celery
@@ -62,6 +62,14 @@ class Settings(BaseSettings):
     IP_RATE_LIMIT_REDIS_URL: str = ""
     IP_RATE_LIMIT_REDIS_KEY_PREFIX: str = "fixlife:ip_rl"
 
+    # Analytics response cache (per-user generation invalidation; in-process fallback)
+    ANALYTICS_CACHE_ENABLED: bool = True
+    ANALYTICS_CACHE_USE_REDIS: bool = True
+    ANALYTICS_CACHE_TTL_SECONDS: int = 600
+    ANALYTICS_CACHE_REDIS_URL: str = ""
+    ANALYTICS_CACHE_REDIS_KEY_PREFIX: str = "fixlife:analytics"
+    ANALYTICS_CACHE_REDIS_RETRY_SECONDS: int = 30
+
     # Celery
     CELERY_BROKER_URL: str = "redis://localhost:6379/0"
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/1"
@@ -96,6 +104,10 @@ class Settings(BaseSettings):
             self.IP_RATE_LIMIT_REDIS_URL = (
                 f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
             )
+        if not self.ANALYTICS_CACHE_REDIS_URL:
+            self.ANALYTICS_CACHE_REDIS_URL = (
+                f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
+            )
 
 
 settings = Settings()
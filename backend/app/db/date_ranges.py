@@ -0,0 +1,39 @@
+"""Sargable date-range helpers for query filters.
+
+Filtering with ``func.extract('year', col) == y`` hides the column behind a function,
+so PostgreSQL cannot use an index on it. These helpers turn year / month / day filters
+into half-open ranges (``col >= start AND col < end``) that use btree indexes.
+"""
+from datetime import date, timedelta
+from typing import Optional, Tuple
+
+from sqlalchemy import and_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def period_bounds(
+    year: int, month: Optional[int] = None, day: Optional[int] = None
+) -> Tuple[date, date]:
+    """Half-open [start, end) range covering a year, a month or a single day."""
+    if month is None:
+        return date(year, 1, 1), date(year + 1, 1, 1)
+    if day is not None:
+        start = date(year, month, day)
+        return start, start + timedelta(days=1)
+    start = date(year, month, 1)
+    if month == 12:
+        return start, date(year + 1, 1, 1)
+    return start, date(year, month + 1, 1)
+
+
+def date_in_period(
+    column, year: int, month: Optional[int] = None, day: Optional[int] = None
+) -> ColumnElement:
+    """``column`` falls within the given year / month / day (index-friendly)."""
+    start, end = period_bounds(year, month, day)
+    return date_in_range(column, start, end)
+
+
+def date_in_range(column, start: date, end: date) -> ColumnElement:
+    """``start <= column < end``."""
+    return and_(column >= start, column < end)
@@ -0,0 +1,172 @@
+"""Keyset (cursor) pagination for list queries.
+
+OFFSET pagination makes PostgreSQL produce and discard every skipped row, so page N
+costs N pages. A keyset page instead filters on the sort-key tuple of the last row
+already returned (``(created_at, id) > (:created_at, :id)``), which an index on the
+sort keys serves directly: every page costs the same as the first.
+
+The cursor handed to clients is opaque: URL-safe base64 of the last row's sort-key
+values. It carries no filters, so clients send the same filters with each page.
+"""
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Generic, List, Optional, Sequence, Tuple, TypeVar
+from uuid import UUID
+
+from sqlalchemy import and_, false, literal, or_, tuple_
+from sqlalchemy.orm import Query
+from sqlalchemy.sql.elements import ColumnElement
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(ValueError):
+    """The cursor is malformed or was issued for a list with different sort keys."""
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """One ORDER BY term of a keyset-paginated list.
+
+    ``nullable`` keys are compared with PostgreSQL's default NULL placement (last when
+    ascending, first when descending); leave it off for NOT NULL columns so the
+    comparison stays a plain row-value range an index can serve.
+    """
+
+    expression: Any
+    descending: bool = False
+    nullable: bool = False
+
+    def ordering(self):
+        return self.expression.desc() if self.descending else self.expression.asc()
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of a list: ``next_cursor`` is None on the last page, ``total`` when requested."""
+
+    items: List[T] = field(default_factory=list)
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"u": str(value)}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    raise TypeError(f"Unsupported sort key value: {value!r}")
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and len(value) == 1:
+        (tag, raw), = value.items()
+        if tag == "dt":
+            return datetime.fromisoformat(raw)
+        if tag == "d":
+            return date.fromisoformat(raw)
+        if tag == "u":
+            return UUID(raw)
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    raise ValueError(value)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Opaque cursor for a row with the given sort-key values."""
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Sort-key values of ``cursor``; raises InvalidCursorError unless it holds ``size`` keys."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, ValueError):
+        raise InvalidCursorError("Invalid cursor") from None
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError("Invalid cursor")
+    try:
+        return [_decode_value(value) for value in values]
+    except (TypeError, ValueError):
+        raise InvalidCursorError("Invalid cursor") from None
+
+
+def _bound(key: SortKey, value: Any) -> ColumnElement:
+    return literal(value, key.expression.type)
+
+
+def _equal(key: SortKey, value: Any) -> ColumnElement:
+    if value is None:
+        return key.expression.is_(None)
+    return key.expression == _bound(key, value)
+
+
+def _after(key: SortKey, value: Any) -> ColumnElement:
+    """Rows that sort strictly after ``value`` on this key alone."""
+    column = key.expression
+    if value is None:
+        return column.isnot(None) if key.descending else false()
+    if key.descending:
+        return column < _bound(key, value)
+    if key.nullable:
+        return or_(column > _bound(key, value), column.is_(None))
+    return column > _bound(key, value)
+
+
+def keyset_after(keys: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement:
+    """Rows that sort strictly after the row with sort-key ``values``."""
+    uniform = len({key.descending for key in keys}) == 1
+    if uniform and not any(key.nullable for key in keys):
+        columns = tuple_(*(key.expression for key in keys))
+        bound = tuple_(*(_bound(key, value) for key, value in zip(keys, values)))
+        return columns < bound if keys[0].descending else columns > bound
+
+    # Mixed directions or NULLs: (k1 after v1) OR (k1 = v1 AND k2 after v2) OR ...
+    return or_(
+        *(
+            and_(
+                *(_equal(prior, value) for prior, value in zip(keys[:position], values)),
+                _after(key, values[position]),
+            )
+            for position, key in enumerate(keys)
+        )
+    )
+
+
+def keyset_page(
+    query: Query,
+    keys: Sequence[SortKey],
+    *,
+    limit: Optional[int],
+    cursor: Optional[str] = None,
+    offset: int = 0,
+) -> Tuple[list, Optional[str]]:
+    """Order ``query`` by ``keys`` and return (rows, next cursor) for one page.
+
+    With a cursor the page starts after the row it encodes; otherwise ``offset`` rows
+    are skipped (kept for clients that still page by offset). ``limit=None`` returns
+    every remaining row. The last key must be unique (normally the primary key).
+    """
+    query = query.order_by(*(key.ordering() for key in keys))
+    if cursor:
+        query = query.filter(keyset_after(keys, decode_cursor(cursor, len(keys))))
+    elif offset:
+        query = query.offset(offset)
+    if limit is None:
+        return query.all(), None
+
+    # Fetch one extra row to learn whether another page exists
+    rows = query.add_columns(*(key.expression for key in keys)).limit(limit + 1).all()
+    items = [row[0] for row in rows[:limit]]
+    if len(rows) <= limit:
+        return items, None
+    return items, encode_cursor(rows[limit - 1][1:])
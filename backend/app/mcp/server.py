@@ -10,6 +10,7 @@ from app.mcp.auth import FixLifeApiKeyVerifier
 from app.mcp.prompts.github_issue_todo import register_github_issue_prompts
 from app.mcp.tools.daily_progress import handle_daily_progress
 from app.mcp.tools.reflect import handle_reflect
+from app.mcp.tools.search import handle_search
 # from app.mcp.tools.account import handle_account
 # from app.mcp.tools.admin import admin_tool_visible, handle_admin
 # from app.mcp.tools.plan import handle_plan
@@ -40,6 +41,7 @@ def create_mcp_server() -> FastMCP:
             "dates use `progress_date`. "
             "Use `reflect` daily_summary actions (get_daily_summary, create_daily_summary, etc.) "
             "for reflection text — not daily_progress. "
+            "Use `search` to find records by keyword before listing page by page. "
             "GitHub issue skill: when create title or description is a github.com/.../issues/N URL, "
             "the server fetches the issue title, stores the URL as description, and sets context=work."
         ),
@@ -48,7 +50,7 @@ def create_mcp_server() -> FastMCP:
 
     @mcp.tool(
         description=(
-            "Manage backlog todos: list, get, create, update, delete, complete, schedule, revert. "
+            "Manage backlog todos: list, get, create, update, delete, complete, schedule, schedule_range, revert, batch. "
             "Payload: { action, ...params }. For create/update, pass fields at top level or under data. "
             "context (category): work | learning | life — maps to 工作/学习/生活; default learning if omitted. "
             "Use context=work for job/project tasks, context=life for chores/errands, context=learning for study/skills. "
@@ -59,8 +61,17 @@ def create_mcp_server() -> FastMCP:
             "server sets title from GitHub, description to the URL only, context=work. "
             "Prefer prompt create_todo_from_github_issue when the user asks to create a todo from a GitHub issue. "
             "list filters: tab (pending|in_progress|done), context, priority, q, time_field, date_from, date_to, limit, offset. "
+            "list pages with cursor: pass the previous next_cursor (null on the last page) instead of offset; "
+            "include_total=false skips counting. "
             "delete/get/update/complete require task_id: copy tasks[].id from a fresh list response exactly; never guess UUIDs. "
-            "delete also accepts title when exactly one task matches. After delete, call list again to verify."
+            "delete also accepts title when exactly one task matches, or task_ids (list, up to 200) to delete "
+            "several at once; it then returns deleted and not_found ids. After delete, call list again to verify. "
+            "batch: { operations: [...] } applies many changes in one transaction, each operation one of "
+            "{op: create, data}, {op: update, task_id, data}, {op: complete, task_id}, {op: schedule, task_id, plan_date}; "
+            "results[i] (ok, task, error) answers operations[i]. Prefer batch over repeated calls when changing several todos. "
+            "schedule_range lays out a plan in one call: task_ids with start_date (and end_date, up to 31 days) puts "
+            "every task on each date; assignments: [{task_id, plan_date}] places tasks on specific dates; both can be "
+            "combined (max 500 occurrences). Returns scheduled, tasks, not_found and completed (skipped) ids."
         ),
     )
     def todo(payload: dict[str, Any]) -> dict[str, Any]:
@@ -74,6 +85,10 @@ def create_mcp_server() -> FastMCP:
             "context filter: work | learning | life | all. "
             "IDs: daily_progress_day_id (day container), entry_id (same-day occurrence). "
             "Dates: progress_date (single day), start_date/end_date (range). "
+            "list_by_range returns newest days first, 31 by default (366 for a closed range); "
+            "pass limit, cursor (previous next_cursor) to load older days, "
+            "compact=true for per-day counts without entries. "
+            "total counts all matching days; include_total=false skips counting (total null). "
             "Actions: get_by_date, list_by_range, get, ensure_day, update, delete, "
             "list_entries, link_entry, update_entry, set_entry_status, unlink_entry. "
             "Responses use daily_progress_day / daily_progress_days / daily_progress_entries "
@@ -87,12 +102,26 @@ def create_mcp_server() -> FastMCP:
         description=(
             "Manage daily and weekly summaries, including generation and notifications. "
             "Daily reflection actions: get_daily_summary, create_daily_summary, "
-            "update_daily_summary, delete_daily_summary (require daily_progress_day_id on get/create)."
+            "update_daily_summary, delete_daily_summary (require daily_progress_day_id on get/create). "
+            "list_weekly: year, limit, skip or cursor (previous next_cursor), include_total."
         ),
     )
     def reflect(payload: dict[str, Any]) -> dict[str, Any]:
         return _run_tool(handle_reflect, payload)
 
+    @mcp.tool(
+        description=(
+            "Search the user's todos, quick notes, daily progress entries and daily summaries by keyword. "
+            "Payload: { action: search, q, types?, limit? }. "
+            "types: subset of backlog_task | quick_note | daily_entry | daily_summary (default all); limit 1-50 (default 20). "
+            "Matches substrings (works for Chinese) and near spellings; results are ranked by relevance and carry "
+            "type, id, title, snippet, highlights ([start, end) offsets in snippet), occurred_on and daily_progress_day_id. "
+            "Use a backlog_task result's id as task_id for `todo`."
+        ),
+    )
+    def search(payload: dict[str, Any]) -> dict[str, Any]:
+        return _run_tool(handle_search, payload)
+
     # Disabled temporarily: plan / account / admin
     # @mcp.tool(
     #     description="Manage yearly goals and monthly plans.",
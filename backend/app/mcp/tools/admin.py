@@ -78,8 +78,18 @@ def handle_admin(payload: dict[str, Any]) -> dict[str, Any]:
         if action == "list_users":
             page = int(payload.get("page", 1))
             page_size = int(payload.get("page_size", 20))
-            items, total = admin_service.list_users(page, page_size, payload.get("q"))
-            return {"items": dump(items), "total": total}
+            result = admin_service.list_users(
+                page,
+                page_size,
+                payload.get("q"),
+                cursor=payload.get("cursor"),
+                include_total=bool(payload.get("include_total", True)),
+            )
+            return {
+                "items": dump(result.items),
+                "total": result.total,
+                "next_cursor": result.next_cursor,
+            }
 
         if action == "create_user":
             body = AdminUserCreate.model_validate(payload.get("data") or payload)
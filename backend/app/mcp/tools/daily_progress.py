@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import date
 from typing import Any
 
+from app.db.pagination import InvalidCursorError, Page
 from app.mcp.helpers import db_session, dump, get_user_id, tool_error
 from app.models.daily_progress import DailyProgressEntryStatus
 from app.models.task_context import TaskContext
@@ -37,16 +38,27 @@ def list_day_responses(
     start_date: date | None,
     end_date: date | None,
     context: TaskContext | None,
-) -> list[Any]:
-    days = service.get_user_days(
+    limit: int | None = None,
+    cursor: str | None = None,
+    include_total: bool = True,
+) -> Page[Any]:
+    page = service.get_day_page(
         user_id,
         start_date=start_date,
         end_date=end_date,
+        context=context,
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
     )
-    day_responses = [service.to_day_response(day, context=context) for day in days]
+    day_responses = service.to_day_responses(page.items, context=context)
+    total = page.total
     if context is not None:
-        day_responses = [day for day in day_responses if day.total_tasks > 0]
-    return day_responses
+        kept = [day for day in day_responses if day.total_tasks > 0]
+        if total is not None:
+            total -= len(day_responses) - len(kept)
+        day_responses = kept
+    return Page(items=day_responses, total=total, next_cursor=page.next_cursor)
 
 
 def dump_daily_progress(value: Any) -> Any:
@@ -127,16 +139,39 @@ def handle_daily_progress(payload: dict[str, Any]) -> dict[str, Any]:
             }
 
         if action == "list_by_range":
-            day_responses = list_day_responses(
-                service,
-                user_id,
-                start_date=_parse_date(payload.get("start_date")),
-                end_date=_parse_date(payload.get("end_date")),
-                context=context,
-            )
+            start_date = _parse_date(payload.get("start_date"))
+            end_date = _parse_date(payload.get("end_date"))
+            limit = payload.get("limit")
+            limit = max(int(limit), 1) if limit is not None else None
+            include_total = bool(payload.get("include_total", True))
+            try:
+                if payload.get("compact"):
+                    page = service.get_day_count_page(
+                        user_id,
+                        start_date=start_date,
+                        end_date=end_date,
+                        context=context,
+                        limit=limit,
+                        cursor=payload.get("cursor"),
+                        include_total=include_total,
+                    )
+                else:
+                    page = list_day_responses(
+                        service,
+                        user_id,
+                        start_date=start_date,
+                        end_date=end_date,
+                        context=context,
+                        limit=limit,
+                        cursor=payload.get("cursor"),
+                        include_total=include_total,
+                    )
+            except InvalidCursorError as exc:
+                tool_error(422, "VALIDATION_ERROR", str(exc))
             return {
-                "daily_progress_days": dump_daily_progress(day_responses),
-                "total": len(day_responses),
+                "daily_progress_days": dump_daily_progress(page.items),
+                "total": page.total,
+                "next_cursor": page.next_cursor,
             }
 
         if action == "ensure_day":
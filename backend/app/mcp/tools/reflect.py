@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from app.db.pagination import InvalidCursorError
 from app.mcp.helpers import db_session, dump, get_user_id, tool_error
 from app.models.daily_progress import DailySummary, DailyProgressDay
 from app.schemas.daily_summary import DailySummaryCreate, DailySummaryUpdate
@@ -103,10 +104,22 @@ def handle_reflect(payload: dict[str, Any]) -> dict[str, Any]:
             year = payload.get("year")
             skip = int(payload.get("skip", 0))
             limit = int(payload.get("limit", 20))
-            summaries = service.get_user_weekly_summaries(
-                user_id=user_id, year=year, skip=skip, limit=limit
-            )
-            return {"summaries": dump(summaries), "total": len(summaries)}
+            try:
+                page = service.get_user_weekly_summaries(
+                    user_id=user_id,
+                    year=year,
+                    skip=skip,
+                    limit=limit,
+                    cursor=payload.get("cursor"),
+                    include_total=bool(payload.get("include_total", True)),
+                )
+            except InvalidCursorError as exc:
+                tool_error(422, "VALIDATION_ERROR", str(exc))
+            return {
+                "summaries": dump(page.items),
+                "total": page.total,
+                "next_cursor": page.next_cursor,
+            }
 
         if action == "get_weekly":
             summary_id = payload.get("summary_id")
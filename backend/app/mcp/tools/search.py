@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import Any
+
+from app.mcp.helpers import db_session, dump, get_user_id, tool_error
+from app.schemas.search import SEARCH_TYPES
+from app.services.search_service import SearchService
+
+MAX_SEARCH_LIMIT = 50
+
+
+def handle_search(payload: dict[str, Any]) -> dict[str, Any]:
+    action = payload.get("action", "search")
+    if action != "search":
+        tool_error(422, "VALIDATION_ERROR", f"Unknown search action: {action}")
+
+    q = str(payload.get("q") or "").strip()
+    if not q:
+        tool_error(422, "VALIDATION_ERROR", "q is required")
+
+    types = payload.get("types")
+    if isinstance(types, str):
+        types = [t.strip() for t in types.split(",") if t.strip()]
+    if types is not None:
+        unknown = [t for t in types if t not in SEARCH_TYPES]
+        if not types or unknown:
+            tool_error(
+                422,
+                "VALIDATION_ERROR",
+                f"types must be a subset of: {', '.join(SEARCH_TYPES)}",
+            )
+
+    limit = min(max(int(payload.get("limit", 20)), 1), MAX_SEARCH_LIMIT)
+    user_id = get_user_id()
+    with db_session() as db:
+        return dump(SearchService(db).search(user_id, q, types=types, limit=limit))
@@ -3,10 +3,19 @@ from __future__ import annotations
 from datetime import date
 from typing import Any
 
+from app.db.pagination import InvalidCursorError
 from app.mcp.helpers import db_session, dump, get_user_id, tool_error
 from app.mcp.skills.github_issue_todo import enrich_todo_from_github_issue
 from app.models.backlog_task import BacklogTask
-from app.schemas.backlog_task import BacklogTaskCreate, BacklogTaskSchedule, BacklogTaskUpdate
+from app.schemas.backlog_task import (
+    BacklogTaskBatchRequest,
+    BacklogTaskBulkDelete,
+    BacklogTaskBulkDeleteResult,
+    BacklogTaskCreate,
+    BacklogTaskSchedule,
+    BacklogTaskScheduleRange,
+    BacklogTaskUpdate,
+)
 from app.services.backlog_task_service import BacklogTaskService
 from app.services.task_data_repair_service import TaskDataRepairService
 
@@ -23,26 +32,33 @@ def handle_todo(payload: dict[str, Any]) -> dict[str, Any]:
 
         if action == "list":
             tab = payload.get("tab", "pending")
-            tasks, total = service.get_user_tasks(
-                user_id,
-                tab=tab,
-                context=payload.get("context"),
-                priority=payload.get("priority"),
-                q=payload.get("q"),
-                time_field=payload.get("time_field"),
-                date_from=_parse_date(payload.get("date_from")),
-                date_to=_parse_date(payload.get("date_to")),
-                limit=payload.get("limit"),
-                offset=int(payload.get("offset", 0)),
-            )
+            try:
+                page = service.get_user_tasks(
+                    user_id,
+                    tab=tab,
+                    context=payload.get("context"),
+                    priority=payload.get("priority"),
+                    q=payload.get("q"),
+                    time_field=payload.get("time_field"),
+                    date_from=_parse_date(payload.get("date_from")),
+                    date_to=_parse_date(payload.get("date_to")),
+                    limit=payload.get("limit"),
+                    offset=int(payload.get("offset", 0)),
+                    cursor=payload.get("cursor"),
+                    include_total=bool(payload.get("include_total", True)),
+                )
+            except InvalidCursorError as exc:
+                tool_error(422, "VALIDATION_ERROR", str(exc))
+            tasks = page.items
             repair = TaskDataRepairService(db)
             dup_counts = repair.compute_fuzzy_duplicate_counts(user_id, [str(t.id) for t in tasks])
             return {
                 "tasks": [
-                    dump(service.to_response(t, possible_duplicate_count=dup_counts.get(str(t.id), 0)))
-                    for t in tasks
+                    dump(response)
+                    for response in service.to_responses(tasks, dup_counts=dup_counts)
                 ],
-                "total": total,
+                "total": page.total,
+                "next_cursor": page.next_cursor,
                 "note": "Use tasks[].id as task_id for get/update/delete/complete/schedule/revert.",
             }
 
@@ -72,6 +88,18 @@ def handle_todo(payload: dict[str, Any]) -> dict[str, Any]:
             return dump(service.to_response(updated))
 
         if action == "delete":
+            if payload.get("task_ids"):
+                body = BacklogTaskBulkDelete.model_validate({"task_ids": payload["task_ids"]})
+                deleted = service.delete_tasks(body.task_ids, user_id=user_id)
+                found = set(deleted)
+                return dump(
+                    BacklogTaskBulkDeleteResult(
+                        deleted=deleted,
+                        not_found=[
+                            task_id for task_id in dict.fromkeys(body.task_ids) if task_id not in found
+                        ],
+                    )
+                )
             task_id = _resolve_task_id(service, user_id, payload, action="delete")
             task = service.get_task(task_id)
             if not task or str(task.user_id) != user_id:
@@ -114,6 +142,29 @@ def handle_todo(payload: dict[str, Any]) -> dict[str, Any]:
                 tool_error(404, "NOT_FOUND", "Backlog task not found")
             return dump(service.to_response(reverted))
 
+        if action == "schedule_range":
+            body = BacklogTaskScheduleRange.model_validate(
+                {
+                    key: payload[key]
+                    for key in ("task_ids", "start_date", "end_date", "assignments")
+                    if payload.get(key) is not None
+                }
+            )
+            return dump(service.schedule_range(user_id, body))
+
+        if action == "batch":
+            operations = payload.get("operations")
+            if not operations:
+                tool_error(422, "VALIDATION_ERROR", "operations is required for batch")
+            operations = [
+                {**operation, "data": enrich_todo_from_github_issue(dict(operation.get("data") or {}))}
+                if isinstance(operation, dict) and operation.get("op") == "create"
+                else operation
+                for operation in operations
+            ]
+            body = BacklogTaskBatchRequest.model_validate({"operations": operations})
+            return dump(service.apply_batch(user_id, body.operations))
+
     tool_error(422, "VALIDATION_ERROR", f"Unknown todo action: {action}")
 
 
@@ -138,8 +189,8 @@ def _resolve_task_id(
 
     matches: list[BacklogTask] = []
     for tab in ("pending", "in_progress", "done"):
-        tasks, _ = service.get_user_tasks(user_id, tab=tab, q=title, limit=50)
-        matches.extend(task for task in tasks if task.title == title)
+        page = service.get_user_tasks(user_id, tab=tab, q=title, limit=50, include_total=False)
+        matches.extend(task for task in page.items if task.title == title)
 
     unique = {str(task.id): task for task in matches}
     if len(unique) == 1:
@@ -19,6 +19,7 @@ from app.models.daily_progress import (
     SummaryType,
 )
 from app.models.weekly_summary import WeeklySummary
+from app.models.user_daily_stats import UserDailyStats
 
 __all__ = [
     "User",
@@ -47,4 +48,5 @@ __all__ = [
     "DailySummary",
     "SummaryType",
     "WeeklySummary",
+    "UserDailyStats",
 ]
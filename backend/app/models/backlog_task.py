@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime, date
-from sqlalchemy import Column, String, Integer, Enum, ForeignKey, Text, DateTime, Date
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Computed, String, Integer, Enum, ForeignKey, Text, DateTime, Date, Index, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import relationship
 import uuid
 
@@ -9,6 +9,17 @@ from app.db.base import Base
 from app.models.task_context import TaskContext
 from app.models.task_priority import TaskPriority
 
+# The characters str.strip() removes (all Unicode whitespace, e.g. tabs and the
+# full-width space U+3000), as regex escapes; btrim() would only trim ASCII spaces
+_TITLE_WHITESPACE = (
+    "\\u0009-\\u000d\\u001c-\\u0020\\u0085\\u00a0\\u1680\\u2000-\\u200a"
+    "\\u2028\\u2029\\u202f\\u205f\\u3000"
+)
+# Same key as task_data_repair_service._normalize_title: title.strip().lower()
+NORMALIZED_TITLE_SQL = (
+    f"lower(regexp_replace(title, '^[{_TITLE_WHITESPACE}]+|[{_TITLE_WHITESPACE}]+$', '', 'g'))"
+)
+
 
 class BacklogTaskStatus(str, enum.Enum):
     PENDING = "pending"
@@ -20,10 +31,43 @@ class BacklogTaskStatus(str, enum.Enum):
 
 class BacklogTask(Base):
     __tablename__ = "backlog_tasks"
+    __table_args__ = (
+        Index("ix_backlog_tasks_user_status", "user_id", "status"),
+        Index(
+            "ix_backlog_tasks_user_normalized_title_created",
+            "user_id",
+            "normalized_title",
+            "created_at",
+        ),
+        # Done tab sort keys (keyset pagination)
+        Index(
+            "ix_backlog_tasks_user_done_order",
+            "user_id",
+            text("coalesce(completed_at, updated_at)"),
+            "created_at",
+            "id",
+            postgresql_where=text("status = 'done'"),
+        ),
+        # Keyword search (pg_trgm)
+        Index(
+            "ix_backlog_tasks_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_backlog_tasks_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     title = Column(String(200), nullable=False)
+    # Duplicate-detection key, maintained by PostgreSQL
+    normalized_title = Column(String(200), Computed(NORMALIZED_TITLE_SQL, persisted=True))
     description = Column(Text)
     context = Column(
         Enum(TaskContext, values_callable=lambda x: [e.value for e in x]),
@@ -47,6 +91,10 @@ class BacklogTask(Base):
     completed_at = Column(DateTime)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Summary of daily_links, maintained by BacklogLinkSummaryService
+    occurrence_count = Column(Integer, default=0, server_default="0", nullable=False)
+    last_plan_date = Column(Date)
+    linked_dates = Column(ARRAY(Date), default=list, server_default="{}", nullable=False)
 
     user = relationship("User", back_populates="backlog_tasks")
     daily_progress_entry = relationship("DailyProgressEntry", foreign_keys=[daily_task_id])
@@ -56,5 +104,9 @@ class BacklogTask(Base):
         cascade="all, delete-orphan",
     )
 
+    @property
+    def is_scheduled(self) -> bool:
+        return bool(self.occurrence_count)
+
     def __repr__(self):
         return f"<BacklogTask {self.title} - {self.status}>"
@@ -1,6 +1,6 @@
 import enum
 from datetime import datetime, date
-from sqlalchemy import Column, String, Integer, Date, Enum, ForeignKey, Text, DateTime
+from sqlalchemy import Column, String, Integer, Date, Enum, ForeignKey, Text, DateTime, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -32,6 +32,9 @@ class DailyProgressDay(Base):
     """One user's daily progress day container (每日进度)."""
 
     __tablename__ = "daily_progress_days"
+    __table_args__ = (
+        Index("ix_daily_progress_days_user_date", "user_id", "progress_date", unique=True),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -78,6 +81,21 @@ class DailyProgressDay(Base):
 
 class DailyProgressEntry(Base):
     __tablename__ = "daily_progress_entries"
+    __table_args__ = (
+        Index("ix_daily_progress_entries_day_status", "daily_progress_day_id", "status"),
+        Index(
+            "ix_daily_progress_entries_backlog_task_id",
+            "backlog_task_id",
+            postgresql_where=text("backlog_task_id IS NOT NULL"),
+        ),
+        # Keyword search (pg_trgm)
+        Index(
+            "ix_daily_progress_entries_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     daily_progress_day_id = Column(
@@ -126,6 +144,15 @@ class DailyProgressEntry(Base):
 
 class DailySummary(Base):
     __tablename__ = "daily_summaries"
+    __table_args__ = (
+        # Keyword search (pg_trgm)
+        Index(
+            "ix_daily_summaries_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     daily_progress_day_id = Column(
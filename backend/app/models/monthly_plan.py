@@ -1,6 +1,6 @@
 import enum
 from datetime import datetime, date
-from sqlalchemy import Column, String, Numeric, Integer, Date, Enum, ForeignKey, Text, DateTime
+from sqlalchemy import Column, String, Numeric, Integer, Date, Enum, ForeignKey, Text, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import relationship
 import uuid
@@ -64,6 +64,9 @@ class MonthlyPlan(Base):
 
 class MonthlyTask(Base):
     __tablename__ = "monthly_tasks"
+    __table_args__ = (
+        Index("ix_monthly_tasks_plan_status", "monthly_plan_id", "status"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     monthly_plan_id = Column(UUID(as_uuid=True), ForeignKey("monthly_plans.id", ondelete="CASCADE"), nullable=False)
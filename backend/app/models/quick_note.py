@@ -1,7 +1,7 @@
 from datetime import datetime
 import uuid
 
-from sqlalchemy import Column, DateTime, ForeignKey, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -10,6 +10,17 @@ from app.db.base import Base
 
 class QuickNote(Base):
     __tablename__ = "quick_notes"
+    __table_args__ = (
+        # List order (keyset pagination)
+        Index("ix_quick_notes_user_created", "user_id", "created_at", "id"),
+        # Keyword search (pg_trgm)
+        Index(
+            "ix_quick_notes_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -0,0 +1,45 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, Date, ForeignKey, DateTime
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.base import Base
+
+
+class UserDailyStats(Base):
+    """Per-user, per-day rollup of daily progress entries (analytics read model).
+
+    Rows exist only for days that have at least one entry and are kept in sync by
+    UserDailyStatsService whenever entries are created, updated or deleted.
+    """
+
+    __tablename__ = "user_daily_stats"
+
+    user_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    progress_date = Column(Date, primary_key=True)
+
+    # 状态计数（todo = total - done - in_progress - cancelled）
+    total = Column(Integer, nullable=False, default=0)
+    done = Column(Integer, nullable=False, default=0)
+    in_progress = Column(Integer, nullable=False, default=0)
+    cancelled = Column(Integer, nullable=False, default=0)
+
+    # 优先级计数
+    priority_high = Column(Integer, nullable=False, default=0)
+    priority_medium = Column(Integer, nullable=False, default=0)
+    priority_low = Column(Integer, nullable=False, default=0)
+
+    # 上下文计数
+    context_work = Column(Integer, nullable=False, default=0)
+    context_learning = Column(Integer, nullable=False, default=0)
+    context_life = Column(Integer, nullable=False, default=0)
+
+    # 时长汇总（分钟）
+    estimated_minutes = Column(Integer, nullable=False, default=0)
+    actual_minutes = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<UserDailyStats {self.user_id} {self.progress_date}: {self.done}/{self.total}>"
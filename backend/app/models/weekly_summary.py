@@ -1,5 +1,5 @@
 from datetime import datetime, date
-from sqlalchemy import Column, String, Integer, Date, ForeignKey, Text, DateTime, Float
+from sqlalchemy import Column, String, Integer, Date, ForeignKey, Text, DateTime, Float, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 import uuid
@@ -9,6 +9,10 @@ from app.db.base import Base
 
 class WeeklySummary(Base):
     __tablename__ = "weekly_summaries"
+    __table_args__ = (
+        # 列表排序（游标分页）
+        Index("ix_weekly_summaries_user_start_date", "user_id", "start_date", "id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
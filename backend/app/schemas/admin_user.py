@@ -27,7 +27,9 @@ class AdminUserListItem(BaseModel):
 
 class AdminUserListResponse(BaseModel):
     items: list[AdminUserListItem]
-    total: int
+    # None when the request set include_total=false
+    total: int | None = None
+    next_cursor: str | None = None
 
 
 class AdminUserCreate(BaseModel):
@@ -1,6 +1,6 @@
 """Analytics schemas for data statistics and analysis."""
 from datetime import date
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -68,6 +68,42 @@ class HeatmapData(BaseModel):
     data: List[dict] = Field(description="Array of {date, value, label} objects")
 
 
+class AnalyticsBundle(BaseModel):
+    """Several analytics views computed together from one load of the daily rollup."""
+    views: List[str] = Field(description="Requested views, in request order")
+    dashboard: Optional[DashboardStats] = None
+    yearly: Optional[YearlyStats] = None
+    monthly: Optional[MonthlyStats] = None
+    heatmap: Optional[HeatmapData] = None
+    trend: Optional[CompletionRateTrend] = None
+
+
+class WeekdayProfile(BaseModel):
+    """Task counts and completion rate for one weekday across the range."""
+    weekday: int = Field(description="0 = Monday ... 6 = Sunday")
+    total: int
+    completed: int
+    completion_rate: float
+
+
+class AnalyticsInsights(BaseModel):
+    """Long-range completion insights (rates, rolling averages, streaks, trend)."""
+    start_date: date
+    end_date: date
+    total_tasks: int
+    completed_tasks: int
+    completion_rate: float
+    active_days: int = Field(description="Days with at least one completed task")
+    longest_streak: int = Field(description="Longest run of consecutive active days")
+    current_streak: int = Field(description="Active-day run ending at end_date")
+    rolling_7d_rate: Optional[float] = Field(description="Completion rate over the last 7 days")
+    rolling_30d_rate: Optional[float] = Field(description="Completion rate over the last 30 days")
+    trend_slope: float = Field(description="Least-squares change of the daily rate, points per day")
+    trend: str = Field(description="up, down, stable")
+    weekday_profile: List[WeekdayProfile]
+    rolling_data: List[dict] = Field(description="Array of {date, rate_7d, rate_30d} objects")
+
+
 class AnalyticsResponse(BaseModel):
     """Generic analytics response wrapper."""
     success: bool = True
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field, field_validator, model_validator
-from datetime import date, datetime
-from typing import Optional, List
+from datetime import date, datetime, timedelta
+from typing import Annotated, Literal, Optional, List, Tuple, Union
 from uuid import UUID
 
 from app.models.backlog_task import BacklogTaskStatus
@@ -10,6 +10,10 @@ from app.models.task_priority import TaskPriority
 
 _FORM_PROGRESS = {0, 25, 50, 75, 100}
 
+MAX_BATCH_OPERATIONS = 200
+MAX_SCHEDULE_RANGE_DAYS = 31
+MAX_SCHEDULE_RANGE_OCCURRENCES = 500
+
 
 def progress_to_status(progress: int) -> BacklogTaskStatus:
     if progress == 0:
@@ -102,4 +106,125 @@ class BacklogTaskDetail(BacklogTaskResponse):
 
 class BacklogTaskList(BaseModel):
     tasks: List[BacklogTaskResponse]
-    total: int
+    # None when the request set include_total=false
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+class BacklogTaskBatchCreate(BaseModel):
+    op: Literal["create"]
+    data: BacklogTaskCreate
+
+
+class BacklogTaskBatchUpdate(BaseModel):
+    op: Literal["update"]
+    task_id: UUID
+    data: BacklogTaskUpdate
+
+
+class BacklogTaskBatchComplete(BaseModel):
+    op: Literal["complete"]
+    task_id: UUID
+
+
+class BacklogTaskBatchSchedule(BaseModel):
+    op: Literal["schedule"]
+    task_id: UUID
+    plan_date: date = Field(..., description="Date to schedule the task onto")
+
+
+BacklogTaskBatchOperation = Annotated[
+    Union[
+        BacklogTaskBatchCreate,
+        BacklogTaskBatchUpdate,
+        BacklogTaskBatchComplete,
+        BacklogTaskBatchSchedule,
+    ],
+    Field(discriminator="op"),
+]
+
+
+class BacklogTaskBatchRequest(BaseModel):
+    operations: List[BacklogTaskBatchOperation] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_OPERATIONS
+    )
+
+
+class BacklogTaskBatchItemResult(BaseModel):
+    index: int
+    op: str
+    ok: bool
+    task: Optional[BacklogTaskResponse] = None
+    error: Optional[str] = None
+
+
+class BacklogTaskBatchResult(BaseModel):
+    results: List[BacklogTaskBatchItemResult]
+    succeeded: int
+    failed: int
+
+
+class BacklogTaskBulkDelete(BaseModel):
+    task_ids: List[UUID] = Field(..., min_length=1, max_length=MAX_BATCH_OPERATIONS)
+
+
+class BacklogTaskBulkDeleteResult(BaseModel):
+    deleted: List[UUID]
+    not_found: List[UUID] = Field(
+        default_factory=list, description="Ids that do not exist or belong to another user"
+    )
+
+
+class BacklogTaskScheduleAssignment(BaseModel):
+    task_id: UUID
+    plan_date: date
+
+
+class BacklogTaskScheduleRange(BaseModel):
+    """Schedule every task_ids task on each date from start_date to end_date
+    (inclusive; end_date defaults to start_date), plus explicit assignments."""
+
+    task_ids: List[UUID] = Field(default_factory=list)
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    assignments: List[BacklogTaskScheduleAssignment] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def validate_range(self):
+        if bool(self.task_ids) != (self.start_date is not None):
+            raise ValueError("task_ids and start_date go together")
+        if self.end_date is not None and self.start_date is None:
+            raise ValueError("end_date requires start_date")
+        if not self.task_ids and not self.assignments:
+            raise ValueError("task_ids with a date range, or assignments, is required")
+        if self.start_date is not None:
+            days = (self.end_date or self.start_date) - self.start_date
+            if days.days < 0:
+                raise ValueError("end_date must not be before start_date")
+            if days.days >= MAX_SCHEDULE_RANGE_DAYS:
+                raise ValueError(f"date range must not exceed {MAX_SCHEDULE_RANGE_DAYS} days")
+        if len(self.occurrences()) > MAX_SCHEDULE_RANGE_OCCURRENCES:
+            raise ValueError(
+                f"at most {MAX_SCHEDULE_RANGE_OCCURRENCES} (task, date) occurrences per request"
+            )
+        return self
+
+    def occurrences(self) -> List[Tuple[UUID, date]]:
+        """Distinct (task_id, plan_date) pairs, in date order."""
+        pairs = [(item.task_id, item.plan_date) for item in self.assignments]
+        if self.start_date is not None:
+            span = ((self.end_date or self.start_date) - self.start_date).days
+            dates = [self.start_date + timedelta(days=n) for n in range(span + 1)]
+            pairs += [(task_id, plan_date) for plan_date in dates for task_id in self.task_ids]
+        return sorted(dict.fromkeys(pairs), key=lambda pair: pair[1])
+
+
+class BacklogTaskScheduleRangeResult(BaseModel):
+    scheduled: int = Field(description="(task, date) occurrences created or refreshed")
+    tasks: List[BacklogTaskResponse]
+    not_found: List[UUID] = Field(
+        default_factory=list, description="Ids that do not exist or belong to another user"
+    )
+    completed: List[UUID] = Field(
+        default_factory=list, description="Completed tasks, which cannot be scheduled"
+    )
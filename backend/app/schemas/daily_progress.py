@@ -9,6 +9,11 @@ from app.models.daily_progress import DailyProgressEntryPriority, DailyProgressE
 from app.models.task_context import TaskContext
 from app.schemas.daily_summary import DailySummaryResponse
 
+# Days per list page when the request gives no limit and no closed date range
+DEFAULT_DAY_PAGE_SIZE = 31
+# Upper bound on days per list page (also the default for a closed date range)
+MAX_DAY_PAGE_SIZE = 366
+
 
 class DailyProgressEntryBase(BaseModel):
     title: str = Field(..., min_length=1, max_length=200, description="Task title")
@@ -119,7 +124,28 @@ class DailyProgressDayResponse(DailyProgressDayBase):
 
 class DailyProgressDayList(BaseModel):
     daily_progress_days: List[DailyProgressDayResponse]
-    total: int
+    # All matching days; None when the request set include_total=false
+    total: Optional[int] = None
+    # Pass back as cursor to load older days; None on the last page
+    next_cursor: Optional[str] = None
+
+
+class DailyProgressDayCount(BaseModel):
+    """Per-day entry counts for calendar and list views (no nested entries)."""
+
+    id: UUID
+    progress_date: date
+    title: Optional[str]
+    total_tasks: int
+    completed_tasks: int
+    completion_rate: float
+
+
+class DailyProgressDayCountList(BaseModel):
+    daily_progress_days: List[DailyProgressDayCount]
+    # All matching days; None when the request set include_total=false
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class DailyProgressDayByDateResponse(BaseModel):
@@ -20,7 +20,9 @@ class QuickNoteResponse(BaseModel):
 
 class QuickNoteList(BaseModel):
     notes: list[QuickNoteResponse]
-    total: int
+    # None when the request set include_total=false
+    total: int | None = None
+    next_cursor: str | None = None
 
 
 class QuickNoteImageUploadResponse(BaseModel):
@@ -0,0 +1,31 @@
+"""Schemas for cross-type keyword search."""
+from datetime import date
+from typing import List, Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+SearchType = Literal["backlog_task", "quick_note", "daily_entry", "daily_summary"]
+SEARCH_TYPES = ("backlog_task", "quick_note", "daily_entry", "daily_summary")
+
+
+class SearchHit(BaseModel):
+    type: SearchType
+    id: UUID
+    title: Optional[str] = Field(None, description="Backlog task / daily entry title")
+    snippet: str = Field(description="Excerpt around the first match")
+    highlights: List[List[int]] = Field(
+        default_factory=list,
+        description="[start, end) character offsets of matched terms within snippet",
+    )
+    score: float = Field(description="Relevance; exact substring matches rank above fuzzy ones")
+    occurred_on: Optional[date] = Field(
+        None, description="Progress date for daily entries / summaries, creation date otherwise"
+    )
+    daily_progress_day_id: Optional[UUID] = None
+
+
+class SearchResponse(BaseModel):
+    q: str
+    types: List[SearchType]
+    results: List[SearchHit]
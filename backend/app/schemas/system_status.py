@@ -16,3 +16,17 @@ class SystemStatusResponse(BaseModel):
     checked_at: datetime
     all_ok: bool
     checks: list[StatusCheckItem] = Field(default_factory=list)
+
+
+class AnalyticsCacheStats(BaseModel):
+    """Per-process counters of the analytics response cache."""
+    backend: str
+    enabled: bool
+    hits: int
+    misses: int
+    hit_rate: float
+    errors: int
+    invalidations: int
+    # Lookups computed without the cache while Redis was unreachable
+    bypassed: int
+    pending_invalidations: int
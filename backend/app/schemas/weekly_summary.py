@@ -74,7 +74,8 @@ class WeeklySummaryResponse(WeeklySummaryBase):
 class WeeklySummaryList(BaseModel):
     """周总结列表"""
     summaries: List[WeeklySummaryResponse]
-    total: int
+    total: Optional[int] = None  # include_total=false 时为 null
+    next_cursor: Optional[str] = None
 
 
 class WeeklySummaryGenerationRequest(BaseModel):
@@ -8,12 +8,19 @@ from sqlalchemy.orm import Session, selectinload
 
 from app.core.login_lockout import is_login_locked
 from app.core.security import get_password_hash
+from app.db.pagination import InvalidCursorError, Page, SortKey, keyset_page
 from app.models.role import Role
 from app.models.user import User
 from app.models.user_role import UserRole
 from app.schemas.admin_user import AdminUserCreate, AdminUserListItem, RoleBrief
 from app.services.rbac_service import assign_community_role
 
+# Newest first; served by ix_users_created_at_id
+LIST_SORT_KEYS = (
+    SortKey(User.created_at, descending=True),
+    SortKey(User.id, descending=True),
+)
+
 
 class AdminUserService:
     def __init__(self, db: Session):
@@ -77,19 +84,34 @@ class AdminUserService:
                 detail="须至少保留一名可用的管理员",
             )
 
-    def list_users(self, page: int, page_size: int, q: str | None) -> tuple[list[AdminUserListItem], int]:
+    def list_users(
+        self,
+        page: int,
+        page_size: int,
+        q: str | None,
+        *,
+        cursor: str | None = None,
+        include_total: bool = True,
+    ) -> Page[AdminUserListItem]:
+        """One page of users; ``cursor`` (a previous next_cursor) takes precedence over ``page``."""
         query = self.db.query(User)
         if q and q.strip():
             term = f"%{q.strip()}%"
             query = query.filter(or_(User.username.ilike(term), User.email.ilike(term)))
-        total = query.count()
-        rows = (
-            query.options(selectinload(User.user_roles).selectinload(UserRole.role))
-            .order_by(User.created_at.desc())
-            .offset((page - 1) * page_size)
-            .limit(page_size)
-            .all()
-        )
+        total = query.count() if include_total else None
+        try:
+            rows, next_cursor = keyset_page(
+                query.options(selectinload(User.user_roles).selectinload(UserRole.role)),
+                LIST_SORT_KEYS,
+                limit=page_size,
+                cursor=cursor,
+                offset=(page - 1) * page_size,
+            )
+        except InvalidCursorError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=str(exc),
+            ) from exc
         items = []
         for u in rows:
             roles = []
@@ -110,7 +132,7 @@ class AdminUserService:
                     **self._login_lock_fields(u),
                 )
             )
-        return items, total
+        return Page(items=items, total=total, next_cursor=next_cursor)
 
     def create_user(self, data: AdminUserCreate) -> User:
         if self.db.query(User).filter(User.username == data.username).first():
@@ -0,0 +1,165 @@
+"""Vectorized long-range completion statistics over per-day task counts.
+
+Every function takes dense per-day arrays (index 0 is the first day of the range and
+days without entries hold zeros), so multi-year histories are processed with NumPy
+array operations instead of per-day Python loops.
+"""
+from datetime import date
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+ROLLING_WINDOWS = (7, 30)
+
+# Least-squares change in daily completion rate (percentage points per 30 days)
+# below which the long-range trend counts as stable
+TREND_STABLE_THRESHOLD = 1.0
+
+
+def dense_daily_counts(
+    offsets: np.ndarray,
+    totals: np.ndarray,
+    done: np.ndarray,
+    days: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Scatter sparse (day offset, total, done) rows into dense per-day arrays."""
+    dense_totals = np.zeros(days, dtype=np.int64)
+    dense_done = np.zeros(days, dtype=np.int64)
+    dense_totals[offsets] = totals
+    dense_done[offsets] = done
+    return dense_totals, dense_done
+
+
+def completion_rates(totals: np.ndarray, done: np.ndarray) -> np.ndarray:
+    """Per-element completion percentage; NaN where there were no tasks."""
+    rates = np.full(totals.shape, np.nan)
+    np.divide(done * 100.0, totals, out=rates, where=totals > 0)
+    return rates
+
+
+def rolling_completion_rate(totals: np.ndarray, done: np.ndarray, window: int) -> np.ndarray:
+    """Completion rate over the trailing ``window`` days ending at each day.
+
+    Computed as done / total summed over the window (not a mean of daily rates), so
+    busy days weigh more than days with a single task. Leading days use the shorter
+    window available.
+    """
+    total_sums = np.cumsum(totals)
+    done_sums = np.cumsum(done)
+    total_sums[window:] = total_sums[window:] - total_sums[:-window]
+    done_sums[window:] = done_sums[window:] - done_sums[:-window]
+    return completion_rates(total_sums, done_sums)
+
+
+def streaks(done: np.ndarray) -> Tuple[int, int]:
+    """(longest, current) runs of consecutive days with at least one completed task.
+
+    The current streak ends on the last day of the range, or on the day before when
+    the last day has nothing completed yet (that day is still in progress).
+    """
+    active = done > 0
+    edges = np.diff(np.concatenate(([0], active.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if not len(starts):
+        return 0, 0
+
+    longest = int((ends - starts).max())
+    last_run_end = int(ends[-1])
+    if last_run_end >= len(done) - 1:
+        current = last_run_end - int(starts[-1])
+    else:
+        current = 0
+    return longest, current
+
+
+def weekday_profile(first_day: date, totals: np.ndarray, done: np.ndarray) -> List[Dict]:
+    """Totals, done counts and completion rate per weekday (0 = Monday)."""
+    weekdays = (np.arange(len(totals)) + first_day.weekday()) % 7
+    weekday_totals = np.bincount(weekdays, weights=totals, minlength=7).astype(np.int64)
+    weekday_done = np.bincount(weekdays, weights=done, minlength=7).astype(np.int64)
+    rates = np.nan_to_num(completion_rates(weekday_totals, weekday_done))
+    return [
+        {
+            "weekday": weekday,
+            "total": total,
+            "completed": completed,
+            "completion_rate": round(rate, 2),
+        }
+        for weekday, (total, completed, rate) in enumerate(
+            zip(weekday_totals.tolist(), weekday_done.tolist(), rates.tolist())
+        )
+    ]
+
+
+def trend_slope(rates: np.ndarray) -> float:
+    """Least-squares slope of daily completion rates, in percentage points per day.
+
+    Days without tasks (NaN) are left out of the fit; fewer than two data points
+    give 0.
+    """
+    x = np.flatnonzero(~np.isnan(rates)).astype(np.float64)
+    if len(x) < 2:
+        return 0.0
+    y = rates[x.astype(np.int64)]
+    x_centered = x - x.mean()
+    denominator = float(np.dot(x_centered, x_centered))
+    if denominator == 0:
+        return 0.0
+    return float(np.dot(x_centered, y - y.mean()) / denominator)
+
+
+def trend_direction(slope: float) -> str:
+    """up / down / stable from a slope in percentage points per day."""
+    change = slope * 30
+    if change > TREND_STABLE_THRESHOLD:
+        return "up"
+    if change < -TREND_STABLE_THRESHOLD:
+        return "down"
+    return "stable"
+
+
+def _rounded_or_none(values: np.ndarray) -> List:
+    return np.where(np.isnan(values), None, np.round(values, 2)).tolist()
+
+
+def compute_insights(
+    first_day: date,
+    totals: np.ndarray,
+    done: np.ndarray,
+) -> Dict:
+    """All long-range insights for dense per-day arrays starting at ``first_day``."""
+    days = len(totals)
+    total_tasks = int(totals.sum())
+    completed_tasks = int(done.sum())
+    longest_streak, current_streak = streaks(done)
+    slope = trend_slope(completion_rates(totals, done))
+
+    rolling = {
+        window: rolling_completion_rate(totals, done, window) for window in ROLLING_WINDOWS
+    }
+    dates = np.arange(
+        np.datetime64(first_day, "D"), np.datetime64(first_day, "D") + days
+    ).astype(str).tolist()
+    rate_7d = _rounded_or_none(rolling[7])
+    rate_30d = _rounded_or_none(rolling[30])
+
+    return {
+        "total_tasks": total_tasks,
+        "completed_tasks": completed_tasks,
+        "completion_rate": (
+            round(completed_tasks / total_tasks * 100, 2) if total_tasks else 0.0
+        ),
+        "active_days": int(np.count_nonzero(done)),
+        "longest_streak": longest_streak,
+        "current_streak": current_streak,
+        "rolling_7d_rate": rate_7d[-1] if days else None,
+        "rolling_30d_rate": rate_30d[-1] if days else None,
+        "trend_slope": round(slope, 4),
+        "trend": trend_direction(slope),
+        "weekday_profile": weekday_profile(first_day, totals, done),
+        "rolling_data": [
+            {"date": day, "rate_7d": r7, "rate_30d": r30}
+            for day, r7, r30 in zip(dates, rate_7d, rate_30d)
+        ],
+    }
@@ -1,12 +1,16 @@
 """Analytics service for calculating statistics and trends."""
 from datetime import datetime, date, timedelta
-from typing import List, Dict, Any
+from itertools import chain
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+import numpy as np
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import func, and_, cast, literal, Date
 
+from app.db.date_ranges import date_in_period, date_in_range, period_bounds
 from app.models.yearly_goal import YearlyGoal, GoalStatus, GoalCategory
 from app.models.monthly_plan import MonthlyPlan, MonthlyTask, TaskStatus
-from app.models.daily_progress import DailyProgressDay, DailyProgressEntry, DailyProgressEntryStatus
+from app.models.daily_progress import DailyProgressDay
+from app.models.user_daily_stats import UserDailyStats
 from app.schemas.analytics import (
     DashboardStats,
     GoalCategoryStats,
@@ -14,7 +18,10 @@ from app.schemas.analytics import (
     MonthlyStats,
     CompletionRateTrend,
     HeatmapData,
+    AnalyticsBundle,
+    AnalyticsInsights,
 )
+from app.services import analytics_insights
 
 
 class AnalyticsService:
@@ -22,6 +29,8 @@ class AnalyticsService:
 
     def __init__(self, db: Session):
         self.db = db
+        # (user_id, start, end, rows) loaded once by get_bundle and shared by its views
+        self._daily_stats_window: Optional[Tuple[str, date, date, List[Tuple]]] = None
 
     def get_dashboard_stats(self, user_id: str) -> DashboardStats:
         """Get dashboard overview statistics."""
@@ -30,22 +39,14 @@ class AnalyticsService:
         current_month = today.month
 
         # Yearly goals stats
-        total_goals = self.db.query(YearlyGoal).filter(
+        total_goals, active_goals, completed_goals = self.db.query(
+            func.count(YearlyGoal.id),
+            func.count(YearlyGoal.id).filter(YearlyGoal.status == GoalStatus.IN_PROGRESS),
+            func.count(YearlyGoal.id).filter(YearlyGoal.status == GoalStatus.COMPLETED),
+        ).filter(
             YearlyGoal.user_id == user_id,
             YearlyGoal.year == current_year
-        ).count()
-
-        active_goals = self.db.query(YearlyGoal).filter(
-            YearlyGoal.user_id == user_id,
-            YearlyGoal.year == current_year,
-            YearlyGoal.status == GoalStatus.IN_PROGRESS
-        ).count()
-
-        completed_goals = self.db.query(YearlyGoal).filter(
-            YearlyGoal.user_id == user_id,
-            YearlyGoal.year == current_year,
-            YearlyGoal.status == GoalStatus.COMPLETED
-        ).count()
+        ).one()
 
         # Monthly plans stats
         total_monthly_plans = self.db.query(MonthlyPlan).filter(
@@ -56,44 +57,17 @@ class AnalyticsService:
         # Daily plans stats
         total_daily_progress_days = self.db.query(DailyProgressDay).filter(
             DailyProgressDay.user_id == user_id,
-            func.extract('year', DailyProgressDay.progress_date) == current_year,
-            func.extract('month', DailyProgressDay.progress_date) == current_month
+            date_in_period(DailyProgressDay.progress_date, current_year, current_month)
         ).count()
 
         # Tasks stats (monthly + daily)
-        total_monthly_tasks = self.db.query(MonthlyTask).join(
-            MonthlyPlan, MonthlyTask.monthly_plan_id == MonthlyPlan.id
-        ).filter(
-            MonthlyPlan.user_id == user_id,
-            MonthlyPlan.year == current_year,
-            MonthlyPlan.month == current_month
-        ).count()
-
-        completed_monthly_tasks = self.db.query(MonthlyTask).join(
-            MonthlyPlan, MonthlyTask.monthly_plan_id == MonthlyPlan.id
-        ).filter(
-            MonthlyPlan.user_id == user_id,
-            MonthlyPlan.year == current_year,
-            MonthlyPlan.month == current_month,
-            MonthlyTask.status == TaskStatus.DONE
-        ).count()
-
-        total_daily_tasks = self.db.query(DailyProgressEntry).join(
-            DailyProgressDay, DailyProgressEntry.daily_progress_day_id == DailyProgressDay.id
-        ).filter(
-            DailyProgressDay.user_id == user_id,
-            func.extract('year', DailyProgressDay.progress_date) == current_year,
-            func.extract('month', DailyProgressDay.progress_date) == current_month
-        ).count()
+        total_monthly_tasks, completed_monthly_tasks = self._monthly_task_counts(
+            user_id, current_year, current_month
+        )
 
-        completed_daily_tasks = self.db.query(DailyProgressEntry).join(
-            DailyProgressDay, DailyProgressEntry.daily_progress_day_id == DailyProgressDay.id
-        ).filter(
-            DailyProgressDay.user_id == user_id,
-            func.extract('year', DailyProgressDay.progress_date) == current_year,
-            func.extract('month', DailyProgressDay.progress_date) == current_month,
-            DailyProgressEntry.status == DailyProgressEntryStatus.DONE
-        ).count()
+        total_daily_tasks, completed_daily_tasks = self._daily_task_totals(
+            user_id, *period_bounds(current_year, current_month)
+        )
 
         total_tasks = total_monthly_tasks + total_daily_tasks
         completed_tasks = completed_monthly_tasks + completed_daily_tasks
@@ -149,21 +123,28 @@ class AnalyticsService:
                 completion_rate=completion_rate,
             ))
 
-        # Monthly progress
-        monthly_progress = []
-        for month in range(1, 13):
-            month_goals = self.db.query(YearlyGoal).join(
+        # Monthly progress: goals linked from each month's plans, one grouped query
+        goals_by_month = {
+            month: (total, completed)
+            for month, total, completed in self.db.query(
+                MonthlyPlan.month,
+                func.count(func.distinct(YearlyGoal.id)),
+                func.count(func.distinct(YearlyGoal.id)).filter(
+                    YearlyGoal.status == GoalStatus.COMPLETED
+                ),
+            ).join(
                 MonthlyPlan, YearlyGoal.id == MonthlyPlan.yearly_goal_id
             ).filter(
                 YearlyGoal.user_id == user_id,
-                YearlyGoal.year == year,
-                MonthlyPlan.month == month
-            ).all()
-
-            completed_count = len([g for g in month_goals if g.status == GoalStatus.COMPLETED])
+                YearlyGoal.year == year
+            ).group_by(MonthlyPlan.month).all()
+        }
+        monthly_progress = []
+        for month in range(1, 13):
+            total, completed_count = goals_by_month.get(month, (0, 0))
             monthly_progress.append({
                 "month": month,
-                "total": len(month_goals),
+                "total": total,
                 "completed": completed_count,
             })
 
@@ -173,36 +154,12 @@ class AnalyticsService:
             MonthlyPlan.year == year
         ).count()
 
-        total_tasks = self.db.query(MonthlyTask).join(
-            MonthlyPlan, MonthlyTask.monthly_plan_id == MonthlyPlan.id
-        ).filter(
-            MonthlyPlan.user_id == user_id,
-            MonthlyPlan.year == year
-        ).count()
-
-        completed_tasks = self.db.query(MonthlyTask).join(
-            MonthlyPlan, MonthlyTask.monthly_plan_id == MonthlyPlan.id
-        ).filter(
-            MonthlyPlan.user_id == user_id,
-            MonthlyPlan.year == year,
-            MonthlyTask.status == TaskStatus.DONE
-        ).count()
+        total_tasks, completed_tasks = self._monthly_task_counts(user_id, year)
 
         # Add daily tasks
-        daily_tasks_total = self.db.query(DailyProgressEntry).join(
-            DailyProgressDay, DailyProgressEntry.daily_progress_day_id == DailyProgressDay.id
-        ).filter(
-            DailyProgressDay.user_id == user_id,
-            func.extract('year', DailyProgressDay.progress_date) == year
-        ).count()
-
-        daily_tasks_completed = self.db.query(DailyProgressEntry).join(
-            DailyProgressDay, DailyProgressEntry.daily_progress_day_id == DailyProgressDay.id
-        ).filter(
-            DailyProgressDay.user_id == user_id,
-            func.extract('year', DailyProgressDay.progress_date) == year,
-            DailyProgressEntry.status == DailyProgressEntryStatus.DONE
-        ).count()
+        daily_tasks_total, daily_tasks_completed = self._daily_task_totals(
+            user_id, *period_bounds(year)
+        )
 
         total_tasks += daily_tasks_total
         completed_tasks += daily_tasks_completed
@@ -225,144 +182,179 @@ class AnalyticsService:
 
     def get_monthly_stats(self, user_id: str, year: int, month: int) -> MonthlyStats:
         """Get monthly statistics."""
-        # Get monthly plans
-        monthly_plans = self.db.query(MonthlyPlan).filter(
+        month_start, month_end = period_bounds(year, month)
+
+        total_plans = self.db.query(func.count(MonthlyPlan.id)).filter(
             MonthlyPlan.user_id == user_id,
             MonthlyPlan.year == year,
             MonthlyPlan.month == month
-        ).all()
+        ).scalar() or 0
 
-        total_plans = len(monthly_plans)
-
-        # Get daily plans
-        daily_plans = self.db.query(DailyProgressDay).filter(
+        total_daily_progress_days = self.db.query(func.count(DailyProgressDay.id)).filter(
             DailyProgressDay.user_id == user_id,
-            func.extract('year', DailyProgressDay.progress_date) == year,
-            func.extract('month', DailyProgressDay.progress_date) == month
-        ).all()
-
-        total_daily_progress_days = len(daily_plans)
+            date_in_range(DailyProgressDay.progress_date, month_start, month_end)
+        ).scalar() or 0
 
         # Task stats from monthly plans
-        total_monthly_tasks = self.db.query(MonthlyTask).join(
-            MonthlyPlan, MonthlyTask.monthly_plan_id == MonthlyPlan.id
-        ).filter(
-            MonthlyPlan.user_id == user_id,
-            MonthlyPlan.year == year,
-            MonthlyPlan.month == month
-        ).count()
+        total_monthly_tasks, completed_monthly_tasks = self._monthly_task_counts(
+            user_id, year, month
+        )
+
+        # Task stats from daily progress: one scan of the month's rollup rows
+        breakdown = self._build_monthly_breakdown(
+            self._daily_stats_rows(user_id, month_start, month_end)
+        )
+
+        total_tasks = total_monthly_tasks + breakdown["total"]
+        completed_tasks = completed_monthly_tasks + breakdown["completed"]
 
-        completed_monthly_tasks = self.db.query(MonthlyTask).join(
+        task_completion_rate = round(
+            (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0, 2
+        )
+
+        return MonthlyStats(
+            year=year,
+            month=month,
+            total_plans=total_plans,
+            total_daily_progress_days=total_daily_progress_days,
+            total_tasks=total_tasks,
+            completed_tasks=completed_tasks,
+            task_completion_rate=task_completion_rate,
+            daily_completion_data=breakdown["daily_completion_data"],
+            priority_distribution=breakdown["priority_distribution"],
+            weekly_comparison=breakdown["weekly_comparison"],
+        )
+
+    def _monthly_task_counts(
+        self,
+        user_id: str,
+        year: int,
+        month: Optional[int] = None,
+    ) -> Tuple[int, int]:
+        """Monthly-plan task total and done count for a year (or one month of it)."""
+        query = self.db.query(
+            func.count(MonthlyTask.id),
+            func.count(MonthlyTask.id).filter(MonthlyTask.status == TaskStatus.DONE),
+        ).join(
             MonthlyPlan, MonthlyTask.monthly_plan_id == MonthlyPlan.id
         ).filter(
             MonthlyPlan.user_id == user_id,
-            MonthlyPlan.year == year,
-            MonthlyPlan.month == month,
-            MonthlyTask.status == TaskStatus.DONE
-        ).count()
-
-        # Task stats from daily plans
-        total_daily_tasks = self.db.query(DailyProgressEntry).join(
-            DailyProgressDay, DailyProgressEntry.daily_progress_day_id == DailyProgressDay.id
-        ).filter(
-            DailyProgressDay.user_id == user_id,
-            func.extract('year', DailyProgressDay.progress_date) == year,
-            func.extract('month', DailyProgressDay.progress_date) == month
-        ).count()
+            MonthlyPlan.year == year
+        )
+        if month is not None:
+            query = query.filter(MonthlyPlan.month == month)
+        return query.one()
 
-        completed_daily_tasks = self.db.query(DailyProgressEntry).join(
-            DailyProgressDay, DailyProgressEntry.daily_progress_day_id == DailyProgressDay.id
+    def _daily_task_totals(
+        self,
+        user_id: str,
+        start_date: date,
+        end_date: date,
+    ) -> Tuple[int, int]:
+        """Daily entry total and done count in [start, end), summed from the rollup."""
+        if self._window_covers(user_id, start_date, end_date):
+            rows = self._daily_stats_rows(user_id, start_date, end_date)
+            return sum(row[1] for row in rows), sum(row[2] for row in rows)
+
+        total, completed = self.db.query(
+            func.coalesce(func.sum(UserDailyStats.total), 0),
+            func.coalesce(func.sum(UserDailyStats.done), 0),
         ).filter(
-            DailyProgressDay.user_id == user_id,
-            func.extract('year', DailyProgressDay.progress_date) == year,
-            func.extract('month', DailyProgressDay.progress_date) == month,
-            DailyProgressEntry.status == DailyProgressEntryStatus.DONE
-        ).count()
-
-        total_tasks = total_monthly_tasks + total_daily_tasks
-        completed_tasks = completed_monthly_tasks + completed_daily_tasks
-
-        task_completion_rate = round(
-            (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0, 2
+            UserDailyStats.user_id == user_id,
+            date_in_range(UserDailyStats.progress_date, start_date, end_date)
+        ).one()
+        return int(total), int(completed)
+
+    def _window_covers(self, user_id: str, start_date: date, end_date: date) -> bool:
+        window = self._daily_stats_window
+        return (
+            window is not None
+            and window[0] == str(user_id)
+            and window[1] <= start_date
+            and end_date <= window[2]
         )
 
-        # Daily completion data
-        daily_completion_data = []
-        for day in range(1, 32):
-            day_tasks = self.db.query(DailyProgressEntry).join(
-                DailyProgressDay, DailyProgressEntry.daily_progress_day_id == DailyProgressDay.id
+    def _daily_stats_rows(
+        self,
+        user_id: str,
+        start_date: date,
+        end_date: date,
+    ) -> List[Tuple[date, int, int, int, int, int]]:
+        """Rollup rows (progress_date, total, done, low, medium, high) in [start, end)."""
+        if self._window_covers(user_id, start_date, end_date):
+            return [
+                row for row in self._daily_stats_window[3] if start_date <= row[0] < end_date
+            ]
+        return [
+            tuple(row)
+            for row in self.db.query(
+                UserDailyStats.progress_date,
+                UserDailyStats.total,
+                UserDailyStats.done,
+                UserDailyStats.priority_low,
+                UserDailyStats.priority_medium,
+                UserDailyStats.priority_high,
             ).filter(
-                DailyProgressDay.user_id == user_id,
-                func.extract('year', DailyProgressDay.progress_date) == year,
-                func.extract('month', DailyProgressDay.progress_date) == month,
-                func.extract('day', DailyProgressDay.progress_date) == day
-            ).all()
-
-            if day_tasks:
-                completed = len([t for t in day_tasks if t.status == DailyProgressEntryStatus.DONE])
-                rate = round((completed / len(day_tasks) * 100), 2)
-                daily_completion_data.append({
-                    "day": day,
-                    "total": len(day_tasks),
-                    "completed": completed,
-                    "rate": rate,
-                })
+                UserDailyStats.user_id == user_id,
+                date_in_range(UserDailyStats.progress_date, start_date, end_date)
+            ).order_by(UserDailyStats.progress_date).all()
+        ]
+
+    @staticmethod
+    def _build_monthly_breakdown(
+        rows: List[Tuple[date, int, int, int, int, int]],
+    ) -> Dict[str, Any]:
+        """Fold per-day rollup rows into the daily / priority / weekly series of MonthlyStats."""
+        per_day: Dict[int, List[int]] = {}
+        per_priority = {"low": 0, "medium": 0, "high": 0}
+        total = 0
+        completed = 0
+
+        for progress_date, day_total, day_completed, low, medium, high in rows:
+            bucket = per_day.setdefault(progress_date.day, [0, 0])
+            bucket[0] += day_total
+            bucket[1] += day_completed
+            per_priority["low"] += low
+            per_priority["medium"] += medium
+            per_priority["high"] += high
+            total += day_total
+            completed += day_completed
 
-        # Priority distribution (for daily tasks)
-        priority_distribution = []
-        for priority in ["low", "medium", "high"]:
-            count = self.db.query(DailyProgressEntry).join(
-                DailyProgressDay, DailyProgressEntry.daily_progress_day_id == DailyProgressDay.id
-            ).filter(
-                DailyProgressDay.user_id == user_id,
-                func.extract('year', DailyProgressDay.progress_date) == year,
-                func.extract('month', DailyProgressDay.progress_date) == month,
-                DailyProgressEntry.priority == priority
-            ).count()
-
-            priority_distribution.append({
-                "priority": priority,
-                "count": count,
+        daily_completion_data = []
+        for day in sorted(per_day):
+            day_total, day_completed = per_day[day]
+            daily_completion_data.append({
+                "day": day,
+                "total": day_total,
+                "completed": day_completed,
+                "rate": round((day_completed / day_total * 100), 2),
             })
 
-        # Weekly comparison
         weekly_comparison = []
         for week in range(1, 6):
             start_day = (week - 1) * 7 + 1
             end_day = min(week * 7, 31)
+            week_total = sum(per_day[d][0] for d in per_day if start_day <= d <= end_day)
+            if not week_total:
+                continue
+            week_completed = sum(per_day[d][1] for d in per_day if start_day <= d <= end_day)
+            weekly_comparison.append({
+                "week": week,
+                "total": week_total,
+                "completed": week_completed,
+                "rate": round((week_completed / week_total * 100), 2),
+            })
 
-            week_tasks = self.db.query(DailyProgressEntry).join(
-                DailyProgressDay, DailyProgressEntry.daily_progress_day_id == DailyProgressDay.id
-            ).filter(
-                DailyProgressDay.user_id == user_id,
-                func.extract('year', DailyProgressDay.progress_date) == year,
-                func.extract('month', DailyProgressDay.progress_date) == month,
-                func.extract('day', DailyProgressDay.progress_date) >= start_day,
-                func.extract('day', DailyProgressDay.progress_date) <= end_day
-            ).all()
-
-            if week_tasks:
-                completed = len([t for t in week_tasks if t.status == DailyProgressEntryStatus.DONE])
-                rate = round((completed / len(week_tasks) * 100), 2)
-                weekly_comparison.append({
-                    "week": week,
-                    "total": len(week_tasks),
-                    "completed": completed,
-                    "rate": rate,
-                })
-
-        return MonthlyStats(
-            year=year,
-            month=month,
-            total_plans=total_plans,
-            total_daily_progress_days=total_daily_progress_days,
-            total_tasks=total_tasks,
-            completed_tasks=completed_tasks,
-            task_completion_rate=task_completion_rate,
-            daily_completion_data=daily_completion_data,
-            priority_distribution=priority_distribution,
-            weekly_comparison=weekly_comparison,
-        )
+        return {
+            "total": total,
+            "completed": completed,
+            "daily_completion_data": daily_completion_data,
+            "priority_distribution": [
+                {"priority": priority, "count": per_priority[priority]}
+                for priority in ["low", "medium", "high"]
+            ],
+            "weekly_comparison": weekly_comparison,
+        }
 
     def get_completion_rate_trend(
         self,
@@ -376,81 +368,44 @@ class AnalyticsService:
         rates = []
 
         if period == "daily":
-            current = start_date
-            while current <= end_date:
-                day_tasks = self.db.query(DailyProgressEntry).join(
-                    DailyProgressDay, DailyProgressEntry.daily_progress_day_id == DailyProgressDay.id
-                ).filter(
-                    DailyProgressDay.user_id == user_id,
-                    DailyProgressDay.progress_date == current
-                ).all()
-
-                if day_tasks:
-                    completed = len([t for t in day_tasks if t.status == DailyProgressEntryStatus.DONE])
-                    rate = round((completed / len(day_tasks) * 100), 2)
-                    data.append({
-                        "date": current.isoformat(),
-                        "rate": rate,
-                    })
-                    rates.append(rate)
-
-                current = current + timedelta(days=1)
+            for bucket, total, completed in self._entry_counts_by_bucket(
+                user_id, "day", start_date, end_date
+            ):
+                rate = round((completed / total * 100), 2)
+                data.append({
+                    "date": bucket.isoformat(),
+                    "rate": rate,
+                })
+                rates.append(rate)
 
         elif period == "weekly":
-            # Group by week
-            current = start_date
+            # Calendar (Monday-based) weeks, clipped to the requested range
             week_num = 1
-            while current <= end_date:
-                week_end = min(current.replace(day=current.day + 6), end_date)
-
-                week_tasks = self.db.query(DailyProgressEntry).join(
-                    DailyProgressDay, DailyProgressEntry.daily_progress_day_id == DailyProgressDay.id
-                ).filter(
-                    DailyProgressDay.user_id == user_id,
-                    DailyProgressDay.progress_date >= current,
-                    DailyProgressDay.progress_date <= week_end
-                ).all()
-
-                if week_tasks:
-                    completed = len([t for t in week_tasks if t.status == DailyProgressEntryStatus.DONE])
-                    rate = round((completed / len(week_tasks) * 100), 2)
-                    data.append({
-                        "week": week_num,
-                        "start_date": current.isoformat(),
-                        "end_date": week_end.isoformat(),
-                        "rate": rate,
-                    })
-                    rates.append(rate)
-                    week_num += 1
-
-                current = week_end + timedelta(days=1)
+            for bucket, total, completed in self._entry_counts_by_bucket(
+                user_id, "week", start_date, end_date
+            ):
+                rate = round((completed / total * 100), 2)
+                data.append({
+                    "week": week_num,
+                    "start_date": max(bucket, start_date).isoformat(),
+                    "end_date": min(bucket + timedelta(days=6), end_date).isoformat(),
+                    "rate": rate,
+                })
+                rates.append(rate)
+                week_num += 1
 
         elif period == "monthly":
-            current = start_date
-            while current <= end_date:
-                month_tasks = self.db.query(DailyProgressEntry).join(
-                    DailyProgressDay, DailyProgressEntry.daily_progress_day_id == DailyProgressDay.id
-                ).filter(
-                    DailyProgressDay.user_id == user_id,
-                    func.extract('year', DailyProgressDay.progress_date) == current.year,
-                    func.extract('month', DailyProgressDay.progress_date) == current.month
-                ).all()
-
-                if month_tasks:
-                    completed = len([t for t in month_tasks if t.status == DailyProgressEntryStatus.DONE])
-                    rate = round((completed / len(month_tasks) * 100), 2)
-                    data.append({
-                        "month": current.month,
-                        "year": current.year,
-                        "rate": rate,
-                    })
-                    rates.append(rate)
-
-                # Move to next month
-                if current.month == 12:
-                    current = current.replace(year=current.year + 1, month=1)
-                else:
-                    current = current.replace(month=current.month + 1)
+            range_start, range_end = self._trend_range(period, start_date, end_date)
+            for bucket, total, completed in self._entry_counts_by_bucket(
+                user_id, "month", range_start, range_end
+            ):
+                rate = round((completed / total * 100), 2)
+                data.append({
+                    "month": bucket.month,
+                    "year": bucket.year,
+                    "rate": rate,
+                })
+                rates.append(rate)
 
         # Calculate average and trend
         average_rate = round(sum(rates) / len(rates), 2) if rates else 0
@@ -474,6 +429,16 @@ class AnalyticsService:
             trend=trend,
         )
 
+    @staticmethod
+    def _trend_range(period: str, start_date: date, end_date: date) -> Tuple[date, date]:
+        """Inclusive date range a trend reads; monthly widens to whole calendar months."""
+        if period == "monthly":
+            return (
+                start_date.replace(day=1),
+                period_bounds(end_date.year, end_date.month)[1] - timedelta(days=1),
+            )
+        return start_date, end_date
+
     def get_heatmap_data(
         self,
         user_id: str,
@@ -481,47 +446,18 @@ class AnalyticsService:
         end_date: date
     ) -> HeatmapData:
         """Get heatmap data for task completion visualization."""
+        counts = {
+            bucket: (total, completed)
+            for bucket, total, completed in self._entry_counts_by_bucket(
+                user_id, "day", start_date, end_date
+            )
+        }
+
         data = []
         current = start_date
-
         while current <= end_date:
-            day_tasks = self.db.query(DailyProgressEntry).join(
-                DailyProgressDay, DailyProgressEntry.daily_progress_day_id == DailyProgressDay.id
-            ).filter(
-                DailyProgressDay.user_id == user_id,
-                DailyProgressDay.progress_date == current
-            ).all()
-
-            if day_tasks:
-                completed = len([t for t in day_tasks if t.status == DailyProgressEntryStatus.DONE])
-                rate = round((completed / len(day_tasks) * 100), 2)
-
-                # Determine activity level
-                if rate == 100:
-                    level = "high"
-                elif rate >= 50:
-                    level = "medium"
-                elif rate > 0:
-                    level = "low"
-                else:
-                    level = "none"
-
-                data.append({
-                    "date": current.isoformat(),
-                    "value": rate,
-                    "level": level,
-                    "total": len(day_tasks),
-                    "completed": completed,
-                })
-            else:
-                data.append({
-                    "date": current.isoformat(),
-                    "value": 0,
-                    "level": "none",
-                    "total": 0,
-                    "completed": 0,
-                })
-
+            total, completed = counts.get(current, (0, 0))
+            data.append(self._heatmap_cell(current, total, completed))
             current = current + timedelta(days=1)
 
         return HeatmapData(
@@ -529,3 +465,170 @@ class AnalyticsService:
             end_date=end_date,
             data=data,
         )
+
+    def get_bundle(
+        self,
+        user_id: str,
+        views: Sequence[str],
+        start_date: date,
+        end_date: date,
+        *,
+        period: str = "daily",
+        year: Optional[int] = None,
+        month: Optional[int] = None,
+    ) -> AnalyticsBundle:
+        """Compute several views from a single load of the user's daily rollup rows.
+
+        start_date / end_date drive heatmap and trend; year / month (default: today)
+        drive yearly and monthly; dashboard always covers the current month.
+        """
+        today = date.today()
+        year = year or today.year
+        month = month or today.month
+
+        # Half-open ranges of daily data each requested view reads
+        ranges = []
+        if "dashboard" in views:
+            ranges.append(period_bounds(today.year, today.month))
+        if "yearly" in views:
+            ranges.append(period_bounds(year))
+        if "monthly" in views:
+            ranges.append(period_bounds(year, month))
+        if "heatmap" in views:
+            ranges.append((start_date, end_date + timedelta(days=1)))
+        if "trend" in views:
+            trend_start, trend_end = self._trend_range(period, start_date, end_date)
+            ranges.append((trend_start, trend_end + timedelta(days=1)))
+
+        bundle = AnalyticsBundle(views=list(views))
+        if not ranges:
+            return bundle
+
+        window_start = min(start for start, _ in ranges)
+        window_end = max(end for _, end in ranges)
+        rows = self._daily_stats_rows(user_id, window_start, window_end)
+        self._daily_stats_window = (str(user_id), window_start, window_end, rows)
+        try:
+            if "dashboard" in views:
+                bundle.dashboard = self.get_dashboard_stats(user_id)
+            if "yearly" in views:
+                bundle.yearly = self.get_yearly_stats(user_id, year)
+            if "monthly" in views:
+                bundle.monthly = self.get_monthly_stats(user_id, year, month)
+            if "heatmap" in views:
+                bundle.heatmap = self.get_heatmap_data(user_id, start_date, end_date)
+            if "trend" in views:
+                bundle.trend = self.get_completion_rate_trend(user_id, period, start_date, end_date)
+        finally:
+            self._daily_stats_window = None
+        return bundle
+
+    def get_insights(
+        self,
+        user_id: str,
+        start_date: date,
+        end_date: date
+    ) -> AnalyticsInsights:
+        """Long-range rates, rolling averages, streaks and trend for [start, end]."""
+        days = (end_date - start_date).days + 1
+        rows = self.db.query(
+            UserDailyStats.progress_date - literal(start_date, Date),
+            UserDailyStats.total,
+            UserDailyStats.done,
+        ).filter(
+            UserDailyStats.user_id == user_id,
+            date_in_range(UserDailyStats.progress_date, start_date, end_date + timedelta(days=1))
+        ).all()
+
+        counts = np.fromiter(
+            chain.from_iterable(rows), dtype=np.int64, count=len(rows) * 3
+        ).reshape(-1, 3)
+        totals, done = analytics_insights.dense_daily_counts(
+            counts[:, 0], counts[:, 1], counts[:, 2], days
+        )
+        return AnalyticsInsights(
+            start_date=start_date,
+            end_date=end_date,
+            **analytics_insights.compute_insights(start_date, totals, done),
+        )
+
+    def _entry_counts_by_bucket(
+        self,
+        user_id: str,
+        bucket: str,
+        start_date: date,
+        end_date: date,
+    ) -> List[Tuple[date, int, int]]:
+        """Entry totals and done counts per day / week / month bucket in [start, end].
+
+        Read from the user_daily_stats rollup; only buckets that contain entries are
+        returned, in ascending order.
+        """
+        range_end = end_date + timedelta(days=1)
+        if self._window_covers(user_id, start_date, range_end):
+            return self._fold_buckets(
+                bucket, self._daily_stats_rows(user_id, start_date, range_end)
+            )
+
+        if bucket == "day":
+            bucket_col = UserDailyStats.progress_date
+        else:
+            bucket_col = cast(func.date_trunc(bucket, UserDailyStats.progress_date), Date)
+
+        rows = self.db.query(
+            bucket_col,
+            func.sum(UserDailyStats.total),
+            func.sum(UserDailyStats.done),
+        ).filter(
+            UserDailyStats.user_id == user_id,
+            date_in_range(UserDailyStats.progress_date, start_date, range_end)
+        ).group_by(bucket_col).order_by(bucket_col).all()
+
+        return [(row[0], int(row[1]), int(row[2])) for row in rows if row[1]]
+
+    @staticmethod
+    def _fold_buckets(bucket: str, rows: List[Tuple]) -> List[Tuple[date, int, int]]:
+        """In-memory equivalent of the date_trunc grouping above, over per-day rollup rows."""
+        buckets: Dict[date, List[int]] = {}
+        for progress_date, total, completed, *_ in rows:
+            if bucket == "week":
+                key = progress_date - timedelta(days=progress_date.weekday())
+            elif bucket == "month":
+                key = progress_date.replace(day=1)
+            else:
+                key = progress_date
+            counts = buckets.setdefault(key, [0, 0])
+            counts[0] += total
+            counts[1] += completed
+        return [(key, total, completed) for key, (total, completed) in sorted(buckets.items()) if total]
+
+    @staticmethod
+    def _heatmap_cell(day: date, total: int, completed: int) -> Dict[str, Any]:
+        if not total:
+            return {
+                "date": day.isoformat(),
+                "value": 0,
+                "level": "none",
+                "total": 0,
+                "completed": 0,
+            }
+
+        rate = round((completed / total * 100), 2)
+
+        # Determine activity level
+        if rate == 100:
+            level = "high"
+        elif rate >= 50:
+            level = "medium"
+        elif rate > 0:
+            level = "low"
+        else:
+            level = "none"
+
+        return {
+            "date": day.isoformat(),
+            "value": rate,
+            "level": level,
+            "total": total,
+            "completed": completed,
+        }
@@ -0,0 +1,121 @@
+"""Maintenance of the occurrence summary columns on backlog_tasks.
+
+occurrence_count, last_plan_date and linked_dates mirror the task's rows in
+backlog_daily_links so list and detail responses need no link scan.
+"""
+
+from typing import Iterable, Optional, Set
+
+from sqlalchemy import Date, and_, func, or_, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+
+from app.models.backlog_daily_link import BacklogDailyLink
+from app.models.backlog_task import BacklogTask
+from app.models.daily_progress import DailyProgressEntry
+
+# Earliest plan dates kept in backlog_tasks.linked_dates
+LINKED_DATES_LIMIT = 3
+
+
+def _summary_values() -> dict:
+    """Correlated subqueries computing each summary column for the enclosing backlog task."""
+    of_task = BacklogDailyLink.backlog_task_id == BacklogTask.id
+    return {
+        "occurrence_count": select(func.count(BacklogDailyLink.id)).where(of_task).scalar_subquery(),
+        "last_plan_date": select(func.max(BacklogDailyLink.plan_date)).where(of_task).scalar_subquery(),
+        "linked_dates": func.array(
+            select(BacklogDailyLink.plan_date)
+            .where(of_task)
+            .order_by(BacklogDailyLink.plan_date)
+            .limit(LINKED_DATES_LIMIT)
+            .scalar_subquery()
+        ).cast(ARRAY(Date)),
+    }
+
+
+class BacklogLinkSummaryService:
+    """Recompute backlog_tasks occurrence summaries from backlog_daily_links.
+
+    Callers invoke refresh() inside their own transaction after adding, moving or
+    deleting links (for cascaded deletes, collect the ids with backlog_ids_for_* first).
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def refresh(self, backlog_task_ids: Iterable) -> None:
+        """Recompute the summary columns of the given backlog tasks.
+
+        updated_at is kept as is: the done tab orders by it and a derived column
+        changing is not an edit of the task.
+        """
+        backlog_task_ids = {task_id for task_id in backlog_task_ids if task_id is not None}
+        if not backlog_task_ids:
+            return
+
+        # SessionLocal has autoflush disabled; make pending link changes visible
+        self.db.flush()
+        self.db.execute(
+            update(BacklogTask)
+            .where(BacklogTask.id.in_(backlog_task_ids))
+            .values(**_summary_values(), updated_at=BacklogTask.updated_at)
+            .execution_options(synchronize_session="fetch")
+        )
+
+    def backlog_ids_for_entry_ids(self, entry_ids: Iterable) -> Set:
+        """Backlog tasks linked to the given daily entries (call before deleting them)."""
+        entry_ids = {entry_id for entry_id in entry_ids if entry_id is not None}
+        if not entry_ids:
+            return set()
+        rows = (
+            self.db.query(BacklogDailyLink.backlog_task_id)
+            .filter(BacklogDailyLink.daily_task_id.in_(entry_ids))
+            .distinct()
+            .all()
+        )
+        return {row.backlog_task_id for row in rows}
+
+    def backlog_ids_for_day_ids(self, day_ids: Iterable) -> Set:
+        """Backlog tasks linked to entries of the given days (call before deleting them)."""
+        day_ids = {day_id for day_id in day_ids if day_id is not None}
+        if not day_ids:
+            return set()
+        rows = (
+            self.db.query(BacklogDailyLink.backlog_task_id)
+            .join(DailyProgressEntry, DailyProgressEntry.id == BacklogDailyLink.daily_task_id)
+            .filter(DailyProgressEntry.daily_progress_day_id.in_(day_ids))
+            .distinct()
+            .all()
+        )
+        return {row.backlog_task_id for row in rows}
+
+    def _stale_condition(self):
+        values = _summary_values()
+        return or_(
+            BacklogTask.occurrence_count != values["occurrence_count"],
+            BacklogTask.last_plan_date.is_distinct_from(values["last_plan_date"]),
+            BacklogTask.linked_dates != values["linked_dates"],
+        )
+
+    def verify(self, user_id: Optional[str] = None) -> int:
+        """Number of backlog tasks whose stored summary disagrees with their links."""
+        query = self.db.query(func.count(BacklogTask.id)).filter(self._stale_condition())
+        if user_id is not None:
+            query = query.filter(BacklogTask.user_id == user_id)
+        self.db.flush()
+        return query.scalar()
+
+    def rebuild(self, user_id: Optional[str] = None) -> int:
+        """Recompute stale summaries for one user (or everyone). Returns rows fixed."""
+        self.db.flush()
+        condition = self._stale_condition()
+        if user_id is not None:
+            condition = and_(BacklogTask.user_id == user_id, condition)
+        result = self.db.execute(
+            update(BacklogTask)
+            .where(condition)
+            .values(**_summary_values(), updated_at=BacklogTask.updated_at)
+            .execution_options(synchronize_session="fetch")
+        )
+        return result.rowcount
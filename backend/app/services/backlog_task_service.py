@@ -1,10 +1,12 @@
+import uuid
 from datetime import datetime, date
-from functools import cmp_to_key
-from typing import List, Optional, Literal, Tuple, Dict, Any
+from typing import Dict, Iterable, List, Literal, Optional, Tuple
 
-from sqlalchemy import cast, Date
+from sqlalchemy import Date, Integer, case, cast, column, delete, func, or_, select, update, values
 from sqlalchemy.orm import Session
 
+from app.cache.analytics import mark_analytics_dirty
+from app.db.pagination import Page, SortKey, keyset_page
 from app.models.backlog_daily_link import BacklogDailyLink
 from app.models.backlog_task import BacklogTask, BacklogTaskStatus
 from app.models.daily_progress import (
@@ -15,9 +17,14 @@ from app.models.daily_progress import (
 from app.models.task_context import TaskContext
 from app.models.task_priority import TaskPriority
 from app.schemas.backlog_task import (
+    BacklogTaskBatchItemResult,
+    BacklogTaskBatchOperation,
+    BacklogTaskBatchResult,
     BacklogTaskCreate,
     BacklogTaskUpdate,
     BacklogTaskSchedule,
+    BacklogTaskScheduleRange,
+    BacklogTaskScheduleRangeResult,
     BacklogTaskResponse,
     BacklogTaskDetail,
     BacklogOccurrence,
@@ -29,29 +36,23 @@ from app.schemas.daily_progress import (
     DailyProgressEntryUpdate,
     DailyProgressEntryAdd,
 )
+from app.services.backlog_link_summary_service import BacklogLinkSummaryService
 from app.services.daily_progress_service import DailyProgressService
+from app.services.user_daily_stats_service import UserDailyStatsService
 
 BacklogTimeField = Literal["created", "scheduled", "completed"]
 BacklogTab = Literal["pending", "in_progress", "done", "active"]
-
-_PRIORITY_RANK = {
-    TaskPriority.HIGH: 0,
-    TaskPriority.MEDIUM: 1,
-    TaskPriority.LOW: 2,
-}
-
-_EMPTY_LINK_META: Dict[str, Any] = {
-    "occurrence_count": 0,
-    "is_scheduled": False,
-    "last_plan_date": None,
-    "linked_dates": [],
-}
-
+# Backlog tasks per backfill_progress_snapshots_chunk transaction
+PROGRESS_BACKFILL_CHUNK_SIZE = 500
 
 class BacklogTaskService:
     def __init__(self, db: Session):
         self.db = db
 
+    def _daily_service(self) -> DailyProgressService:
+        """Daily progress writes join this service's transaction; callers commit once."""
+        return DailyProgressService(self.db, flush_only=True)
+
     @staticmethod
     def apply_progress(task: BacklogTask, progress: int) -> None:
         task.progress = progress
@@ -74,7 +75,10 @@ class BacklogTaskService:
         date_to: Optional[date] = None,
         limit: Optional[int] = None,
         offset: int = 0,
-    ) -> Tuple[List[BacklogTask], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Page[BacklogTask]:
+        """One page of a backlog tab; ``cursor`` (a previous next_cursor) takes precedence over offset."""
         query = self.db.query(BacklogTask).filter(BacklogTask.user_id == user_id)
 
         if tab == "pending":
@@ -119,108 +123,83 @@ class BacklogTaskService:
                 if date_to is not None:
                     query = query.filter(cast(BacklogTask.completed_at, Date) <= date_to)
 
-        tasks = query.all()
-        if not tasks:
-            return [], 0
-
-        link_meta = self._batch_link_meta([str(task.id) for task in tasks])
-        sorted_tasks = self._sort_tasks_for_tab(tasks, tab, link_meta)
-        total = len(sorted_tasks)
-
-        if limit is not None:
-            sorted_tasks = sorted_tasks[offset : offset + limit]
-
-        return sorted_tasks, total
-
-    @staticmethod
-    def _compare_tasks(
-        task_a: BacklogTask,
-        meta_a: Dict[str, Any],
-        task_b: BacklogTask,
-        meta_b: Dict[str, Any],
-        tab: BacklogTab,
-    ) -> int:
+        total = None
+        if include_total:
+            total = query.with_entities(func.count(BacklogTask.id)).scalar()
+            if not total:
+                return Page(items=[], total=0)
+
+        query, keys = self._sort_keys_for_tab(query, tab)
+        tasks, next_cursor = keyset_page(query, keys, limit=limit, cursor=cursor, offset=offset)
+        return Page(items=tasks, total=total, next_cursor=next_cursor)
+
+    def _sort_keys_for_tab(self, query, tab: BacklogTab) -> Tuple[object, Tuple[SortKey, ...]]:
+        """The tab's list query and its ordering as keyset sort keys.
+
+        done: most recently completed (or updated) first.
+        in_progress: priority, then highest progress, then newest.
+        pending / active: priority, then newest first, except that scheduled tasks
+        (with daily links, i.e. a last_plan_date) are ordered by their last plan date among the scheduled
+        tasks that sit between the same two unscheduled ones in creation order.
+        Ties fall back to id so pages are stable. created_at is always set by the
+        model default, so only last_plan_date needs NULL-aware cursor comparison.
+
+        The pending / active block is a window over the whole filtered tab (it
+        depends on which unscheduled tasks match the filters, so it cannot be
+        stored and indexed): every page of those tabs, cursor pages included,
+        scans and sorts the tab. The cursor only saves re-reading skipped rows.
+        """
         if tab == "done":
-            completed_a = task_a.completed_at or task_a.updated_at
-            completed_b = task_b.completed_at or task_b.updated_at
-            if completed_a != completed_b:
-                return -1 if completed_a > completed_b else 1
-            if task_a.created_at != task_b.created_at:
-                return -1 if task_a.created_at > task_b.created_at else 1
-            return 0
-
-        rank_a = _PRIORITY_RANK.get(task_a.priority, 1)
-        rank_b = _PRIORITY_RANK.get(task_b.priority, 1)
-        if rank_a != rank_b:
-            return rank_a - rank_b
+            # Uniform direction, served by ix_backlog_tasks_user_done_order
+            return query, (
+                SortKey(func.coalesce(BacklogTask.completed_at, BacklogTask.updated_at), descending=True),
+                SortKey(BacklogTask.created_at, descending=True),
+                SortKey(BacklogTask.id, descending=True),
+            )
 
+        rank = case(
+            (BacklogTask.priority == TaskPriority.HIGH, 0),
+            (BacklogTask.priority == TaskPriority.LOW, 2),
+            else_=1,
+        )
         if tab == "in_progress":
-            if task_a.progress != task_b.progress:
-                return task_b.progress - task_a.progress
-            if task_a.created_at != task_b.created_at:
-                return -1 if task_a.created_at > task_b.created_at else 1
-            return 0
-
-        if (
-            meta_a["is_scheduled"]
-            and meta_b["is_scheduled"]
-            and meta_a["last_plan_date"]
-            and meta_b["last_plan_date"]
-            and meta_a["last_plan_date"] != meta_b["last_plan_date"]
-        ):
-            return -1 if meta_a["last_plan_date"] < meta_b["last_plan_date"] else 1
-
-        if task_a.created_at != task_b.created_at:
-            return -1 if task_a.created_at > task_b.created_at else 1
-        return 0
-
-    def _sort_tasks_for_tab(
-        self,
-        tasks: List[BacklogTask],
-        tab: BacklogTab,
-        link_meta: Dict[str, Dict[str, Any]],
-    ) -> List[BacklogTask]:
-        def sort_key(task: BacklogTask) -> Tuple[BacklogTask, Dict[str, Any]]:
-            return task, link_meta.get(str(task.id), _EMPTY_LINK_META)
-
-        items = [sort_key(task) for task in tasks]
-
-        def compare(item_a: Tuple[BacklogTask, Dict[str, Any]], item_b: Tuple[BacklogTask, Dict[str, Any]]) -> int:
-            return self._compare_tasks(item_a[0], item_a[1], item_b[0], item_b[1], tab)
-
-        return [task for task, _ in sorted(items, key=cmp_to_key(compare))]
-
-    def _batch_link_meta(self, task_ids: List[str]) -> Dict[str, Dict[str, Any]]:
-        if not task_ids:
-            return {}
+            return query, (
+                SortKey(rank),
+                SortKey(BacklogTask.progress, descending=True),
+                SortKey(BacklogTask.created_at, descending=True),
+                SortKey(BacklogTask.id),
+            )
 
-        links = (
-            self.db.query(BacklogDailyLink)
-            .filter(BacklogDailyLink.backlog_task_id.in_(task_ids))
-            .order_by(BacklogDailyLink.plan_date.desc())
-            .all()
+        keys = query.with_entities(
+            BacklogTask.id.label("id"),
+            rank.label("rank"),
+            BacklogTask.last_plan_date.label("last_plan_date"),
+            BacklogTask.created_at.label("created_at"),
+        ).subquery()
+        unscheduled = keys.c.last_plan_date.is_(None)
+        # Unscheduled tasks strictly newer than this row (same priority): the block of
+        # scheduled tasks a row may be reordered within by last plan date.
+        newer_unscheduled = func.count().filter(unscheduled).over(
+            partition_by=keys.c.rank, order_by=keys.c.created_at.desc()
+        ) - func.count().filter(unscheduled).over(
+            partition_by=(keys.c.rank, keys.c.created_at)
+        )
+        ordering = select(
+            keys.c.id,
+            keys.c.rank,
+            newer_unscheduled.label("block"),
+            unscheduled.label("unscheduled"),
+            keys.c.last_plan_date,
+            keys.c.created_at,
+        ).subquery()
+        return self.db.query(BacklogTask).join(ordering, ordering.c.id == BacklogTask.id), (
+            SortKey(ordering.c.rank),
+            SortKey(ordering.c.block),
+            SortKey(ordering.c.unscheduled),
+            SortKey(ordering.c.last_plan_date, nullable=True),
+            SortKey(ordering.c.created_at, descending=True),
+            SortKey(ordering.c.id),
         )
-
-        grouped: Dict[str, Dict[str, Any]] = {}
-        for link in links:
-            task_id = str(link.backlog_task_id)
-            entry = grouped.setdefault(
-                task_id,
-                {"links": [], "dates": set()},
-            )
-            entry["links"].append(link)
-            entry["dates"].add(link.plan_date)
-
-        result: Dict[str, Dict[str, Any]] = {}
-        for task_id, entry in grouped.items():
-            sorted_dates = sorted(entry["dates"])
-            result[task_id] = {
-                "occurrence_count": len(entry["links"]),
-                "is_scheduled": True,
-                "last_plan_date": entry["links"][0].plan_date,
-                "linked_dates": sorted_dates[:3],
-            }
-        return result
 
     def get_task(self, task_id: str) -> Optional[BacklogTask]:
         return self.db.query(BacklogTask).filter(BacklogTask.id == task_id).first()
@@ -260,67 +239,71 @@ class BacklogTaskService:
     def batch_daily_task_progress(
         self, daily_task_ids: List[str]
     ) -> Dict[str, Dict[str, Optional[int]]]:
-        """Progress snapshot + delta for daily tasks linked to backlog."""
+        """Progress snapshot + delta for daily tasks linked to backlog.
+
+        The previous snapshot of each occurrence (last non-null progress_after at an
+        earlier plan date of the same backlog task, else 0) comes from window
+        functions in one query: snapshot_group numbers the runs that start at each
+        recorded snapshot, carried_after carries that snapshot through its run, and
+        LAG reads the value carried into the previous occurrence.
+        """
         if not daily_task_ids:
             return {}
 
-        links = (
-            self.db.query(BacklogDailyLink)
-            .filter(BacklogDailyLink.daily_task_id.in_(daily_task_ids))
-            .all()
+        involved_backlogs = select(BacklogDailyLink.backlog_task_id).where(
+            BacklogDailyLink.daily_task_id.in_(daily_task_ids)
         )
-        if not links:
-            return {}
-
-        backlog_ids = {link.backlog_task_id for link in links}
-        backlog_progress_by_id = {
-            str(row.id): row.progress
-            for row in self.db.query(BacklogTask.id, BacklogTask.progress)
-            .filter(BacklogTask.id.in_(backlog_ids))
-            .all()
-        }
-
-        all_links = (
-            self.db.query(BacklogDailyLink)
-            .filter(BacklogDailyLink.backlog_task_id.in_(backlog_ids))
-            .order_by(BacklogDailyLink.plan_date.asc())
+        snapshots = select(
+            BacklogDailyLink.backlog_task_id,
+            BacklogDailyLink.daily_task_id,
+            BacklogDailyLink.plan_date,
+            BacklogDailyLink.progress_after,
+            func.count(BacklogDailyLink.progress_after).over(
+                partition_by=BacklogDailyLink.backlog_task_id,
+                order_by=BacklogDailyLink.plan_date,
+            ).label("snapshot_group"),
+        ).where(BacklogDailyLink.backlog_task_id.in_(involved_backlogs)).subquery()
+        carried = select(
+            snapshots,
+            func.max(snapshots.c.progress_after).over(
+                partition_by=(snapshots.c.backlog_task_id, snapshots.c.snapshot_group),
+            ).label("carried_after"),
+        ).subquery()
+        previous = select(
+            carried.c.backlog_task_id,
+            carried.c.daily_task_id,
+            carried.c.plan_date,
+            carried.c.progress_after,
+            func.lag(carried.c.carried_after).over(
+                partition_by=carried.c.backlog_task_id,
+                order_by=carried.c.plan_date,
+            ).label("prev_after"),
+        ).subquery()
+
+        rows = (
+            self.db.query(
+                previous.c.daily_task_id,
+                previous.c.plan_date,
+                previous.c.progress_after,
+                previous.c.prev_after,
+                BacklogTask.progress,
+            )
+            .join(BacklogTask, BacklogTask.id == previous.c.backlog_task_id)
+            .filter(previous.c.daily_task_id.in_(daily_task_ids))
             .all()
         )
 
-        links_by_backlog: Dict[str, List[BacklogDailyLink]] = {}
-        for link in all_links:
-            links_by_backlog.setdefault(str(link.backlog_task_id), []).append(link)
-
-        link_by_daily = {str(link.daily_task_id): link for link in links}
         result: Dict[str, Dict[str, Optional[int]]] = {}
-
-        for daily_task_id in daily_task_ids:
-            link = link_by_daily.get(daily_task_id)
-            if link is None:
-                continue
-
-            progress_after: Optional[int] = None
-            progress_delta: Optional[int] = None
-            prev_after = 0
-            for backlog_link in links_by_backlog.get(str(link.backlog_task_id), []):
-                if backlog_link.id == link.id:
-                    current_backlog_progress = backlog_progress_by_id.get(
-                        str(link.backlog_task_id), 0
-                    ) or 0
-                    progress_after, progress_delta = self._resolve_link_progress(
-                        backlog_link,
-                        prev_after=prev_after,
-                        backlog_progress=current_backlog_progress,
-                    )
-                    break
-                if backlog_link.progress_after is not None:
-                    prev_after = backlog_link.progress_after
-
-            result[daily_task_id] = {
-                "progress_after": progress_after if progress_after is not None else 0,
-                "progress_delta": progress_delta if progress_delta is not None else 0,
+        for row in rows:
+            progress_after, progress_delta = self._resolve_link_progress(
+                row,
+                prev_after=row.prev_after or 0,
+                backlog_progress=row.progress or 0,
+            )
+            result[str(row.daily_task_id)] = {
+                "progress_after": progress_after,
+                "progress_delta": progress_delta,
             }
-
         return result
 
     def get_link_for_date(self, backlog_task_id: str, plan_date: date) -> Optional[BacklogDailyLink]:
@@ -333,54 +316,54 @@ class BacklogTaskService:
             .first()
         )
 
-    def get_task_meta(self, task: BacklogTask) -> dict:
-        links = self.get_links_for_backlog(str(task.id))
-        sorted_dates = sorted({link.plan_date for link in links})
+    @staticmethod
+    def get_task_meta(task: BacklogTask) -> dict:
+        """Occurrence summary, read from the columns BacklogLinkSummaryService maintains."""
         return {
-            "occurrence_count": len(links),
-            "is_scheduled": len(links) > 0,
-            "last_plan_date": links[0].plan_date if links else None,
-            "linked_dates": sorted_dates[:3],
+            "occurrence_count": task.occurrence_count,
+            "is_scheduled": task.is_scheduled,
+            "last_plan_date": task.last_plan_date,
+            "linked_dates": list(task.linked_dates or []),
         }
 
-    def _build_occurrence(self, link: BacklogDailyLink) -> BacklogOccurrence:
-        daily_service = DailyProgressService(self.db)
-        daily = daily_service.get_entry(str(link.daily_task_id))
-        day_id = daily.daily_progress_day_id if daily else None
-        return BacklogOccurrence(
-            daily_task_id=link.daily_task_id,
-            daily_progress_day_id=day_id,
-            plan_date=link.plan_date,
-            daily_status=daily.status if daily else None,
-            daily_title=daily.title if daily else None,
-            progress_after=link.progress_after,
-            progress_delta=None,
-            created_at=link.created_at or datetime.utcnow(),
-        )
-
-    def _build_occurrences_with_progress(self, links: List[BacklogDailyLink]) -> List[BacklogOccurrence]:
-        sorted_asc = sorted(links, key=lambda link: link.plan_date)
+    def _build_occurrences(self, task: BacklogTask) -> List[BacklogOccurrence]:
+        """Occurrences of ``task``, newest plan date first.
+
+        Links and their daily entries come from one outer-joined query; progress
+        deltas are carried in plan-date order against the already-loaded task.
+        """
+        rows = (
+            self.db.query(
+                BacklogDailyLink,
+                DailyProgressEntry.daily_progress_day_id,
+                DailyProgressEntry.status,
+                DailyProgressEntry.title,
+            )
+            .outerjoin(DailyProgressEntry, DailyProgressEntry.id == BacklogDailyLink.daily_task_id)
+            .filter(BacklogDailyLink.backlog_task_id == task.id)
+            .order_by(BacklogDailyLink.plan_date)
+            .all()
+        )
+
         prev_after = 0
         built: List[BacklogOccurrence] = []
-        backlog_progress = 0
-        if sorted_asc:
-            backlog = self.get_task(str(sorted_asc[0].backlog_task_id))
-            backlog_progress = backlog.progress if backlog else 0
-
-        for link in sorted_asc:
-            occ = self._build_occurrence(link)
+        for link, day_id, daily_status, daily_title in rows:
             after, delta = self._resolve_link_progress(
                 link,
                 prev_after=prev_after,
-                backlog_progress=backlog_progress,
+                backlog_progress=task.progress,
             )
             prev_after = after
             built.append(
-                occ.model_copy(
-                    update={
-                        "progress_after": after,
-                        "progress_delta": delta,
-                    }
+                BacklogOccurrence(
+                    daily_task_id=link.daily_task_id,
+                    daily_progress_day_id=day_id,
+                    plan_date=link.plan_date,
+                    daily_status=daily_status,
+                    daily_title=daily_title,
+                    progress_after=after,
+                    progress_delta=delta,
+                    created_at=link.created_at or datetime.utcnow(),
                 )
             )
         built.reverse()
@@ -425,6 +408,7 @@ class BacklogTaskService:
         new_status = DailyProgressEntryStatus.DONE if progress >= 100 else DailyProgressEntryStatus.TODO
         if daily_task.status != new_status:
             daily_task.status = new_status
+            UserDailyStatsService(self.db).refresh_days(backlog.user_id, [plan_date])
 
     def to_response(
         self, task: BacklogTask, *, possible_duplicate_count: int = 0
@@ -434,10 +418,21 @@ class BacklogTaskService:
         base = BacklogTaskResponse.model_validate(task)
         return base.model_copy(update=meta)
 
+    def to_responses(
+        self,
+        tasks: List[BacklogTask],
+        dup_counts: Optional[Dict[str, int]] = None,
+    ) -> List[BacklogTaskResponse]:
+        """Bulk to_response; occurrence metadata comes from the summary columns."""
+        dup_counts = dup_counts or {}
+        return [
+            self.to_response(task, possible_duplicate_count=dup_counts.get(str(task.id), 0))
+            for task in tasks
+        ]
+
     def to_detail(self, task: BacklogTask) -> BacklogTaskDetail:
-        links = self.get_links_for_backlog(str(task.id))
         meta = self.get_task_meta(task)
-        occurrences = self._build_occurrences_with_progress(links)
+        occurrences = self._build_occurrences(task)
         base = BacklogTaskResponse.model_validate(task)
         return BacklogTaskDetail(**base.model_copy(update=meta).model_dump(), occurrences=occurrences)
 
@@ -477,12 +472,13 @@ class BacklogTaskService:
         self.db.add(link)
         backlog_task.daily_task_id = daily_task_id
         backlog_task.scheduled_date = plan_date
+        BacklogLinkSummaryService(self.db).refresh([backlog_task.id])
         return link
 
     def _sync_completed_daily_task(self, user_id: str, task: BacklogTask) -> None:
         """Ensure a completed daily task exists for today and link it to the backlog task."""
         plan_date = self._completion_plan_date()
-        daily_service = DailyProgressService(self.db)
+        daily_service = self._daily_service()
 
         existing_link = self.get_link_for_date(str(task.id), plan_date)
         if existing_link:
@@ -530,7 +526,7 @@ class BacklogTaskService:
         *,
         daily_status: DailyProgressEntryStatus = DailyProgressEntryStatus.TODO,
     ):
-        daily_service = DailyProgressService(self.db)
+        daily_service = self._daily_service()
         existing_link = self.get_link_for_date(str(backlog.id), plan_date)
         if existing_link:
             daily_task = daily_service.get_entry(str(existing_link.daily_task_id))
@@ -575,7 +571,7 @@ class BacklogTaskService:
             return
 
         target_date = plan_date or date.today()
-        daily_service = DailyProgressService(self.db)
+        daily_service = self._daily_service()
         day, _ = daily_service.create_or_merge_day(
             user_id,
             DailyProgressDayCreate(progress_date=target_date),
@@ -606,11 +602,14 @@ class BacklogTaskService:
         self.db.refresh(task)
         return task
 
-    def update_task(self, task_id: str, task_in: BacklogTaskUpdate) -> Optional[BacklogTask]:
-        task = self.get_task(task_id)
-        if not task:
-            return None
+    def _apply_update_fields(
+        self, task: BacklogTask, task_in: BacklogTaskUpdate
+    ) -> Tuple[int, Optional[date], bool]:
+        """Apply task_in to the task in memory, leaving daily occurrences to the caller.
 
+        Returns (old progress, progress_plan_date, whether today's completed daily
+        occurrence needs syncing).
+        """
         update_data = task_in.model_dump(exclude_unset=True)
         new_progress = update_data.pop("progress", None)
         new_status = update_data.pop("status", None)
@@ -620,13 +619,13 @@ class BacklogTaskService:
         for field, value in update_data.items():
             setattr(task, field, value)
 
+        sync_completed = False
         if new_progress is not None and new_status is not None:
             task.progress = new_progress
             task.status = new_status
             if new_progress == 100 or new_status == BacklogTaskStatus.DONE:
                 task.completed_at = datetime.utcnow()
-                if progress_plan_date is None:
-                    self._sync_completed_daily_task(str(task.user_id), task)
+                sync_completed = progress_plan_date is None
             else:
                 task.completed_at = None
         elif new_status is not None:
@@ -636,15 +635,24 @@ class BacklogTaskService:
                 task.completed_at = None
             elif new_status == BacklogTaskStatus.DONE:
                 self.apply_progress(task, 100)
-                if progress_plan_date is None:
-                    self._sync_completed_daily_task(str(task.user_id), task)
+                sync_completed = progress_plan_date is None
             elif new_status == BacklogTaskStatus.IN_PROGRESS:
                 task.status = BacklogTaskStatus.IN_PROGRESS
                 task.completed_at = None
         elif new_progress is not None and new_progress != old_progress:
             self.apply_progress(task, new_progress)
-            if new_progress == 100 and progress_plan_date is None:
-                self._sync_completed_daily_task(str(task.user_id), task)
+            sync_completed = new_progress == 100 and progress_plan_date is None
+
+        return old_progress, progress_plan_date, sync_completed
+
+    def update_task(self, task_id: str, task_in: BacklogTaskUpdate) -> Optional[BacklogTask]:
+        task = self.get_task(task_id)
+        if not task:
+            return None
+
+        old_progress, progress_plan_date, sync_completed = self._apply_update_fields(task, task_in)
+        if sync_completed:
+            self._sync_completed_daily_task(str(task.user_id), task)
 
         if (
             task.status == BacklogTaskStatus.IN_PROGRESS
@@ -675,29 +683,89 @@ class BacklogTaskService:
         return task
 
     def delete_task(self, task_id: str) -> bool:
-        task = self.get_task(task_id)
-        if not task:
-            return False
+        return bool(self.delete_tasks([task_id]))
 
-        links = self.get_links_for_backlog(task_id)
-        daily_task_ids = {link.daily_task_id for link in links}
+    def delete_tasks(self, task_ids: Iterable, *, user_id: Optional[str] = None) -> List[uuid.UUID]:
+        """Delete backlog tasks with their daily links and linked daily entries.
 
-        linked_dailies = (
-            self.db.query(DailyProgressEntry.id)
-            .filter(DailyProgressEntry.backlog_task_id == task.id)
-            .all()
+        Set-based: one DELETE per table in FK order (links, entries, tasks) instead of
+        a lookup and ORM cascade per occurrence. Backlog tasks that shared a deleted
+        entry get scheduled_date / daily_task_id and their occurrence summary
+        recomputed. Only ``user_id``'s tasks are deleted when given. Returns the ids
+        of the deleted tasks.
+        """
+        self.db.flush()
+        query = self.db.query(BacklogTask.id, BacklogTask.user_id).filter(
+            BacklogTask.id.in_(list(task_ids))
         )
-        daily_task_ids.update(row.id for row in linked_dailies)
+        if user_id is not None:
+            query = query.filter(BacklogTask.user_id == user_id)
+        owners = dict(query.all())
+        if not owners:
+            return []
+        deleted_ids = list(owners)
 
-        for daily_task_id in daily_task_ids:
-            daily = self.db.query(DailyProgressEntry).filter(DailyProgressEntry.id == daily_task_id).first()
-            if daily is not None:
-                self.db.delete(daily)
+        linked_entry_ids = select(BacklogDailyLink.daily_task_id).where(
+            BacklogDailyLink.backlog_task_id.in_(deleted_ids)
+        )
+        entries = dict(
+            self.db.query(DailyProgressEntry.id, DailyProgressEntry.daily_progress_day_id)
+            .filter(
+                or_(
+                    DailyProgressEntry.id.in_(linked_entry_ids),
+                    DailyProgressEntry.backlog_task_id.in_(deleted_ids),
+                )
+            )
+            .all()
+        )
+        entry_ids = list(entries)
+        summaries = BacklogLinkSummaryService(self.db)
+        other_backlog_ids = summaries.backlog_ids_for_entry_ids(entry_ids) - set(deleted_ids)
+
+        sync = {"synchronize_session": "fetch"}
+        self.db.execute(
+            delete(BacklogDailyLink).where(
+                or_(
+                    BacklogDailyLink.backlog_task_id.in_(deleted_ids),
+                    BacklogDailyLink.daily_task_id.in_(entry_ids),
+                )
+            ),
+            execution_options=sync,
+        )
+        if entry_ids:
+            self.db.execute(
+                delete(DailyProgressEntry).where(DailyProgressEntry.id.in_(entry_ids)),
+                execution_options=sync,
+            )
+        self.db.execute(
+            delete(BacklogTask).where(BacklogTask.id.in_(deleted_ids)), execution_options=sync
+        )
 
-        self.db.flush()
-        self.db.delete(task)
+        if other_backlog_ids:
+            latest_plan_date = (
+                select(func.max(BacklogDailyLink.plan_date))
+                .where(BacklogDailyLink.backlog_task_id == BacklogTask.id)
+                .scalar_subquery()
+            )
+            self.db.execute(
+                update(BacklogTask)
+                .where(BacklogTask.id.in_(other_backlog_ids))
+                .values(
+                    scheduled_date=latest_plan_date,
+                    daily_task_id=case(
+                        (BacklogTask.daily_task_id.in_(entry_ids), None),
+                        else_=BacklogTask.daily_task_id,
+                    ),
+                    updated_at=BacklogTask.updated_at,
+                ),
+                execution_options=sync,
+            )
+            summaries.refresh(other_backlog_ids)
+        UserDailyStatsService(self.db).refresh_for_day_ids(entries.values())
+        for owner_id in set(owners.values()):
+            mark_analytics_dirty(self.db, owner_id)
         self.db.commit()
-        return True
+        return deleted_ids
 
     def complete_task(self, task_id: str) -> Optional[BacklogTask]:
         task = self.get_task(task_id)
@@ -722,7 +790,7 @@ class BacklogTaskService:
         if task.progress == 100:
             return None
 
-        daily_service = DailyProgressService(self.db)
+        daily_service = self._daily_service()
         day, _ = daily_service.create_or_merge_day(
             user_id,
             DailyProgressDayCreate(progress_date=schedule_in.plan_date),
@@ -760,7 +828,7 @@ class BacklogTaskService:
         day_id: str,
         data: DailyProgressEntryAdd,
     ):
-        daily_service = DailyProgressService(self.db)
+        daily_service = self._daily_service()
         day = daily_service.get_day(day_id)
         if not day:
             return None
@@ -771,13 +839,17 @@ class BacklogTaskService:
             backlog = self.get_task(str(data.backlog_task_id))
             if not backlog or str(backlog.user_id) != user_id:
                 return None
-            return self._link_backlog_to_plan(
+            daily_task = self._link_backlog_to_plan(
                 user_id,
                 backlog,
                 day_id,
                 day.progress_date,
                 daily_status=daily_status,
             )
+            self.db.commit()
+            if daily_task:
+                self.db.refresh(daily_task)
+            return daily_task
 
         progress = 100 if daily_status == DailyProgressEntryStatus.DONE else 0
         if daily_status == DailyProgressEntryStatus.IN_PROGRESS:
@@ -810,51 +882,412 @@ class BacklogTaskService:
             self.db.refresh(daily_task)
         return daily_task
 
-    def backfill_progress_snapshots(self, user_id: Optional[str] = None) -> int:
-        """Backfill missing progress_after on daily links from backlog/daily state."""
-        query = self.db.query(BacklogTask)
-        if user_id is not None:
-            query = query.filter(BacklogTask.user_id == user_id)
+    # ----- batch mutations -----
+
+    def apply_batch(
+        self, user_id: str, operations: List[BacklogTaskBatchOperation]
+    ) -> BacklogTaskBatchResult:
+        """Apply create / update / complete / schedule operations in one transaction.
+
+        Operations run in order against the in-memory tasks and record the daily
+        occurrence changes they imply; those are then replayed in order over one bulk
+        load (day containers once per distinct date, existing links and entries in one
+        query each) and written by a single flush, so new entries and links go out as
+        multi-row INSERTs. Operations that cannot apply (unknown task, scheduling a
+        completed task) are reported in their result and skipped; the rest commit
+        together.
+        """
+        task_ids = {operation.task_id for operation in operations if operation.op != "create"}
+        tasks: Dict = {}
+        if task_ids:
+            tasks = {
+                task.id: task
+                for task in self.db.query(BacklogTask).filter(
+                    BacklogTask.id.in_(task_ids), BacklogTask.user_id == user_id
+                )
+            }
 
-        updated = 0
-        for backlog in query.all():
-            links = (
-                self.db.query(BacklogDailyLink)
-                .filter(BacklogDailyLink.backlog_task_id == backlog.id)
-                .order_by(BacklogDailyLink.plan_date.asc())
-                .all()
-            )
-            if not links:
-                continue
-
-            last_backfill_link: Optional[BacklogDailyLink] = None
-            for link in reversed(links):
-                if link.progress_after is not None:
-                    break
-                daily = self.db.query(DailyProgressEntry).filter(DailyProgressEntry.id == link.daily_task_id).first()
-                if daily and daily.status == DailyProgressEntryStatus.DONE:
-                    last_backfill_link = link
-                    break
-            if last_backfill_link is None:
-                for link in reversed(links):
-                    if link.progress_after is None:
-                        last_backfill_link = link
-                        break
-
-            prev_after = 0
-            for link in links:
-                if link.progress_after is not None:
-                    prev_after = link.progress_after
+        events: List[tuple] = []
+        outcomes: List[Tuple[Optional[BacklogTask], Optional[str]]] = []
+        try:
+            for operation in operations:
+                if operation.op == "create":
+                    outcomes.append((self._batch_create(user_id, operation.data, events), None))
                     continue
 
-                if last_backfill_link is not None and link.id == last_backfill_link.id:
-                    link.progress_after = max(prev_after, backlog.progress)
+                task = tasks.get(operation.task_id)
+                if task is None:
+                    outcomes.append((None, "Backlog task not found"))
+                elif operation.op == "update":
+                    self._batch_update(task, operation.data, events)
+                    outcomes.append((task, None))
+                elif operation.op == "complete":
+                    if task.progress != 100:
+                        self.apply_progress(task, 100)
+                        self._queue_completed_link(task, events)
+                        events.append(("snapshot", task, None, task.progress))
+                    outcomes.append((task, None))
+                elif task.progress == 100:
+                    outcomes.append((None, "Unable to schedule a completed task"))
                 else:
-                    link.progress_after = prev_after
-                prev_after = link.progress_after
-                updated += 1
+                    self._queue_link(events, task, operation.plan_date, DailyProgressEntryStatus.TODO)
+                    outcomes.append((task, None))
+
+            # New tasks need their ids before links can reference them
+            self.db.flush()
+            self._apply_daily_events(user_id, events)
+            done_ids = {task.id for task, _ in outcomes if task is not None}
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        # Reload every touched task in one query instead of a refresh per task
+        if done_ids:
+            self.db.query(BacklogTask).filter(BacklogTask.id.in_(done_ids)).all()
+
+        results = [
+            BacklogTaskBatchItemResult(
+                index=index,
+                op=operation.op,
+                ok=error is None,
+                task=self.to_response(task) if task is not None else None,
+                error=error,
+            )
+            for index, (operation, (task, error)) in enumerate(zip(operations, outcomes))
+        ]
+        failed = sum(1 for result in results if not result.ok)
+        return BacklogTaskBatchResult(
+            results=results, succeeded=len(results) - failed, failed=failed
+        )
+
+    def schedule_range(
+        self, user_id: str, schedule_in: BacklogTaskScheduleRange
+    ) -> BacklogTaskScheduleRangeResult:
+        """Schedule many (task, date) occurrences in one transaction.
+
+        Goes through the batch event replay: missing day containers come from one
+        INSERT ... ON CONFLICT, and new entries and links are written by a single flush
+        as multi-row INSERTs. Occurrences that already exist are refreshed as in
+        schedule_task. Unknown and completed tasks are reported and skipped.
+        """
+        occurrences = schedule_in.occurrences()
+        requested = list(dict.fromkeys(task_id for task_id, _ in occurrences))
+        tasks = {
+            task.id: task
+            for task in self.db.query(BacklogTask).filter(
+                BacklogTask.id.in_(requested), BacklogTask.user_id == user_id
+            )
+        }
 
-        return updated
+        events: List[tuple] = []
+        for task_id, plan_date in occurrences:
+            task = tasks.get(task_id)
+            if task is not None and task.progress != 100:
+                self._queue_link(events, task, plan_date, DailyProgressEntryStatus.TODO)
+        try:
+            self._apply_daily_events(user_id, events)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        scheduled_ids = list(dict.fromkeys(event[1].id for event in events))
+        scheduled = {}
+        if scheduled_ids:
+            # Reload in one query instead of a refresh per task
+            scheduled = {
+                task.id: task
+                for task in self.db.query(BacklogTask).filter(BacklogTask.id.in_(scheduled_ids))
+            }
+        return BacklogTaskScheduleRangeResult(
+            scheduled=len(events),
+            tasks=self.to_responses([scheduled[task_id] for task_id in scheduled_ids]),
+            not_found=[task_id for task_id in requested if task_id not in tasks],
+            completed=[
+                task_id for task_id in requested if task_id in tasks and task_id not in scheduled
+            ],
+        )
+
+    def _batch_create(
+        self, user_id: str, task_in: BacklogTaskCreate, events: List[tuple]
+    ) -> BacklogTask:
+        """create_task without the commit; daily occurrences are queued."""
+        # Unlike create_task, include unset fields: their schema defaults equal the
+        # column defaults, and the queued entry payload needs them before the flush
+        data = task_in.model_dump()
+        progress = data.pop("progress", 0)
+        task = BacklogTask(**data, user_id=user_id, progress=progress)
+        self.apply_progress(task, progress)
+        self.db.add(task)
+        if progress == 100:
+            self._queue_completed_link(task, events)
+        elif progress > 0:
+            self._queue_link(
+                events,
+                task,
+                date.today(),
+                DailyProgressEntryStatus.IN_PROGRESS,
+                progress_after=task.progress,
+            )
+        return task
+
+    def _batch_update(
+        self, task: BacklogTask, task_in: BacklogTaskUpdate, events: List[tuple]
+    ) -> None:
+        """update_task without the commit; daily occurrences and snapshots are queued."""
+        old_progress, progress_plan_date, sync_completed = self._apply_update_fields(task, task_in)
+        if sync_completed:
+            self._queue_completed_link(task, events)
+
+        if (
+            task.status == BacklogTaskStatus.IN_PROGRESS
+            and 0 < task.progress < 100
+            and not task.occurrence_count
+            and not any(event[0] == "link" and event[1] is task for event in events)
+        ):
+            self._queue_link(
+                events,
+                task,
+                progress_plan_date or date.today(),
+                DailyProgressEntryStatus.IN_PROGRESS,
+                progress_after=task.progress,
+            )
+
+        if task.progress != old_progress:
+            events.append(("snapshot", task, progress_plan_date, task.progress))
+
+    def _queue_completed_link(self, task: BacklogTask, events: List[tuple]) -> None:
+        self._queue_link(
+            events,
+            task,
+            self._completion_plan_date(),
+            DailyProgressEntryStatus.DONE,
+            overwrite_status=True,
+            progress_after=task.progress,
+        )
+
+    def _queue_link(
+        self,
+        events: List[tuple],
+        task: BacklogTask,
+        plan_date: date,
+        status: DailyProgressEntryStatus,
+        *,
+        overwrite_status: bool = False,
+        progress_after: Optional[int] = None,
+    ) -> None:
+        """Queue _link_backlog_to_plan (or, with overwrite_status, _sync_completed_daily_task)."""
+        # The entry payload is captured now: later operations may rename the task
+        payload = self._daily_task_payload(task, status=status)
+        events.append(("link", task, plan_date, payload, overwrite_status, progress_after))
+
+    def _apply_daily_events(self, user_id: str, events: List[tuple]) -> None:
+        """Replay queued link / snapshot events in order over one bulk load, then flush.
+
+        ("link", task, plan_date, entry payload, overwrite_status, progress_after)
+        creates or refreshes the task's occurrence on plan_date. ("snapshot", task,
+        plan_date, progress) records progress on that date's link and syncs its entry
+        status, or with plan_date None on every link from today on.
+        """
+        if not events:
+            return
+
+        today = date.today()
+        task_ids = {event[1].id for event in events}
+        dates = {event[2] for event in events if event[2] is not None}
+        link_dates = {event[2] for event in events if event[0] == "link"}
+        days = self._daily_service().get_or_create_days(user_id, link_dates)
+
+        in_scope = BacklogDailyLink.plan_date >= today
+        if dates:
+            in_scope = or_(in_scope, BacklogDailyLink.plan_date.in_(dates))
+        links_by_task: Dict = {task_id: {} for task_id in task_ids}
+        for link in self.db.query(BacklogDailyLink).filter(
+            BacklogDailyLink.backlog_task_id.in_(task_ids), in_scope
+        ):
+            links_by_task[link.backlog_task_id][link.plan_date] = link
+        entry_ids = [link.daily_task_id for links in links_by_task.values() for link in links.values()]
+        entries = {}
+        if entry_ids:
+            entries = {
+                entry.id: entry
+                for entry in self.db.query(DailyProgressEntry).filter(
+                    DailyProgressEntry.id.in_(entry_ids)
+                )
+            }
+
+        stats_dates = set(link_dates)
+        for kind, task, plan_date, *args in events:
+            links = links_by_task[task.id]
+            if kind == "link":
+                payload, overwrite_status, progress_after = args
+                link = links.get(plan_date)
+                if link is None:
+                    entry = DailyProgressEntry(
+                        **payload.model_dump(exclude_unset=True),
+                        # Assigned up front so the link and task can point at it before the flush
+                        id=uuid.uuid4(),
+                        daily_progress_day_id=days[plan_date].id,
+                        backlog_task_id=task.id,
+                    )
+                    link = BacklogDailyLink(
+                        backlog_task_id=task.id, daily_task_id=entry.id, plan_date=plan_date
+                    )
+                    self.db.add_all([entry, link])
+                    links[plan_date] = link
+                    entries[entry.id] = entry
+                else:
+                    entry = entries.get(link.daily_task_id)
+                    if entry is not None:
+                        entry.title = payload.title
+                        entry.description = payload.description
+                        entry.context = payload.context
+                        entry.priority = payload.priority
+                        if overwrite_status:
+                            entry.status = payload.status
+                if entry is not None:
+                    task.daily_task_id = entry.id
+                task.scheduled_date = plan_date
+                if progress_after is not None:
+                    link.progress_after = progress_after
+            elif plan_date is None:
+                (progress,) = args
+                for link in links.values():
+                    if link.plan_date >= today:
+                        link.progress_after = progress
+            else:
+                (progress,) = args
+                link = links.get(plan_date)
+                if link is None:
+                    continue
+                link.progress_after = progress
+                entry = entries.get(link.daily_task_id)
+                if entry is not None:
+                    entry.status = (
+                        DailyProgressEntryStatus.DONE
+                        if progress >= 100
+                        else DailyProgressEntryStatus.TODO
+                    )
+                    stats_dates.add(plan_date)
+
+        self.db.flush()
+        BacklogLinkSummaryService(self.db).refresh(task_ids)
+        UserDailyStatsService(self.db).refresh_days(user_id, stats_dates)
+
+    def backfill_progress_snapshots(self, user_id: Optional[str] = None) -> int:
+        """Backfill missing progress_after on daily links from backlog/daily state."""
+        updated = 0
+        after_id: Optional[str] = None
+        while True:
+            count, after_id = self.backfill_progress_snapshots_chunk(
+                user_id=user_id, after_id=after_id
+            )
+            updated += count
+            if after_id is None:
+                return updated
+
+    def backfill_progress_snapshots_chunk(
+        self,
+        *,
+        user_id: Optional[str] = None,
+        after_id: Optional[str] = None,
+        chunk_size: int = PROGRESS_BACKFILL_CHUNK_SIZE,
+    ) -> Tuple[int, Optional[str]]:
+        """Backfill the next ``chunk_size`` backlog tasks (by id, after ``after_id``) that
+        have links without a snapshot.
+
+        Returns (links updated, checkpoint); the checkpoint is the last backlog id
+        processed and None once nothing is left. A missing snapshot carries the previous
+        one (0 before the first); the newest DONE link after the last recorded snapshot,
+        else the newest link without one, takes max(carried, task progress), and so do
+        the links after it. Values are computed with window functions and a DISTINCT ON
+        pick, then written with one UPDATE ... FROM (VALUES ...).
+        """
+        self.db.flush()
+        pending = select(BacklogDailyLink.backlog_task_id).where(
+            BacklogDailyLink.progress_after.is_(None)
+        )
+        if user_id is not None:
+            pending = pending.join(BacklogTask, BacklogTask.id == BacklogDailyLink.backlog_task_id).where(
+                BacklogTask.user_id == user_id
+            )
+        if after_id is not None:
+            pending = pending.where(BacklogDailyLink.backlog_task_id > after_id)
+        task_ids = self.db.scalars(
+            pending.distinct().order_by(BacklogDailyLink.backlog_task_id).limit(chunk_size)
+        ).all()
+        if not task_ids:
+            return 0, None
+
+        snapshots = (
+            select(
+                BacklogDailyLink.id,
+                BacklogDailyLink.backlog_task_id,
+                BacklogDailyLink.plan_date,
+                BacklogDailyLink.progress_after,
+                DailyProgressEntry.status,
+                func.count(BacklogDailyLink.progress_after).over(
+                    partition_by=BacklogDailyLink.backlog_task_id,
+                    order_by=BacklogDailyLink.plan_date,
+                ).label("snapshot_group"),
+                func.count(BacklogDailyLink.progress_after).over(
+                    partition_by=BacklogDailyLink.backlog_task_id,
+                ).label("snapshot_count"),
+            )
+            .outerjoin(DailyProgressEntry, DailyProgressEntry.id == BacklogDailyLink.daily_task_id)
+            .where(BacklogDailyLink.backlog_task_id.in_(task_ids))
+            .subquery()
+        )
+        carried = select(
+            snapshots,
+            func.coalesce(
+                func.max(snapshots.c.progress_after).over(
+                    partition_by=(snapshots.c.backlog_task_id, snapshots.c.snapshot_group),
+                ),
+                0,
+            ).label("prev_after"),
+        ).subquery()
+        missing = carried.c.progress_after.is_(None)
+        trailing_done = (carried.c.status == DailyProgressEntryStatus.DONE) & (
+            carried.c.snapshot_group == carried.c.snapshot_count
+        )
+        targets = (
+            select(carried.c.backlog_task_id, carried.c.plan_date.label("target_date"))
+            .where(missing)
+            .distinct(carried.c.backlog_task_id)
+            .order_by(
+                carried.c.backlog_task_id,
+                case((trailing_done, 0), else_=1),
+                carried.c.plan_date.desc(),
+            )
+            .subquery()
+        )
+        rows = self.db.execute(
+            select(
+                carried.c.id,
+                case(
+                    (carried.c.plan_date < targets.c.target_date, carried.c.prev_after),
+                    else_=func.greatest(carried.c.prev_after, BacklogTask.progress),
+                ),
+            )
+            .join(targets, targets.c.backlog_task_id == carried.c.backlog_task_id)
+            .join(BacklogTask, BacklogTask.id == carried.c.backlog_task_id)
+            .where(missing)
+        ).all()
+
+        backfill = values(
+            column("id", BacklogDailyLink.id.type),
+            column("progress_after", Integer),
+            name="backfill",
+        ).data([tuple(row) for row in rows])
+        self.db.execute(
+            update(BacklogDailyLink)
+            .where(BacklogDailyLink.id == backfill.c.id)
+            .values(progress_after=backfill.c.progress_after),
+            execution_options={"synchronize_session": "fetch"},
+        )
+        return len(rows), str(task_ids[-1])
 
     def sync_from_daily_task(self, daily_task_id: str, *, is_done: bool) -> None:
         """Record progress snapshot on the daily link when a day is marked done."""
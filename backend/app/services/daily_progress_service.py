@@ -1,11 +1,20 @@
 """Daily progress service."""
 
-from typing import List, Optional, Tuple
-from datetime import date
-from sqlalchemy.orm import Session, load_only
-from sqlalchemy import and_
-from sqlalchemy.exc import IntegrityError
-
+from typing import Dict, Iterable, List, Optional, Tuple
+from datetime import date, datetime
+from sqlalchemy.orm import Session, load_only, selectinload
+from sqlalchemy import Text, and_, case, func, literal_column
+from sqlalchemy.dialects.postgresql import insert
+
+from app.cache.analytics import mark_analytics_dirty
+from app.db.pagination import (
+    Page,
+    SortKey,
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    keyset_page,
+)
 from app.models.backlog_daily_link import BacklogDailyLink
 from app.models.backlog_task import BacklogTask
 from app.models.daily_progress import (
@@ -15,7 +24,12 @@ from app.models.daily_progress import (
     DailyProgressEntryStatus,
 )
 from app.models.task_context import TaskContext
+from app.services.backlog_link_summary_service import BacklogLinkSummaryService
+from app.services.user_daily_stats_service import UserDailyStatsService
 from app.schemas.daily_progress import (
+    DEFAULT_DAY_PAGE_SIZE,
+    MAX_DAY_PAGE_SIZE,
+    DailyProgressDayCount,
     DailyProgressDayCreate,
     DailyProgressDayUpdate,
     DailyProgressEntryCreate,
@@ -24,27 +38,172 @@ from app.schemas.daily_progress import (
     DailyProgressEntryResponse,
 )
 
+# progress_date is unique per user, so it alone is a complete keyset
+DAY_SORT_KEYS = (SortKey(DailyProgressDay.progress_date, descending=True),)
+
+
+def _completion_rate(completed: int, total: int) -> float:
+    return round(completed / total * 100, 2) if total else 0.0
+
 
 class DailyProgressService:
-    def __init__(self, db: Session):
+    """Daily progress days and entries.
+
+    Writes commit by default. With flush_only=True they only flush: the caller owns
+    the transaction and commits once, so composite operations (BacklogTaskService)
+    are atomic and cost one commit.
+    """
+
+    def __init__(self, db: Session, *, flush_only: bool = False):
         self.db = db
+        self.flush_only = flush_only
+        self.stats = UserDailyStatsService(db)
+        self.link_summaries = BacklogLinkSummaryService(db)
 
-    def get_user_days(
+    def _commit(self, *instances) -> None:
+        """Commit and reload instances, or only flush in flush_only mode."""
+        if self.flush_only:
+            self.db.flush()
+            return
+        self.db.commit()
+        for instance in instances:
+            self.db.refresh(instance)
+
+    def _days_query(
         self,
         user_id: str,
-        start_date: Optional[date] = None,
-        end_date: Optional[date] = None,
-    ) -> List[DailyProgressDay]:
-        """Get all daily progress days for a user with optional date range filter."""
+        start_date: Optional[date],
+        end_date: Optional[date],
+        context: Optional[TaskContext],
+    ):
         query = self.db.query(DailyProgressDay).filter(DailyProgressDay.user_id == user_id)
-
         if start_date:
             query = query.filter(DailyProgressDay.progress_date >= start_date)
         if end_date:
             query = query.filter(DailyProgressDay.progress_date <= end_date)
+        if context is not None:
+            query = query.filter(
+                DailyProgressDay.daily_progress_entries.any(DailyProgressEntry.context == context)
+            )
+        return query
+
+    def _with_entries(self, query, context: Optional[TaskContext]):
+        entries = DailyProgressDay.daily_progress_entries
+        if context is not None:
+            entries = entries.and_(DailyProgressEntry.context == context)
+        return query.options(selectinload(entries), selectinload(DailyProgressDay.daily_summary))
+
+    @staticmethod
+    def day_page_size(
+        start_date: Optional[date], end_date: Optional[date], limit: Optional[int] = None
+    ) -> int:
+        """Days per page: limit (capped), else a year for a closed range, else a month."""
+        if limit is not None:
+            return min(limit, MAX_DAY_PAGE_SIZE)
+        if start_date and end_date:
+            return MAX_DAY_PAGE_SIZE
+        return DEFAULT_DAY_PAGE_SIZE
+
+    def get_user_days(
+        self,
+        user_id: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        *,
+        context: Optional[TaskContext] = None,
+        with_entries: bool = False,
+    ) -> List[DailyProgressDay]:
+        """Get all daily progress days for a user with optional date range filter.
 
+        context keeps only days with an entry in that context. with_entries loads the
+        entries (only those in context, when given) and summaries of all days in one
+        extra query each, for read-only rendering with to_day_responses.
+        """
+        query = self._days_query(user_id, start_date, end_date, context)
+        if with_entries:
+            query = self._with_entries(query, context)
         return query.order_by(DailyProgressDay.progress_date.desc()).all()
 
+    def get_day_page(
+        self,
+        user_id: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        *,
+        context: Optional[TaskContext] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Page[DailyProgressDay]:
+        """Newest days first, one page at a time, with entries and summaries loaded.
+
+        Without a limit the page is the default window (see day_page_size); pass
+        next_cursor back with the same filters to load older days. total counts every
+        matching day, or is None when include_total is false.
+        """
+        query = self._days_query(user_id, start_date, end_date, context)
+        total = query.count() if include_total else None
+        days, next_cursor = keyset_page(
+            self._with_entries(query, context),
+            DAY_SORT_KEYS,
+            limit=self.day_page_size(start_date, end_date, limit),
+            cursor=cursor,
+        )
+        return Page(items=days, total=total, next_cursor=next_cursor)
+
+    def get_day_count_page(
+        self,
+        user_id: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        *,
+        context: Optional[TaskContext] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Page[DailyProgressDayCount]:
+        """Same pages as get_day_page, but only per-day entry counts from one aggregate query."""
+        days_query = self._days_query(user_id, start_date, end_date, context)
+        total_days = days_query.count() if include_total else None
+        entry_join = DailyProgressEntry.daily_progress_day_id == DailyProgressDay.id
+        if context is not None:
+            entry_join = and_(entry_join, DailyProgressEntry.context == context)
+        total = func.count(DailyProgressEntry.id)
+        completed = total.filter(DailyProgressEntry.status == DailyProgressEntryStatus.DONE)
+
+        query = (
+            days_query.outerjoin(DailyProgressEntry, entry_join)
+            .group_by(DailyProgressDay.id)
+            .with_entities(
+                DailyProgressDay.id,
+                DailyProgressDay.progress_date,
+                DailyProgressDay.title,
+                total.label("total_tasks"),
+                completed.label("completed_tasks"),
+            )
+            .order_by(*(key.ordering() for key in DAY_SORT_KEYS))
+        )
+        if cursor:
+            values = decode_cursor(cursor, len(DAY_SORT_KEYS))
+            query = query.filter(keyset_after(DAY_SORT_KEYS, values))
+        limit = self.day_page_size(start_date, end_date, limit)
+        # One extra row tells whether older days remain
+        rows = query.limit(limit + 1).all()
+
+        next_cursor = encode_cursor([rows[limit - 1].progress_date]) if len(rows) > limit else None
+        days = [
+            DailyProgressDayCount(
+                id=row.id,
+                progress_date=row.progress_date,
+                title=row.title,
+                total_tasks=row.total_tasks,
+                completed_tasks=row.completed_tasks,
+                completion_rate=_completion_rate(row.completed_tasks, row.total_tasks),
+            )
+            for row in rows[:limit]
+        ]
+        return Page(items=days, total=total_days, next_cursor=next_cursor)
+
     def get_day(self, day_id: str) -> Optional[DailyProgressDay]:
         """Get a single daily progress day by ID."""
         return self.db.query(DailyProgressDay).filter(DailyProgressDay.id == day_id).first()
@@ -87,25 +246,40 @@ class DailyProgressService:
             .first()
         )
 
-    def _merge_incoming_into_day(self, day: DailyProgressDay, day_in: DailyProgressDayCreate) -> None:
-        """Apply merge rules (title overwrite, notes append, monthly_plan_id if empty)."""
+    @staticmethod
+    def _merge_set(upsert, day_in: DailyProgressDayCreate) -> dict:
+        """ON CONFLICT DO UPDATE values for the merge rules: title overwrite, notes
+        append, monthly_plan_id only if empty."""
         data = day_in.model_dump(exclude_unset=True)
-
-        new_title = data.get("title")
-        if new_title is not None and str(new_title).strip():
-            day.title = new_title
+        table = DailyProgressDay.__table__
+        merge = {}
 
         new_notes = data.get("notes")
         if new_notes is not None and str(new_notes).strip():
             incoming = str(new_notes).strip()
-            if day.notes and str(day.notes).strip():
-                day.notes = str(day.notes).rstrip() + "\n---\n" + incoming
-            else:
-                day.notes = incoming
+            merge["notes"] = case(
+                (
+                    table.c.notes.regexp_match(r"\S"),
+                    func.regexp_replace(table.c.notes, r"\s+$", "", type_=Text) + "\n---\n" + incoming,
+                ),
+                else_=incoming,
+            )
 
-        new_mid = data.get("monthly_plan_id")
-        if day.monthly_plan_id is None and new_mid is not None:
-            day.monthly_plan_id = new_mid
+        if data.get("monthly_plan_id") is not None:
+            merge["monthly_plan_id"] = func.coalesce(
+                table.c.monthly_plan_id, upsert.excluded.monthly_plan_id
+            )
+
+        new_title = data.get("title")
+        if new_title is not None and str(new_title).strip():
+            merge["title"] = upsert.excluded.title
+        if merge:
+            merge["updated_at"] = datetime.utcnow()
+        else:
+            # DO UPDATE (not DO NOTHING) so RETURNING yields the existing row; title is
+            # unindexed, so the no-op write stays a HOT update
+            merge["title"] = table.c.title
+        return merge
 
     def create_or_merge_day(
         self, user_id: str, day_in: DailyProgressDayCreate
@@ -113,25 +287,26 @@ class DailyProgressService:
         """
         Create a new daily progress day or merge into existing same-day row.
         Returns (day, created) where created is True if a new row was inserted.
+
+        One INSERT ... ON CONFLICT (user_id, progress_date) DO UPDATE ... RETURNING,
+        so concurrent creates of the same day merge instead of failing, and the
+        caller's transaction is never rolled back.
         """
-        existing = self.get_day_by_date(user_id, day_in.progress_date)
-        if existing:
-            self._merge_incoming_into_day(existing, day_in)
-            self.db.commit()
-            self.db.refresh(existing)
-            return existing, False
-        try:
-            day = self.create_day(user_id, day_in)
-            return day, True
-        except IntegrityError:
-            self.db.rollback()
-            existing = self.get_day_by_date(user_id, day_in.progress_date)
-            if existing:
-                self._merge_incoming_into_day(existing, day_in)
-                self.db.commit()
-                self.db.refresh(existing)
-                return existing, False
-            raise
+        day_data = day_in.model_dump(exclude_unset=True)
+        if not day_data.get("title"):
+            day_data["title"] = f"{day_data['progress_date']} 每日进度"
+
+        upsert = insert(DailyProgressDay).values(**day_data, user_id=user_id)
+        upsert = upsert.on_conflict_do_update(
+            index_elements=["user_id", "progress_date"],
+            set_=self._merge_set(upsert, day_in),
+        ).returning(DailyProgressDay, (literal_column("xmax") == 0).label("created"))
+        day, created = self.db.execute(
+            upsert, execution_options={"populate_existing": True}
+        ).one()
+        mark_analytics_dirty(self.db, user_id)
+        self._commit(day)
+        return day, created
 
     def create_day(self, user_id: str, day_in: DailyProgressDayCreate) -> DailyProgressDay:
         """Create a new daily progress day."""
@@ -142,10 +317,39 @@ class DailyProgressService:
 
         day = DailyProgressDay(**day_data, user_id=user_id)
         self.db.add(day)
-        self.db.commit()
-        self.db.refresh(day)
+        self._commit(day)
         return day
 
+    def get_or_create_days(self, user_id: str, dates: Iterable[date]) -> Dict[date, DailyProgressDay]:
+        """Day containers for the given dates, inserting missing ones; does not commit.
+
+        One INSERT ... ON CONFLICT DO NOTHING for all dates (safe against a concurrent
+        create of the same day) and one SELECT, whatever the number of dates.
+        """
+        dates = sorted({d for d in dates if d is not None})
+        if not dates:
+            return {}
+
+        self.db.execute(
+            insert(DailyProgressDay).on_conflict_do_nothing(
+                index_elements=["user_id", "progress_date"]
+            ),
+            [
+                {"user_id": user_id, "progress_date": d, "title": f"{d} 每日进度"}
+                for d in dates
+            ],
+        )
+        mark_analytics_dirty(self.db, user_id)
+        days = (
+            self.db.query(DailyProgressDay)
+            .filter(
+                DailyProgressDay.user_id == user_id,
+                DailyProgressDay.progress_date.in_(dates),
+            )
+            .all()
+        )
+        return {day.progress_date: day for day in days}
+
     def update_day(self, day_id: str, day_in: DailyProgressDayUpdate) -> Optional[DailyProgressDay]:
         """Update an existing daily progress day."""
         day = self.get_day(day_id)
@@ -156,8 +360,7 @@ class DailyProgressService:
         for field, value in update_data.items():
             setattr(day, field, value)
 
-        self.db.commit()
-        self.db.refresh(day)
+        self._commit(day)
         return day
 
     def delete_day(self, day_id: str) -> bool:
@@ -166,8 +369,13 @@ class DailyProgressService:
         if not day:
             return False
 
+        user_id, progress_date = day.user_id, day.progress_date
+        # Links go with the day's entries (ON DELETE CASCADE)
+        linked_backlog_ids = self.link_summaries.backlog_ids_for_day_ids([day.id])
         self.db.delete(day)
-        self.db.commit()
+        self.stats.refresh_days(user_id, [progress_date])
+        self.link_summaries.refresh(linked_backlog_ids)
+        self._commit()
         return True
 
     def get_day_entries(self, day_id: str) -> List[DailyProgressEntry]:
@@ -204,8 +412,8 @@ class DailyProgressService:
         if backlog_task_id:
             entry.backlog_task_id = backlog_task_id
         self.db.add(entry)
-        self.db.commit()
-        self.db.refresh(entry)
+        self.stats.refresh_days(day.user_id, [day.progress_date])
+        self._commit(entry)
         return entry
 
     def update_entry(
@@ -220,8 +428,8 @@ class DailyProgressService:
         for field, value in update_data.items():
             setattr(entry, field, value)
 
-        self.db.commit()
-        self.db.refresh(entry)
+        self.stats.refresh_for_day_ids([entry.daily_progress_day_id])
+        self._commit(entry)
         return entry
 
     def delete_entry(self, entry_id: str) -> bool:
@@ -254,9 +462,12 @@ class DailyProgressService:
                     .first()
                 )
                 backlog.scheduled_date = remaining.plan_date if remaining else None
+                self.link_summaries.refresh([backlog.id])
 
+        day_id = entry.daily_progress_day_id
         self.db.delete(entry)
-        self.db.commit()
+        self.stats.refresh_for_day_ids([day_id])
+        self._commit()
         return True
 
     def update_entry_status(
@@ -268,8 +479,8 @@ class DailyProgressService:
             return None
 
         entry.status = status
-        self.db.commit()
-        self.db.refresh(entry)
+        self.stats.refresh_for_day_ids([entry.daily_progress_day_id])
+        self._commit(entry)
         return entry
 
     def to_entry_response(self, entry: DailyProgressEntry) -> DailyProgressEntryResponse:
@@ -291,13 +502,33 @@ class DailyProgressService:
         *,
         context: Optional[TaskContext] = None,
     ) -> DailyProgressDayResponse:
+        return self.to_day_responses([day], context=context)[0]
+
+    def to_day_responses(
+        self,
+        days: List[DailyProgressDay],
+        *,
+        context: Optional[TaskContext] = None,
+    ) -> List[DailyProgressDayResponse]:
+        """Day responses with backlog progress for every linked entry, fetched in one batch."""
         from app.services.backlog_task_service import BacklogTaskService
 
         entry_ids = [
-            str(entry.id) for entry in day.daily_progress_entries if entry.backlog_task_id
+            str(entry.id)
+            for day in days
+            for entry in day.daily_progress_entries
+            if entry.backlog_task_id
         ]
         progress_map = BacklogTaskService(self.db).batch_daily_task_progress(entry_ids)
+        return [self._day_response(day, progress_map, context=context) for day in days]
 
+    @staticmethod
+    def _day_response(
+        day: DailyProgressDay,
+        progress_map: Dict[str, Dict[str, Optional[int]]],
+        *,
+        context: Optional[TaskContext] = None,
+    ) -> DailyProgressDayResponse:
         entries: List[DailyProgressEntryResponse] = []
         for entry in day.daily_progress_entries:
             if context is not None and entry.context != context:
@@ -310,7 +541,7 @@ class DailyProgressService:
         completed_tasks = len(
             [entry for entry in entries if entry.status == DailyProgressEntryStatus.DONE]
         )
-        completion_rate = round(completed_tasks / total_tasks * 100, 2) if total_tasks else 0.0
+        completion_rate = _completion_rate(completed_tasks, total_tasks)
 
         base_day = DailyProgressDayResponse.model_validate(day)
         return base_day.model_copy(
@@ -4,6 +4,8 @@ from sqlalchemy import and_
 
 from app.models.monthly_plan import MonthlyPlan, MonthlyTask, TaskPriority, TaskStatus
 from app.schemas.monthly_plan import MonthlyPlanCreate, MonthlyPlanUpdate, MonthlyTaskCreate, MonthlyTaskUpdate
+from app.services.backlog_link_summary_service import BacklogLinkSummaryService
+from app.services.user_daily_stats_service import UserDailyStatsService
 
 
 class MonthlyPlanService:
@@ -67,7 +69,15 @@ class MonthlyPlanService:
         if not plan:
             return False
 
+        # daily_progress_days cascade with the plan; keep the analytics rollup in step
+        cascaded_dates = [day.progress_date for day in plan.daily_progress_days]
+        link_summaries = BacklogLinkSummaryService(self.db)
+        linked_backlog_ids = link_summaries.backlog_ids_for_day_ids(
+            [day.id for day in plan.daily_progress_days]
+        )
         self.db.delete(plan)
+        UserDailyStatsService(self.db).refresh_days(plan.user_id, cascaded_dates)
+        link_summaries.refresh(linked_backlog_ids)
         self.db.commit()
         return True
 
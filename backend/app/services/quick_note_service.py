@@ -4,12 +4,16 @@ from uuid import UUID
 from sqlalchemy import Date, cast
 from sqlalchemy.orm import Session
 
+from app.db.pagination import Page, SortKey, keyset_page
 from app.models.quick_note import QuickNote
 from app.schemas.quick_note import QuickNoteCreate, QuickNoteResponse
 from app.services.quick_note_media import cleanup_orphaned_quick_note_images
 
 MERGE_BLOCK_SEPARATOR = "\n\n"
 
+# Oldest first; served by ix_quick_notes_user_created
+LIST_SORT_KEYS = (SortKey(QuickNote.created_at), SortKey(QuickNote.id))
+
 
 def _escape_ilike(value: str) -> str:
     """Escape SQL LIKE wildcards so user input is matched literally."""
@@ -29,7 +33,9 @@ class QuickNoteService:
         date_to: date | None = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> tuple[list[QuickNote], int]:
+        cursor: str | None = None,
+        include_total: bool = True,
+    ) -> Page[QuickNote]:
         query = self.db.query(QuickNote).filter(QuickNote.user_id == user_id)
 
         if q:
@@ -42,14 +48,11 @@ class QuickNoteService:
         if date_to is not None:
             query = query.filter(cast(QuickNote.created_at, Date) <= date_to)
 
-        total = query.count()
-        notes = (
-            query.order_by(QuickNote.created_at.asc(), QuickNote.id.asc())
-            .offset(offset)
-            .limit(limit)
-            .all()
+        total = query.count() if include_total else None
+        notes, next_cursor = keyset_page(
+            query, LIST_SORT_KEYS, limit=limit, cursor=cursor, offset=offset
         )
-        return notes, total
+        return Page(items=notes, total=total, next_cursor=next_cursor)
 
     def create_note(self, user_id: UUID, data: QuickNoteCreate) -> QuickNote:
         note = QuickNote(user_id=user_id, content=data.content.strip())
@@ -0,0 +1,219 @@
+"""Keyword search across backlog tasks, quick notes, daily entries and daily summaries.
+
+Matching and ranking run in PostgreSQL with pg_trgm: ``ILIKE '%q%'`` and the
+word-similarity operator ``q <% text`` are both served by the GIN trigram indexes
+(migration 20260615_search_trgm_indexes), so a search does not scan the user's
+history. Trigrams need no word segmentation, which keeps Chinese text searchable by
+substring. Snippets and highlight offsets are cut in Python from the returned rows.
+"""
+import re
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import Date, String, Text, case, cast, func, literal, null, or_, select, union_all
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session
+
+from app.models.backlog_task import BacklogTask
+from app.models.daily_progress import DailyProgressDay, DailyProgressEntry, DailySummary
+from app.models.quick_note import QuickNote
+from app.schemas.search import SEARCH_TYPES, SearchHit, SearchResponse
+
+# Characters of context kept on each side of the first match
+SNIPPET_RADIUS = 60
+# Added to the trigram word similarity when the query occurs verbatim
+EXACT_MATCH_BOOST = 1.0
+# Weight of backlog description matches relative to title matches
+DESCRIPTION_WEIGHT = 0.5
+
+
+def _contains_pattern(q: str) -> str:
+    """ILIKE pattern matching ``q`` literally anywhere in the text."""
+    escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _matches(q: str, column):
+    """Verbatim (case-insensitive) or fuzzy word match; both use the trigram index."""
+    return or_(
+        column.ilike(_contains_pattern(q), escape="\\"),
+        literal(q, Text).op("<%")(column),
+    )
+
+
+def _score(q: str, column, weight: float = 1.0):
+    """pg_trgm word similarity, boosted when the query occurs verbatim."""
+    exact = case((column.ilike(_contains_pattern(q), escape="\\"), EXACT_MATCH_BOOST), else_=0.0)
+    return (func.word_similarity(q, func.coalesce(column, "")) + exact) * weight
+
+
+def highlight_snippet(
+    text: str, q: str, radius: int = SNIPPET_RADIUS
+) -> Tuple[str, List[List[int]]]:
+    """Excerpt of ``text`` around the first query term, and the [start, end) offsets
+    of every term occurrence within the excerpt (case-insensitive).
+
+    Fuzzy-only matches have no verbatim term; they get the start of the text and
+    no highlights.
+    """
+    text = " ".join(text.split())
+    terms = sorted(set(q.split()), key=len, reverse=True)
+    pattern = re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+    first = pattern.search(text) if terms else None
+
+    if first is None:
+        start, end = 0, 2 * radius
+    else:
+        start, end = max(0, first.start() - radius), first.end() + radius
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(text) else ""
+    excerpt = text[start:end]
+
+    highlights = []
+    if terms:
+        highlights = [
+            [match.start() + len(prefix), match.end() + len(prefix)]
+            for match in pattern.finditer(excerpt)
+        ]
+    return f"{prefix}{excerpt}{suffix}", highlights
+
+
+class SearchService:
+    """Ranked search over one user's backlog tasks, quick notes, daily entries and summaries."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def search(
+        self,
+        user_id: str,
+        q: str,
+        *,
+        types: Optional[Sequence[str]] = None,
+        limit: int = 20,
+    ) -> SearchResponse:
+        """Best ``limit`` matches of ``q`` across ``types`` (all by default), in one query."""
+        q = " ".join(q.split())
+        types = [t for t in SEARCH_TYPES if types is None or t in types]
+        if not q or not types:
+            return SearchResponse(q=q, types=types, results=[])
+
+        matchers = {
+            "backlog_task": self._backlog_task_matches,
+            "quick_note": self._quick_note_matches,
+            "daily_entry": self._daily_entry_matches,
+            "daily_summary": self._daily_summary_matches,
+        }
+        # Each branch keeps only its own best rows before the merge
+        branches = [matchers[search_type](user_id, q).limit(limit) for search_type in types]
+        ranked = union_all(*branches).subquery()
+        rows = self.db.execute(
+            select(ranked)
+            .order_by(ranked.c.score.desc(), ranked.c.occurred_on.desc(), ranked.c.id)
+            .limit(limit)
+        ).all()
+        return SearchResponse(q=q, types=types, results=[self._to_hit(row, q) for row in rows])
+
+    @staticmethod
+    def _columns(search_type: str, id_column, title, body, score, occurred_on, day_id=None):
+        return (
+            literal(search_type, String).label("type"),
+            id_column.label("id"),
+            cast(title, Text).label("title"),
+            cast(body, Text).label("body"),
+            score.label("score"),
+            cast(occurred_on, Date).label("occurred_on"),
+            (day_id if day_id is not None else cast(null(), UUID(as_uuid=True))).label(
+                "daily_progress_day_id"
+            ),
+        )
+
+    def _backlog_task_matches(self, user_id: str, q: str):
+        score = _score(q, BacklogTask.title) + _score(
+            q, BacklogTask.description, DESCRIPTION_WEIGHT
+        )
+        return (
+            select(
+                *self._columns(
+                    "backlog_task",
+                    BacklogTask.id,
+                    BacklogTask.title,
+                    BacklogTask.description,
+                    score,
+                    BacklogTask.created_at,
+                )
+            )
+            .where(
+                BacklogTask.user_id == user_id,
+                or_(_matches(q, BacklogTask.title), _matches(q, BacklogTask.description)),
+            )
+            .order_by(score.desc())
+        )
+
+    def _quick_note_matches(self, user_id: str, q: str):
+        score = _score(q, QuickNote.content)
+        return (
+            select(
+                *self._columns(
+                    "quick_note", QuickNote.id, null(), QuickNote.content, score, QuickNote.created_at
+                )
+            )
+            .where(QuickNote.user_id == user_id, _matches(q, QuickNote.content))
+            .order_by(score.desc())
+        )
+
+    def _daily_entry_matches(self, user_id: str, q: str):
+        score = _score(q, DailyProgressEntry.title)
+        return (
+            select(
+                *self._columns(
+                    "daily_entry",
+                    DailyProgressEntry.id,
+                    DailyProgressEntry.title,
+                    null(),
+                    score,
+                    DailyProgressDay.progress_date,
+                    DailyProgressDay.id,
+                )
+            )
+            .join(DailyProgressDay, DailyProgressDay.id == DailyProgressEntry.daily_progress_day_id)
+            .where(DailyProgressDay.user_id == user_id, _matches(q, DailyProgressEntry.title))
+            .order_by(score.desc())
+        )
+
+    def _daily_summary_matches(self, user_id: str, q: str):
+        score = _score(q, DailySummary.content)
+        return (
+            select(
+                *self._columns(
+                    "daily_summary",
+                    DailySummary.id,
+                    null(),
+                    DailySummary.content,
+                    score,
+                    DailyProgressDay.progress_date,
+                    DailyProgressDay.id,
+                )
+            )
+            .join(DailyProgressDay, DailyProgressDay.id == DailySummary.daily_progress_day_id)
+            .where(DailySummary.user_id == user_id, _matches(q, DailySummary.content))
+            .order_by(score.desc())
+        )
+
+    @staticmethod
+    def _to_hit(row, q: str) -> SearchHit:
+        # Backlog tasks show the description excerpt when the match is there
+        text = row.title or ""
+        body = (row.body or "").lower()
+        if body and (not row.title or any(term.lower() in body for term in q.split())):
+            text = row.body
+        snippet, highlights = highlight_snippet(text, q)
+        return SearchHit(
+            type=row.type,
+            id=row.id,
+            title=row.title,
+            snippet=snippet,
+            highlights=highlights,
+            score=round(float(row.score), 4),
+            occurred_on=row.occurred_on,
+            daily_progress_day_id=row.daily_progress_day_id,
+        )
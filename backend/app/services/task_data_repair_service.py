@@ -2,8 +2,8 @@ from datetime import datetime, time, timedelta
 from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Session, aliased
 
 from app.models.backlog_daily_link import BacklogDailyLink
 from app.models.backlog_task import BacklogTask
@@ -16,10 +16,13 @@ from app.schemas.task_data_repair import (
     FuzzyDuplicatePair,
     OrphanDailyItem,
 )
+from app.services.backlog_link_summary_service import BacklogLinkSummaryService
 from app.services.backlog_task_service import BacklogTaskService
+from app.services.user_daily_stats_service import UserDailyStatsService
 
 
 def _normalize_title(title: str) -> str:
+    # backlog_tasks.normalized_title computes the same key in PostgreSQL
     return title.strip().lower()
 
 
@@ -64,7 +67,7 @@ class TaskDataRepairService:
         tasks = (
             self.db.query(BacklogTask)
             .filter(BacklogTask.user_id == user_id)
-            .filter(func.lower(func.trim(BacklogTask.title)) == normalized)
+            .filter(BacklogTask.normalized_title == normalized)
             .order_by(BacklogTask.created_at.asc())
             .all()
         )
@@ -76,7 +79,7 @@ class TaskDataRepairService:
     def _find_duplicate_groups(self, user_id: str) -> List[DuplicateBacklogGroup]:
         rows = (
             self.db.query(
-                func.lower(func.trim(BacklogTask.title)).label("norm_title"),
+                BacklogTask.normalized_title.label("norm_title"),
                 BacklogDailyLink.plan_date,
                 BacklogTask.id,
                 BacklogTask.created_at,
@@ -117,7 +120,7 @@ class TaskDataRepairService:
         )
         by_title: Dict[str, List[BacklogTask]] = {}
         for task in tasks:
-            by_title.setdefault(_normalize_title(task.title), []).append(task)
+            by_title.setdefault(task.normalized_title, []).append(task)
 
         pairs: List[FuzzyDuplicatePair] = []
         seen: set[tuple] = set()
@@ -149,33 +152,35 @@ class TaskDataRepairService:
     def compute_fuzzy_duplicate_counts(
         self, user_id: str, task_ids: Optional[List[str]] = None
     ) -> Dict[str, int]:
-        tasks = (
-            self.db.query(BacklogTask)
-            .filter(BacklogTask.user_id == user_id)
-            .order_by(BacklogTask.created_at.asc())
-            .all()
-        )
-        id_set = set(task_ids) if task_ids else None
-        by_title: Dict[str, List[BacklogTask]] = {}
-        for task in tasks:
-            by_title.setdefault(_normalize_title(task.title), []).append(task)
+        """Per task: other tasks with the same normalized title created within the window.
 
-        counts: Dict[str, int] = {}
+        One self-join count over the (user_id, normalized_title, created_at) index, so
+        it only touches the listed tasks and their same-title neighbours.
+        """
+        if task_ids is not None and not task_ids:
+            return {}
+
+        other = aliased(BacklogTask)
         window = timedelta(days=self.FUZZY_WINDOW_DAYS)
-        for task in tasks:
-            if id_set is not None and str(task.id) not in id_set:
-                continue
-            if not task.created_at:
-                counts[str(task.id)] = 0
-                continue
-            total = 0
-            for other in by_title.get(_normalize_title(task.title), []):
-                if other.id == task.id or not other.created_at:
-                    continue
-                if abs(other.created_at - task.created_at) <= window:
-                    total += 1
-            counts[str(task.id)] = total
-        return counts
+        query = (
+            self.db.query(BacklogTask.id, func.count(other.id))
+            .outerjoin(
+                other,
+                and_(
+                    other.user_id == BacklogTask.user_id,
+                    other.normalized_title == BacklogTask.normalized_title,
+                    other.id != BacklogTask.id,
+                    other.created_at.between(
+                        BacklogTask.created_at - window, BacklogTask.created_at + window
+                    ),
+                ),
+            )
+            .filter(BacklogTask.user_id == user_id)
+            .group_by(BacklogTask.id)
+        )
+        if task_ids is not None:
+            query = query.filter(BacklogTask.id.in_(task_ids))
+        return {str(task_id): count for task_id, count in query.all()}
 
     def preview(self, user_id: str) -> DataRepairPreview:
         orphans = self._orphan_dailies(user_id)
@@ -256,18 +261,22 @@ class TaskDataRepairService:
             return False
 
         merge_links = list(self.backlog_service.get_links_for_backlog(merge_id))
+        deleted_daily_dates = set()
         for link in merge_links:
             keeper_link = self.backlog_service.get_link_for_date(keeper_id, link.plan_date)
             daily = self.db.query(DailyProgressEntry).filter(DailyProgressEntry.id == link.daily_task_id).first()
             if keeper_link:
                 if daily:
                     self.db.delete(daily)
+                    deleted_daily_dates.add(link.plan_date)
                 self.db.delete(link)
             else:
                 link.backlog_task_id = keeper.id
                 if daily:
                     daily.backlog_task_id = keeper.id
 
+        UserDailyStatsService(self.db).refresh_days(user_id, deleted_daily_dates)
+        BacklogLinkSummaryService(self.db).refresh([keeper.id])
         self.db.delete(merge)
         return True
 
@@ -0,0 +1,162 @@
+"""Maintenance of the per-user daily rollup (user_daily_stats) used by analytics."""
+
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, Iterable, Optional, Set
+
+from sqlalchemy import delete, exists, func, literal, select, union
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.cache.analytics import mark_analytics_dirty
+from app.models.daily_progress import (
+    DailyProgressDay,
+    DailyProgressEntry,
+    DailyProgressEntryPriority,
+    DailyProgressEntryStatus,
+)
+from app.models.task_context import TaskContext
+from app.models.user_daily_stats import UserDailyStats
+
+# Aggregated columns, in the order produced by _rollup_select()
+ROLLUP_COUNT_COLUMNS = [
+    "total",
+    "done",
+    "in_progress",
+    "cancelled",
+    "priority_high",
+    "priority_medium",
+    "priority_low",
+    "context_work",
+    "context_learning",
+    "context_life",
+    "estimated_minutes",
+    "actual_minutes",
+]
+
+
+def _rollup_select():
+    """SELECT user_id, progress_date, <counts>, updated_at grouped per (user, day) with entries."""
+    entry_count = func.count(DailyProgressEntry.id)
+    return (
+        select(
+            DailyProgressDay.user_id,
+            DailyProgressDay.progress_date,
+            entry_count,
+            entry_count.filter(DailyProgressEntry.status == DailyProgressEntryStatus.DONE),
+            entry_count.filter(DailyProgressEntry.status == DailyProgressEntryStatus.IN_PROGRESS),
+            entry_count.filter(DailyProgressEntry.status == DailyProgressEntryStatus.CANCELLED),
+            entry_count.filter(DailyProgressEntry.priority == DailyProgressEntryPriority.HIGH),
+            entry_count.filter(DailyProgressEntry.priority == DailyProgressEntryPriority.MEDIUM),
+            entry_count.filter(DailyProgressEntry.priority == DailyProgressEntryPriority.LOW),
+            entry_count.filter(DailyProgressEntry.context == TaskContext.WORK),
+            entry_count.filter(DailyProgressEntry.context == TaskContext.LEARNING),
+            entry_count.filter(DailyProgressEntry.context == TaskContext.LIFE),
+            func.coalesce(func.sum(DailyProgressEntry.estimated_minutes), 0),
+            func.coalesce(func.sum(DailyProgressEntry.actual_minutes), 0),
+            literal(datetime.utcnow()),
+        )
+        .join(DailyProgressEntry, DailyProgressEntry.daily_progress_day_id == DailyProgressDay.id)
+        .group_by(DailyProgressDay.user_id, DailyProgressDay.progress_date)
+    )
+
+
+class UserDailyStatsService:
+    """Recompute user_daily_stats rows from daily_progress_entries.
+
+    Callers invoke refresh_* inside their own transaction, after mutating entries and
+    before committing, so the rollup commits (or rolls back) together with the change.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def refresh_days(self, user_id, dates: Iterable[date]) -> None:
+        """Recompute the rollup rows for one user's given dates."""
+        dates = sorted({d for d in dates if d is not None})
+        if not dates:
+            return
+
+        # SessionLocal has autoflush disabled; make pending entry changes visible
+        self.db.flush()
+
+        self._upsert(
+            _rollup_select().where(
+                DailyProgressDay.user_id == user_id,
+                DailyProgressDay.progress_date.in_(dates),
+            )
+        )
+        self._delete_empty(
+            UserDailyStats.user_id == user_id,
+            UserDailyStats.progress_date.in_(dates),
+        )
+        mark_analytics_dirty(self.db, user_id)
+
+    def refresh_for_day_ids(self, day_ids: Iterable) -> None:
+        """Recompute the rollup for the (user, date) pairs of existing daily progress days."""
+        day_ids = {day_id for day_id in day_ids if day_id is not None}
+        if not day_ids:
+            return
+
+        rows = (
+            self.db.query(DailyProgressDay.user_id, DailyProgressDay.progress_date)
+            .filter(DailyProgressDay.id.in_(day_ids))
+            .all()
+        )
+        dates_by_user: Dict[object, Set[date]] = defaultdict(set)
+        for user_id, progress_date in rows:
+            dates_by_user[user_id].add(progress_date)
+        for user_id, dates in dates_by_user.items():
+            self.refresh_days(user_id, dates)
+
+    def rebuild(self, user_id: Optional[str] = None) -> int:
+        """Rebuild the rollup from scratch for one user (or everyone). Returns rows written."""
+        self.db.flush()
+
+        stale = delete(UserDailyStats)
+        source = _rollup_select()
+        if user_id is not None:
+            stale = stale.where(UserDailyStats.user_id == user_id)
+            source = source.where(DailyProgressDay.user_id == user_id)
+            affected = [user_id]
+        else:
+            # Everyone with rollup rows now or after the rebuild
+            affected = self.db.execute(
+                union(select(UserDailyStats.user_id), select(DailyProgressDay.user_id))
+            ).scalars()
+
+        for affected_user_id in affected:
+            mark_analytics_dirty(self.db, affected_user_id)
+        self.db.execute(stale.execution_options(synchronize_session=False))
+        return self._upsert(source)
+
+    def _upsert(self, source) -> int:
+        stmt = insert(UserDailyStats).from_select(
+            ["user_id", "progress_date", *ROLLUP_COUNT_COLUMNS, "updated_at"],
+            source,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserDailyStats.user_id, UserDailyStats.progress_date],
+            set_={
+                name: stmt.excluded[name]
+                for name in [*ROLLUP_COUNT_COLUMNS, "updated_at"]
+            },
+        )
+        return self.db.execute(stmt).rowcount
+
+    def _delete_empty(self, *criteria) -> None:
+        """Drop rollup rows whose day no longer has any entries (or no longer exists)."""
+        has_entries = (
+            exists()
+            .where(
+                DailyProgressDay.user_id == UserDailyStats.user_id,
+                DailyProgressDay.progress_date == UserDailyStats.progress_date,
+                DailyProgressEntry.daily_progress_day_id == DailyProgressDay.id,
+            )
+        )
+        self.db.execute(
+            delete(UserDailyStats)
+            .where(*criteria, ~has_entries)
+            .execution_options(synchronize_session=False)
+        )
+
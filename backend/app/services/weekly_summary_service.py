@@ -1,10 +1,13 @@
 """Weekly summary service for generating and managing weekly summaries."""
 from datetime import datetime, date, timedelta
-from typing import List, Dict, Any, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from typing import List, Dict, Any, Optional, Tuple
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, func
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by, insert
 import logging
+import uuid
 
+from app.db.pagination import Page, SortKey, keyset_page
 from app.models.weekly_summary import WeeklySummary
 from app.models.daily_progress import (
     DailyProgressDay,
@@ -20,6 +23,64 @@ from app.schemas.weekly_summary import (
 
 logger = logging.getLogger(__name__)
 
+# 最新的周在前；由 ix_weekly_summaries_user_start_date 索引支撑
+LIST_SORT_KEYS = (
+    SortKey(WeeklySummary.start_date, descending=True),
+    SortKey(WeeklySummary.id, descending=True),
+)
+
+# 每周批量生成时每批处理的用户数
+WEEKLY_SUMMARY_CHUNK_SIZE = 500
+
+
+def _empty_priority_distribution() -> Dict[str, Dict[str, int]]:
+    return {"high": {"total": 0, "completed": 0},
+            "medium": {"total": 0, "completed": 0},
+            "low": {"total": 0, "completed": 0}}
+
+
+def _creation_order(entry: DailyProgressEntry) -> tuple:
+    # PostgreSQL 升序排序中 NULL 在最后
+    return entry.created_at is None, entry.created_at or datetime.min, entry.id
+
+
+def _day_data(
+    day_id: Any,
+    progress_date: date,
+    title: Optional[str],
+    total_tasks: int,
+    completed_tasks: int,
+    daily_summary: Optional[Dict[str, Any]],
+    tasks: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """stats.daily_data 中的一天"""
+    return {
+        "date": progress_date.isoformat(),
+        "daily_progress_day_id": str(day_id),
+        "title": title,
+        "total_tasks": total_tasks,
+        "completed_tasks": completed_tasks,
+        "completion_rate": round(completed_tasks / total_tasks * 100, 2) if total_tasks else 0.0,
+        "daily_summary": daily_summary,
+        "tasks": tasks
+    }
+
+
+def _week_stats(
+    daily_data: List[Dict[str, Any]], priority_distribution: Dict[str, Dict[str, int]]
+) -> Dict[str, Any]:
+    return {
+        "daily_data": daily_data,
+        "priority_distribution": priority_distribution,
+        "task_trend": [
+            {
+                "date": item["date"],
+                "completion_rate": item["completion_rate"]
+            }
+            for item in sorted(daily_data, key=lambda x: x["date"])
+        ]
+    }
+
 
 class WeeklySummaryService:
     """Service for weekly summary operations."""
@@ -32,15 +93,21 @@ class WeeklySummaryService:
         user_id: str,
         year: Optional[int] = None,
         skip: int = 0,
-        limit: int = 20
-    ) -> List[WeeklySummary]:
-        """获取用户的所有周总结（分页）"""
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Page[WeeklySummary]:
+        """获取用户的周总结（分页；传入 cursor 时按游标翻页，skip 被忽略）"""
         query = self.db.query(WeeklySummary).filter(WeeklySummary.user_id == user_id)
 
         if year:
             query = query.filter(WeeklySummary.year == year)
 
-        return query.order_by(WeeklySummary.start_date.desc()).offset(skip).limit(limit).all()
+        total = query.count() if include_total else None
+        summaries, next_cursor = keyset_page(
+            query, LIST_SORT_KEYS, limit=limit, cursor=cursor, offset=skip
+        )
+        return Page(items=summaries, total=total, next_cursor=next_cursor)
 
     def get_weekly_summary_by_id(self, summary_id: str) -> Optional[WeeklySummary]:
         """根据ID获取周总结"""
@@ -83,6 +150,62 @@ class WeeklySummaryService:
 
         return year, week_number, last_monday, last_sunday
 
+    @staticmethod
+    def build_week_stats(
+        daily_progress_days: List[DailyProgressDay],
+    ) -> tuple[Dict[str, Any], int, int]:
+        """
+        周统计数据（stats JSON）及总任务数、已完成数
+
+        每个条目只遍历一次；daily_progress_entries 与 daily_summary 应已预加载。
+        """
+        daily_data = []
+        total_tasks = 0
+        completed_tasks = 0
+        priority_distribution = _empty_priority_distribution()
+
+        for day in daily_progress_days:
+            summary_data = None
+            if day.daily_summary:
+                summary_data = {
+                    "summary_type": day.daily_summary.summary_type.value,
+                    "content": day.daily_summary.content
+                }
+
+            tasks_data = []
+            day_completed = 0
+            # 按创建顺序，与 generate_weekly_summaries_chunk 一致
+            for task in sorted(day.daily_progress_entries, key=_creation_order):
+                priority = task.priority.value
+                done = task.status == DailyProgressEntryStatus.DONE
+                tasks_data.append({
+                    "title": task.title,
+                    "status": task.status.value,
+                    "priority": priority
+                })
+                day_completed += done
+                # 统计优先级分布
+                if priority in priority_distribution:
+                    priority_distribution[priority]["total"] += 1
+                    priority_distribution[priority]["completed"] += done
+
+            daily_data.append(
+                _day_data(
+                    day.id,
+                    day.progress_date,
+                    day.title,
+                    len(tasks_data),
+                    day_completed,
+                    summary_data,
+                    tasks_data,
+                )
+            )
+            total_tasks += len(tasks_data)
+            completed_tasks += day_completed
+
+        stats = _week_stats(daily_data, priority_distribution)
+        return stats, total_tasks, completed_tasks
+
     def generate_weekly_summary(
         self,
         user_id: str,
@@ -104,87 +227,27 @@ class WeeklySummaryService:
         """
         start_date, end_date = self.get_week_date_range(year, week_number)
 
-        # 检查该周是否有日计划数据
-        daily_progress_days = self.db.query(DailyProgressDay).filter(
+        # 该周的每日进度、条目和每日总结：共三次查询
+        daily_progress_days = self.db.query(DailyProgressDay).options(
+            selectinload(DailyProgressDay.daily_progress_entries),
+            selectinload(DailyProgressDay.daily_summary),
+        ).filter(
             and_(
                 DailyProgressDay.user_id == user_id,
                 DailyProgressDay.progress_date >= start_date,
                 DailyProgressDay.progress_date <= end_date
             )
-        ).all()
+        ).order_by(DailyProgressDay.progress_date).all()
 
         if not daily_progress_days:
             logger.info(f"User {user_id} has no daily progress for week {year}-{week_number}")
             return None
 
-        # 聚合每天的数据
-        daily_data = []
-        total_tasks = 0
-        completed_tasks = 0
-        priority_distribution = {"high": {"total": 0, "completed": 0},
-                                  "medium": {"total": 0, "completed": 0},
-                                  "low": {"total": 0, "completed": 0}}
-
-        for day in daily_progress_days:
-            # 获取该日的每日总结（如果有）
-            daily_summary = self.db.query(DailySummary).filter(
-                DailySummary.daily_progress_day_id == day.id
-            ).first()
-
-            summary_data = None
-            if daily_summary:
-                summary_data = {
-                    "summary_type": daily_summary.summary_type.value,
-                    "content": daily_summary.content
-                }
-
-            # Get tasks for this day
-            tasks_data = []
-            for task in day.daily_progress_entries:
-                tasks_data.append({
-                    "title": task.title,
-                    "status": task.status.value,
-                    "priority": task.priority.value
-                })
-
-            daily_data.append({
-                "date": day.progress_date.isoformat(),
-                "daily_progress_day_id": str(day.id),
-                "title": day.title,
-                "total_tasks": day.total_tasks,
-                "completed_tasks": day.completed_tasks,
-                "completion_rate": day.completion_rate,
-                "daily_summary": summary_data,
-                "tasks": tasks_data
-            })
-
-            total_tasks += day.total_tasks
-            completed_tasks += day.completed_tasks
-
-            # 统计优先级分布
-            for task in day.daily_progress_entries:
-                priority = task.priority.value
-                if priority in priority_distribution:
-                    priority_distribution[priority]["total"] += 1
-                    if task.status == DailyProgressEntryStatus.DONE:
-                        priority_distribution[priority]["completed"] += 1
+        stats, total_tasks, completed_tasks = self.build_week_stats(daily_progress_days)
 
         # 计算完成率
         completion_rate = round((completed_tasks / total_tasks * 100), 2) if total_tasks > 0 else 0.0
 
-        # 构建统计数据
-        stats = {
-            "daily_data": daily_data,
-            "priority_distribution": priority_distribution,
-            "task_trend": [
-                {
-                    "date": item["date"],
-                    "completion_rate": item["completion_rate"]
-                }
-                for item in sorted(daily_data, key=lambda x: x["date"])
-            ]
-        }
-
         # 检查是否已存在周总结
         existing_summary = self.get_weekly_summary_by_week(user_id, year, week_number)
 
@@ -220,6 +283,154 @@ class WeeklySummaryService:
             logger.info(f"Created weekly summary for user {user_id}, week {year}-{week_number}")
             return new_summary
 
+    def generate_weekly_summaries_chunk(
+        self,
+        year: int,
+        week_number: int,
+        *,
+        after_user_id: Optional[str] = None,
+        chunk_size: int = WEEKLY_SUMMARY_CHUNK_SIZE,
+        task_id: Optional[str] = None
+    ) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+        """
+        为一批用户生成周总结（集合式，供每周批量任务使用）
+
+        取 after_user_id 之后（按 user_id 排序）在该周有每日进度的 chunk_size 个用户；
+        每日统计与优先级分布各用一次分组查询，周总结用一条多行 upsert 写入。
+        只执行不提交，由调用方提交。
+
+        Returns:
+            ([(user_id, summary_id)], 检查点)；检查点为本批最后一个 user_id，没有剩余用户时为 None
+        """
+        start_date, end_date = self.get_week_date_range(year, week_number)
+        in_week = and_(
+            DailyProgressDay.progress_date >= start_date,
+            DailyProgressDay.progress_date <= end_date
+        )
+
+        user_query = self.db.query(DailyProgressDay.user_id).filter(in_week)
+        if after_user_id:
+            user_query = user_query.filter(DailyProgressDay.user_id > after_user_id)
+        user_ids = [
+            row.user_id
+            for row in user_query.distinct().order_by(DailyProgressDay.user_id).limit(chunk_size)
+        ]
+        if not user_ids:
+            return [], None
+        in_chunk = and_(DailyProgressDay.user_id.in_(user_ids), in_week)
+        done = DailyProgressEntry.status == DailyProgressEntryStatus.DONE
+
+        # 每天一行：计数、每日总结和条目列表
+        task = func.json_build_object(
+            "title", DailyProgressEntry.title,
+            "status", DailyProgressEntry.status,
+            "priority", DailyProgressEntry.priority
+        )
+        tasks = func.json_agg(
+            aggregate_order_by(task, DailyProgressEntry.created_at, DailyProgressEntry.id),
+            type_=JSON
+        ).filter(DailyProgressEntry.id.isnot(None))
+        day_rows = self.db.query(
+            DailyProgressDay.user_id,
+            DailyProgressDay.id,
+            DailyProgressDay.progress_date,
+            DailyProgressDay.title,
+            func.count(DailyProgressEntry.id).label("total_tasks"),
+            func.count(DailyProgressEntry.id).filter(done).label("completed_tasks"),
+            DailySummary.summary_type,
+            DailySummary.content,
+            tasks.label("tasks"),
+        ).outerjoin(
+            DailyProgressEntry, DailyProgressEntry.daily_progress_day_id == DailyProgressDay.id
+        ).outerjoin(
+            DailySummary, DailySummary.daily_progress_day_id == DailyProgressDay.id
+        ).filter(in_chunk).group_by(
+            DailyProgressDay.id, DailySummary.id
+        ).order_by(DailyProgressDay.user_id, DailyProgressDay.progress_date).all()
+
+        # 每个用户每个优先级一行
+        priority_rows = self.db.query(
+            DailyProgressDay.user_id,
+            DailyProgressEntry.priority,
+            func.count(DailyProgressEntry.id).label("total"),
+            func.count(DailyProgressEntry.id).filter(done).label("completed"),
+        ).join(
+            DailyProgressEntry, DailyProgressEntry.daily_progress_day_id == DailyProgressDay.id
+        ).filter(in_chunk).group_by(
+            DailyProgressDay.user_id, DailyProgressEntry.priority
+        ).all()
+
+        daily_data: Dict[Any, List[Dict[str, Any]]] = {user_id: [] for user_id in user_ids}
+        for row in day_rows:
+            summary_data = None
+            if row.summary_type is not None:
+                summary_data = {"summary_type": row.summary_type.value, "content": row.content}
+            daily_data[row.user_id].append(
+                _day_data(
+                    row.id,
+                    row.progress_date,
+                    row.title,
+                    row.total_tasks,
+                    row.completed_tasks,
+                    summary_data,
+                    row.tasks or [],
+                )
+            )
+        priority_distribution = {user_id: _empty_priority_distribution() for user_id in user_ids}
+        for row in priority_rows:
+            if row.priority is not None:
+                priority_distribution[row.user_id][row.priority.value] = {
+                    "total": row.total,
+                    "completed": row.completed,
+                }
+
+        now = datetime.utcnow()
+        values = []
+        for user_id in user_ids:
+            total_tasks = sum(item["total_tasks"] for item in daily_data[user_id])
+            completed_tasks = sum(item["completed_tasks"] for item in daily_data[user_id])
+            values.append({
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                "year": year,
+                "week_number": week_number,
+                "start_date": start_date,
+                "end_date": end_date,
+                "stats": _week_stats(daily_data[user_id], priority_distribution[user_id]),
+                "total_tasks": total_tasks,
+                "completed_tasks": completed_tasks,
+                "completion_rate": (
+                    round((completed_tasks / total_tasks * 100), 2) if total_tasks > 0 else 0.0
+                ),
+                "auto_generated": task_id,
+                "created_at": now,
+                "updated_at": now,
+            })
+
+        # 已有的周总结只刷新统计，保留 summary_text
+        upsert = insert(WeeklySummary).values(values)
+        upsert = upsert.on_conflict_do_update(
+            index_elements=["user_id", "year", "week_number"],
+            set_={
+                column: upsert.excluded[column]
+                for column in (
+                    "stats",
+                    "total_tasks",
+                    "completed_tasks",
+                    "completion_rate",
+                    "auto_generated",
+                    "updated_at",
+                )
+            },
+        ).returning(WeeklySummary.user_id, WeeklySummary.id)
+        written = [(str(row.user_id), str(row.id)) for row in self.db.execute(upsert)]
+
+        logger.info(
+            f"Generated {len(written)} weekly summaries for week {year}-{week_number} "
+            f"(users {user_ids[0]} to {user_ids[-1]})"
+        )
+        return written, str(user_ids[-1])
+
     def create_weekly_summary(
         self,
         user_id: str,
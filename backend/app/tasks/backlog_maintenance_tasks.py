@@ -0,0 +1,76 @@
+"""Celery tasks for backlog data maintenance."""
+from typing import Any, Dict, Optional
+
+from celery.exceptions import SoftTimeLimitExceeded
+from celery.utils.log import get_task_logger
+
+from app.core.celery import celery_app
+from app.db.session import SessionLocal
+from app.services.backlog_task_service import PROGRESS_BACKFILL_CHUNK_SIZE, BacklogTaskService
+
+logger = get_task_logger(__name__)
+
+
+@celery_app.task(bind=True, name="app.tasks.backlog_maintenance_tasks.backfill_progress_snapshots")
+def backfill_progress_snapshots(
+    self,
+    user_id: Optional[str] = None,
+    after_id: Optional[str] = None,
+    chunk_size: int = PROGRESS_BACKFILL_CHUNK_SIZE,
+    updated: int = 0,
+) -> Dict[str, Any]:
+    """
+    Backfill missing progress_after on backlog daily links, one committed chunk of
+    backlog tasks at a time, so row locks never outlive a chunk.
+
+    Progress (links updated, checkpoint) is reported as the PROGRESS state after each
+    chunk. Pass a reported checkpoint as after_id to resume; when the soft time limit
+    hits, the task re-queues itself from its last checkpoint.
+    """
+    scope = f"user {user_id}" if user_id else "all users"
+    logger.info(f"Backfilling progress snapshots for {scope} after {after_id or 'start'}")
+
+    db = SessionLocal()
+    try:
+        service = BacklogTaskService(db)
+        chunks = 0
+        while True:
+            count, checkpoint = service.backfill_progress_snapshots_chunk(
+                user_id=user_id, after_id=after_id, chunk_size=chunk_size
+            )
+            if checkpoint is None:
+                break
+            db.commit()
+            chunks += 1
+            updated += count
+            after_id = checkpoint
+            self.update_state(
+                state="PROGRESS",
+                meta={
+                    "user_id": user_id,
+                    "updated": updated,
+                    "chunks": chunks,
+                    "checkpoint": after_id,
+                },
+            )
+
+        logger.info(f"Backfilled {updated} progress snapshots for {scope} in {chunks} chunks")
+        return {"user_id": user_id, "updated": updated, "chunks": chunks, "done": True}
+
+    except SoftTimeLimitExceeded:
+        db.rollback()
+        logger.warning(f"Progress snapshot backfill hit the time limit; resuming after {after_id}")
+        continuation = backfill_progress_snapshots.delay(user_id, after_id, chunk_size, updated)
+        return {
+            "user_id": user_id,
+            "updated": updated,
+            "checkpoint": after_id,
+            "done": False,
+            "continuation_task_id": continuation.id,
+        }
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to backfill progress snapshots after {after_id}: {str(e)}")
+        raise
+    finally:
+        db.close()
@@ -1,15 +1,19 @@
 """Celery tasks for weekly summary generation."""
 from datetime import date
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+from celery.exceptions import SoftTimeLimitExceeded
 from celery.utils.log import get_task_logger
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from app.core.celery import celery_app
 from app.db.session import SessionLocal
-from app.services.weekly_summary_service import WeeklySummaryService
+from app.services.weekly_summary_service import WEEKLY_SUMMARY_CHUNK_SIZE, WeeklySummaryService
 from app.services.email_service import EmailService
 from app.services.feishu_service import FeishuService
 from app.models.systemSettings import SystemSettings
+from app.models.user import User
+from app.models.weekly_summary import WeeklySummary
 
 logger = get_task_logger(__name__)
 
@@ -18,7 +22,7 @@ logger = get_task_logger(__name__)
 def generate_all_weekly_summaries() -> Dict[str, Any]:
     """
     为所有活跃用户生成上周的周总结
-    每周一早上5:00自动触发
+    每周一早上5:00自动触发；按批生成，见 generate_weekly_summaries_bulk
     """
     logger.info("Starting weekly summary generation task")
 
@@ -31,47 +35,223 @@ def generate_all_weekly_summaries() -> Dict[str, Any]:
 
         logger.info(f"Generating summaries for week {year}-{week_number} ({start_date} to {end_date})")
 
-        # 获取所有有日计划的活跃用户
-        active_user_ids = service.get_active_users_with_daily_progress_days(start_date, end_date)
-        logger.info(f"Found {len(active_user_ids)} active users")
-
-        results = {
+        bulk_task_id = generate_weekly_summaries_bulk.delay(year, week_number).id
+        logger.info(f"Queued bulk weekly summary generation, task ID: {bulk_task_id}")
+        return {
             "year": year,
             "week_number": week_number,
             "start_date": str(start_date),
             "end_date": str(end_date),
-            "total_users": len(active_user_ids),
-            "success_count": 0,
-            "skipped_count": 0,
-            "failed_count": 0,
-            "errors": []
+            "bulk_task_id": bulk_task_id,
         }
 
-        # 为每个用户生成周总结
-        for user_id in active_user_ids:
-            try:
-                # 为当前用户生成周总结
-                task_id = generate_user_weekly_summary.delay(user_id, year, week_number).id
-                logger.info(f"Queued weekly summary generation for user {user_id}, task ID: {task_id}")
+    except Exception as e:
+        logger.error(f"Failed to generate weekly summaries: {str(e)}")
+        raise
+    finally:
+        db.close()
+
 
-            except Exception as e:
-                logger.error(f"Failed to queue weekly summary for user {user_id}: {str(e)}")
-                results["failed_count"] += 1
-                results["errors"].append({
-                    "user_id": user_id,
-                    "error": str(e)
-                })
+@celery_app.task(bind=True, name="app.tasks.weekly_summary_tasks.generate_weekly_summaries_bulk")
+def generate_weekly_summaries_bulk(
+    self,
+    year: int,
+    week_number: int,
+    after_user_id: Optional[str] = None,
+    chunk_size: int = WEEKLY_SUMMARY_CHUNK_SIZE,
+    generated: int = 0,
+) -> Dict[str, Any]:
+    """
+    为该周有每日进度的所有用户生成周总结，每批 chunk_size 个用户
 
-        logger.info(f"Weekly summary generation task completed: {results}")
-        return results
+    每批几次分组查询加一条多行 upsert，批后提交，并把该批的通知交给
+    send_weekly_summary_notifications。进度（已生成数、检查点）以 PROGRESS 状态上报；
+    传入检查点作为 after_user_id 可续跑，触发软超时时任务从检查点重新入队。
+    """
+    logger.info(
+        f"Bulk generating weekly summaries for week {year}-{week_number} "
+        f"after {after_user_id or 'start'}"
+    )
+
+    db = SessionLocal()
+    try:
+        service = WeeklySummaryService(db)
+        chunks = 0
+        while True:
+            written, checkpoint = service.generate_weekly_summaries_chunk(
+                year,
+                week_number,
+                after_user_id=after_user_id,
+                chunk_size=chunk_size,
+                task_id=self.request.id,
+            )
+            if checkpoint is None:
+                break
+            db.commit()
+            summary_ids = [summary_id for _user_id, summary_id in written]
+            send_weekly_summary_notifications.delay(summary_ids)
+            chunks += 1
+            generated += len(written)
+            after_user_id = checkpoint
+            self.update_state(
+                state="PROGRESS",
+                meta={
+                    "year": year,
+                    "week_number": week_number,
+                    "generated": generated,
+                    "chunks": chunks,
+                    "checkpoint": after_user_id,
+                },
+            )
+
+        logger.info(
+            f"Generated {generated} weekly summaries for week {year}-{week_number} "
+            f"in {chunks} chunks"
+        )
+        return {
+            "year": year,
+            "week_number": week_number,
+            "generated": generated,
+            "chunks": chunks,
+            "done": True,
+        }
 
+    except SoftTimeLimitExceeded:
+        db.rollback()
+        logger.warning(
+            f"Bulk weekly summary generation hit the time limit; resuming after {after_user_id}"
+        )
+        continuation = generate_weekly_summaries_bulk.delay(
+            year, week_number, after_user_id, chunk_size, generated
+        )
+        return {
+            "year": year,
+            "week_number": week_number,
+            "generated": generated,
+            "checkpoint": after_user_id,
+            "done": False,
+            "continuation_task_id": continuation.id,
+        }
     except Exception as e:
-        logger.error(f"Failed to generate weekly summaries: {str(e)}")
+        db.rollback()
+        logger.error(f"Failed to bulk generate weekly summaries after {after_user_id}: {str(e)}")
         raise
     finally:
         db.close()
 
 
+@celery_app.task(name="app.tasks.weekly_summary_tasks.send_weekly_summary_notifications")
+def send_weekly_summary_notifications(summary_ids: List[str]) -> Dict[str, Any]:
+    """
+    发送一批周总结的邮件 / 飞书通知（批量生成的通知阶段）
+
+    只加载开启了通知的用户的周总结、用户和设置
+    """
+    db = SessionLocal()
+    try:
+        rows = db.query(WeeklySummary, User, SystemSettings).join(
+            User, User.id == WeeklySummary.user_id
+        ).join(
+            SystemSettings, SystemSettings.user_id == WeeklySummary.user_id
+        ).filter(
+            WeeklySummary.id.in_(summary_ids),
+            or_(
+                SystemSettings.weekly_summary_email_enabled,
+                SystemSettings.weekly_summary_feishu_enabled
+            )
+        ).all()
+
+        for summary, user, system_settings in rows:
+            _notify_weekly_summary(summary, user, system_settings)
+
+        logger.info(
+            f"Sent weekly summary notifications for {len(rows)} of {len(summary_ids)} summaries"
+        )
+        return {"summaries": len(summary_ids), "notified": len(rows)}
+    finally:
+        db.close()
+
+
+def _notify_weekly_summary(
+    summary: WeeklySummary, user: User, system_settings: SystemSettings
+) -> None:
+    """按用户设置发送周总结的邮件和飞书通知；发送失败只记录日志"""
+    user_id = str(user.id)
+    year, week_number = summary.year, summary.week_number
+
+    # Send email notification if enabled
+    if system_settings.weekly_summary_email_enabled:
+        try:
+            email_service = EmailService()
+
+            # Use custom email if provided, otherwise use user's registration email
+            recipient_email = (
+                system_settings.weekly_summary_email
+                if system_settings.weekly_summary_email
+                else user.email
+            )
+
+            if recipient_email:
+                subject = f"您的{year}年第{week_number}周总结已生成"
+                body = f"""
+                <h2>周总结已生成</h2>
+                <p>您好 {user.username}，</p>
+                <p>您的{year}年第{week_number}周总结已自动生成。</p>
+                <p><strong>统计概览：</strong></p>
+                <ul>
+                    <li>时间范围：{summary.start_date} 至 {summary.end_date}</li>
+                    <li>总任务数：{summary.total_tasks}</li>
+                    <li>已完成：{summary.completed_tasks}</li>
+                    <li>完成率：{summary.completion_rate}%</li>
+                </ul>
+                <p>请登录系统查看详细报告。</p>
+                """
+
+                email_service.send_email(
+                    to_email=recipient_email,
+                    subject=subject,
+                    body=body
+                )
+                logger.info(f"Email notification sent to {recipient_email} for user {user_id}")
+        except Exception as e:
+            logger.error(f"Failed to send email notification to user {user_id}: {str(e)}")
+
+    # Send Feishu notification if enabled
+    if system_settings.weekly_summary_feishu_enabled:
+        try:
+            if (system_settings.feishu_app_id and
+                system_settings.feishu_app_secret and
+                system_settings.feishu_chat_id):
+
+                feishu_service = FeishuService(
+                    app_id=system_settings.feishu_app_id,
+                    app_secret=system_settings.feishu_app_secret
+                )
+
+                # TODO: Generate proper summary URL based on your frontend URL
+                summary_url = f"https://your-app.com/weekly-summaries/{summary.id}"
+
+                success, msg_id, error = feishu_service.send_weekly_summary_card(
+                    chat_id=system_settings.feishu_chat_id,
+                    username=user.username,
+                    year=year,
+                    week_number=week_number,
+                    start_date=str(summary.start_date),
+                    end_date=str(summary.end_date),
+                    total_tasks=summary.total_tasks,
+                    completed_tasks=summary.completed_tasks,
+                    completion_rate=summary.completion_rate,
+                    summary_url=summary_url
+                )
+
+                if success:
+                    logger.info(f"Feishu notification sent for user {user_id}, message ID: {msg_id}")
+                else:
+                    logger.error(f"Failed to send Feishu notification for user {user_id}: {error}")
+        except Exception as e:
+            logger.error(f"Failed to send Feishu notification to user {user_id}: {str(e)}")
+
+
 @celery_app.task(name="app.tasks.weekly_summary_tasks.generate_user_weekly_summary")
 def generate_user_weekly_summary(user_id: str, year: int, week_number: int) -> Dict[str, Any]:
     """
@@ -81,7 +261,6 @@ def generate_user_weekly_summary(user_id: str, year: int, week_number: int) -> D
 
     db = SessionLocal()
     try:
-        from app.models.user import User
         service = WeeklySummaryService(db)
 
         # 生成周总结
@@ -102,77 +281,8 @@ def generate_user_weekly_summary(user_id: str, year: int, week_number: int) -> D
 
             user = db.query(User).filter(User.id == user_id).first()
 
-            # Send email notification if enabled
-            if system_settings and system_settings.weekly_summary_email_enabled and user:
-                try:
-                    email_service = EmailService()
-
-                    # Use custom email if provided, otherwise use user's registration email
-                    recipient_email = (
-                        system_settings.weekly_summary_email
-                        if system_settings.weekly_summary_email
-                        else user.email
-                    )
-
-                    if recipient_email:
-                        subject = f"您的{year}年第{week_number}周总结已生成"
-                        body = f"""
-                        <h2>周总结已生成</h2>
-                        <p>您好 {user.username}，</p>
-                        <p>您的{year}年第{week_number}周总结已自动生成。</p>
-                        <p><strong>统计概览：</strong></p>
-                        <ul>
-                            <li>时间范围：{summary.start_date} 至 {summary.end_date}</li>
-                            <li>总任务数：{summary.total_tasks}</li>
-                            <li>已完成：{summary.completed_tasks}</li>
-                            <li>完成率：{summary.completion_rate}%</li>
-                        </ul>
-                        <p>请登录系统查看详细报告。</p>
-                        """
-
-                        email_service.send_email(
-                            to_email=recipient_email,
-                            subject=subject,
-                            body=body
-                        )
-                        logger.info(f"Email notification sent to {recipient_email} for user {user_id}")
-                except Exception as e:
-                    logger.error(f"Failed to send email notification to user {user_id}: {str(e)}")
-
-            # Send Feishu notification if enabled
-            if system_settings and system_settings.weekly_summary_feishu_enabled and user:
-                try:
-                    if (system_settings.feishu_app_id and
-                        system_settings.feishu_app_secret and
-                        system_settings.feishu_chat_id):
-
-                        feishu_service = FeishuService(
-                            app_id=system_settings.feishu_app_id,
-                            app_secret=system_settings.feishu_app_secret
-                        )
-
-                        # TODO: Generate proper summary URL based on your frontend URL
-                        summary_url = f"https://your-app.com/weekly-summaries/{summary.id}"
-
-                        success, msg_id, error = feishu_service.send_weekly_summary_card(
-                            chat_id=system_settings.feishu_chat_id,
-                            username=user.username,
-                            year=year,
-                            week_number=week_number,
-                            start_date=str(summary.start_date),
-                            end_date=str(summary.end_date),
-                            total_tasks=summary.total_tasks,
-                            completed_tasks=summary.completed_tasks,
-                            completion_rate=summary.completion_rate,
-                            summary_url=summary_url
-                        )
-
-                        if success:
-                            logger.info(f"Feishu notification sent for user {user_id}, message ID: {msg_id}")
-                        else:
-                            logger.error(f"Failed to send Feishu notification for user {user_id}: {error}")
-                except Exception as e:
-                    logger.error(f"Failed to send Feishu notification to user {user_id}: {str(e)}")
+            if system_settings and user:
+                _notify_weekly_summary(summary, user, system_settings)
 
             return {
                 "user_id": user_id,
@@ -0,0 +1,50 @@
+"""Verify or rebuild the occurrence summary columns on backlog_tasks from backlog_daily_links."""
+import argparse
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import app.models  # noqa: F401  (register all mappers)
+from app.models.systemSettings import SystemSettings  # noqa: F401
+from app.db.session import SessionLocal
+from app.services.backlog_link_summary_service import BacklogLinkSummaryService
+
+
+def rebuild_backlog_link_summary(user_id: str = None, check: bool = False) -> int:
+    """Recompute stale summaries (or only count them with check=True). Returns the stale count."""
+    db = SessionLocal()
+
+    try:
+        summaries = BacklogLinkSummaryService(db)
+        scope = f"user {user_id}" if user_id else "all users"
+        if check:
+            stale = summaries.verify(user_id)
+            print(f"{'✗' if stale else '✓'} {stale} backlog tasks with a stale occurrence summary ({scope})")
+            return stale
+
+        rows = summaries.rebuild(user_id)
+        db.commit()
+        print(f"✓ Rebuilt backlog occurrence summaries for {scope}: {rows} tasks updated")
+        return rows
+
+    except Exception as e:
+        print(f"✗ Error rebuilding backlog occurrence summaries: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--user-id", help="Only process this user's tasks (default: all users)")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only report stale summaries; exit with status 1 if any are found",
+    )
+    args = parser.parse_args()
+    stale = rebuild_backlog_link_summary(args.user_id, check=args.check)
+    if args.check and stale:
+        sys.exit(1)
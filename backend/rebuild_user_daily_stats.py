@@ -0,0 +1,37 @@
+"""Rebuild the user_daily_stats analytics rollup from daily progress entries."""
+import argparse
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import app.models  # noqa: F401  (register all mappers)
+from app.models.systemSettings import SystemSettings  # noqa: F401
+from app.db.session import SessionLocal
+from app.services.user_daily_stats_service import UserDailyStatsService
+
+
+def rebuild_user_daily_stats(user_id: str = None):
+    """Recompute rollup rows for one user, or for every user when user_id is None."""
+    db = SessionLocal()
+
+    try:
+        rows = UserDailyStatsService(db).rebuild(user_id)
+        db.commit()
+
+        scope = f"user {user_id}" if user_id else "all users"
+        print(f"✓ Rebuilt user_daily_stats for {scope}: {rows} day rows")
+
+    except Exception as e:
+        print(f"✗ Error rebuilding user_daily_stats: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--user-id", help="Only rebuild this user's rows (default: all users)")
+    args = parser.parse_args()
+    rebuild_user_daily_stats(args.user_id)
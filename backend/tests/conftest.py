@@ -2,13 +2,18 @@
 import os
 
 os.environ.setdefault("IP_RATE_LIMIT_USE_REDIS", "false")
+os.environ.setdefault("ANALYTICS_CACHE_USE_REDIS", "false")
 
 from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.deps import get_current_user
 from app.main import app
 
@@ -33,3 +38,30 @@ def client_authenticated() -> TestClient:
         yield TestClient(app)
     finally:
         app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def pg_session():
+    """Session on a migrated PostgreSQL database, rolled back afterwards; skipped otherwise."""
+    engine = create_engine(settings.DATABASE_URL)
+    try:
+        connection = engine.connect()
+    except OperationalError:
+        engine.dispose()
+        pytest.skip("requires a PostgreSQL database")
+    indexes = {ix["name"] for ix in inspect(connection).get_indexes("daily_progress_entries")}
+    connection.rollback()
+    if "ix_daily_progress_entries_day_status" not in indexes:
+        connection.close()
+        engine.dispose()
+        pytest.skip("database is not migrated to head")
+
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+        engine.dispose()
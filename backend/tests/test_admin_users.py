@@ -3,6 +3,7 @@ from datetime import datetime, timezone
 from unittest.mock import MagicMock
 from uuid import uuid4
 
+from app.db.pagination import Page
 from app.schemas.admin_user import AdminUserListItem, RoleBrief
 
 
@@ -32,8 +33,8 @@ def test_admin_users_list_ok(monkeypatch, client_authenticated):
         def __init__(self, _db):
             pass
 
-        def list_users(self, page, page_size, q):
-            return [
+        def list_users(self, page, page_size, q, **_kwargs):
+            return Page(items=[
                 AdminUserListItem(
                     id=uid,
                     username="u1",
@@ -44,7 +45,7 @@ def test_admin_users_list_ok(monkeypatch, client_authenticated):
                     created_at=datetime.now(timezone.utc),
                     roles=[RoleBrief(id=rid, name="admin")],
                 )
-            ], 1
+            ], total=1)
 
     monkeypatch.setattr(
         "app.api.v1.endpoints.admin_users.AdminUserService",
@@ -0,0 +1,70 @@
+"""Tests for the multi-view analytics bundle."""
+from datetime import date
+from unittest.mock import MagicMock
+
+from app.services.analytics_service import AnalyticsService
+
+
+ROWS = [
+    # (progress_date, total, done, low, medium, high)
+    (date(2026, 2, 27), 2, 1, 0, 2, 0),
+    (date(2026, 3, 1), 3, 3, 1, 1, 1),
+    (date(2026, 3, 2), 4, 2, 0, 4, 0),
+    (date(2026, 3, 9), 0, 0, 0, 0, 0),
+]
+
+
+def test_fold_buckets_matches_date_trunc_grouping():
+    assert AnalyticsService._fold_buckets("day", ROWS) == [
+        (date(2026, 2, 27), 2, 1),
+        (date(2026, 3, 1), 3, 3),
+        (date(2026, 3, 2), 4, 2),
+    ]
+    # Weeks start on Monday: 2026-02-27 (Fri) and 2026-03-01 (Sun) share a week
+    assert AnalyticsService._fold_buckets("week", ROWS) == [
+        (date(2026, 2, 23), 5, 4),
+        (date(2026, 3, 2), 4, 2),
+    ]
+    assert AnalyticsService._fold_buckets("month", ROWS) == [
+        (date(2026, 2, 1), 2, 1),
+        (date(2026, 3, 1), 7, 5),
+    ]
+
+
+def test_bundle_loads_rollup_rows_once_for_all_range_views():
+    db = MagicMock()
+    db.query.return_value.filter.return_value.order_by.return_value.all.return_value = ROWS
+    service = AnalyticsService(db=db)
+
+    bundle = service.get_bundle(
+        "user-1",
+        ["heatmap", "trend"],
+        date(2026, 3, 1),
+        date(2026, 3, 9),
+        period="weekly",
+    )
+
+    assert db.query.call_count == 1
+    assert bundle.views == ["heatmap", "trend"]
+    assert bundle.dashboard is None and bundle.monthly is None
+    # Rows outside the requested range (2026-02-27) are left out of both views
+    assert [cell["total"] for cell in bundle.heatmap.data[:3]] == [3, 4, 0]
+    assert [point["rate"] for point in bundle.trend.data] == [100.0, 50.0]
+    assert service._daily_stats_window is None
+
+
+def test_window_covers_only_the_loaded_user_and_range():
+    service = AnalyticsService(db=MagicMock())
+    service._daily_stats_window = ("user-1", date(2026, 3, 1), date(2026, 4, 1), [])
+
+    assert service._window_covers("user-1", date(2026, 3, 1), date(2026, 4, 1))
+    assert not service._window_covers("user-2", date(2026, 3, 1), date(2026, 4, 1))
+    assert not service._window_covers("user-1", date(2026, 2, 28), date(2026, 3, 10))
+    assert not service._window_covers("user-1", date(2026, 3, 1), date(2026, 4, 2))
+
+
+def test_bundle_endpoint_rejects_unknown_views(client_authenticated):
+    response = client_authenticated.get("/api/v1/analytics/bundle?views=dashboard,weather")
+
+    assert response.status_code == 400
+    assert "dashboard, yearly, monthly, heatmap, trend" in response.json()["detail"]
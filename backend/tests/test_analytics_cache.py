@@ -0,0 +1,157 @@
+"""Tests for the generation-keyed analytics response cache."""
+import uuid
+
+from sqlalchemy.orm import Session
+
+from app.cache.analytics import (
+    AnalyticsCache,
+    _collect_dirty_users,
+    _discard_dirty_users,
+    _invalidate_dirty_users,
+)
+from app.cache.store import CacheUnavailableError, InMemoryCacheStore
+from app.models.yearly_goal import YearlyGoal
+from app.schemas.analytics import DashboardStats
+
+
+def _stats(total_goals: int = 1) -> DashboardStats:
+    return DashboardStats(
+        total_goals=total_goals,
+        active_goals=0,
+        completed_goals=0,
+        total_monthly_plans=0,
+        total_daily_progress_days=0,
+        total_tasks=0,
+        completed_tasks=0,
+        overall_completion_rate=0.0,
+    )
+
+
+class FlakyStore(InMemoryCacheStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.down = False
+
+    def get(self, key):
+        if self.down:
+            raise CacheUnavailableError("down")
+        return super().get(key)
+
+    def set(self, key, value, ttl_seconds):
+        if self.down:
+            raise CacheUnavailableError("down")
+        super().set(key, value, ttl_seconds)
+
+    def incr(self, key):
+        if self.down:
+            raise CacheUnavailableError("down")
+        return super().incr(key)
+
+
+def _dashboard(cache: AnalyticsCache, total_goals: int) -> int:
+    """total_goals of u1's dashboard, computing _stats(total_goals) on a miss."""
+    return cache.get_or_compute(
+        "u1", "dashboard", DashboardStats, lambda: _stats(total_goals)
+    ).total_goals
+
+
+def test_hit_after_miss_until_user_is_invalidated():
+    cache = AnalyticsCache(None, InMemoryCacheStore(), ttl_seconds=60)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return _stats(len(calls))
+
+    assert cache.get_or_compute("u1", "dashboard", DashboardStats, compute).total_goals == 1
+    assert cache.get_or_compute("u1", "dashboard", DashboardStats, compute).total_goals == 1
+    cache.invalidate_user("u2")
+    assert cache.get_or_compute("u1", "dashboard", DashboardStats, compute).total_goals == 1
+
+    cache.invalidate_user("u1")
+    assert cache.get_or_compute("u1", "dashboard", DashboardStats, compute).total_goals == 2
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 2
+    assert cache.stats()["backend"] == "memory"
+
+
+def test_redis_outage_bypasses_cache_and_replays_invalidations():
+    primary = FlakyStore()
+    cache = AnalyticsCache(primary, InMemoryCacheStore(), ttl_seconds=60, retry_seconds=0)
+    cache.get_or_compute("u1", "dashboard", DashboardStats, lambda: _stats(1))
+
+    primary.down = True
+    assert _dashboard(cache, 3) == 3
+    assert _dashboard(cache, 4) == 4
+    assert cache.stats()["bypassed"] == 2
+    cache.invalidate_user("u1")
+    assert cache.stats()["errors"] >= 1
+    assert cache.stats()["pending_invalidations"] == 1
+
+    primary.down = False
+    # The pre-outage Redis entry must not be served once Redis is reachable again
+    assert _dashboard(cache, 2) == 2
+    assert cache.stats()["pending_invalidations"] == 0
+
+
+def test_write_in_one_worker_is_seen_by_another_during_redis_outage():
+    # Two worker processes: a shared Redis, nothing else in common
+    redis = FlakyStore()
+    writer = AnalyticsCache(redis, InMemoryCacheStore(), ttl_seconds=60, retry_seconds=0)
+    reader = AnalyticsCache(redis, InMemoryCacheStore(), ttl_seconds=60, retry_seconds=0)
+    assert _dashboard(reader, 1) == 1
+
+    redis.down = True
+    assert _dashboard(reader, 1) == 1
+    writer.invalidate_user("u1")
+    assert _dashboard(reader, 2) == 2
+
+    redis.down = False
+    # The writer replays its bump; the reader never serves the pre-write entry
+    writer.invalidate_user("u2")
+    assert _dashboard(reader, 3) == 3
+
+
+def test_disabled_cache_always_computes():
+    cache = AnalyticsCache(None, InMemoryCacheStore(), ttl_seconds=60, enabled=False)
+    cache.get_or_compute("u1", "dashboard", DashboardStats, _stats)
+    cache.get_or_compute("u1", "dashboard", DashboardStats, _stats)
+    assert cache.stats()["misses"] == 0
+
+
+def test_committed_goal_write_bumps_owner_generation(monkeypatch):
+    cache = AnalyticsCache(None, InMemoryCacheStore(), ttl_seconds=60)
+    monkeypatch.setattr("app.cache.analytics.analytics_cache", cache)
+    user_id = uuid.uuid4()
+    session = Session()
+    session.add(YearlyGoal(user_id=user_id, year=2026, title="goal"))
+
+    _collect_dirty_users(session, None, None)
+    _discard_dirty_users(session)
+    _invalidate_dirty_users(session)
+    assert cache.stats()["invalidations"] == 0
+
+    _collect_dirty_users(session, None, None)
+    _invalidate_dirty_users(session)
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_dashboard_endpoint_served_from_cache(monkeypatch, client_authenticated):
+    calls = []
+
+    class MockAnalyticsService:
+        def __init__(self, _db):
+            pass
+
+        def get_dashboard_stats(self, user_id):
+            calls.append(user_id)
+            return _stats()
+
+    monkeypatch.setattr("app.api.v1.endpoints.analytics.AnalyticsService", MockAnalyticsService)
+
+    first = client_authenticated.get("/api/v1/analytics/dashboard")
+    second = client_authenticated.get("/api/v1/analytics/dashboard")
+
+    assert first.status_code == 200
+    assert second.json() == first.json()
+    assert len(calls) == 1
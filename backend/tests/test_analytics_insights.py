@@ -0,0 +1,71 @@
+"""Tests for the vectorized long-range insight computations."""
+from datetime import date
+
+import numpy as np
+
+from app.services import analytics_insights
+
+
+def test_streaks_count_runs_of_days_with_completed_tasks():
+    done = np.array([1, 2, 0, 1, 1, 1, 0, 3, 1])
+    assert analytics_insights.streaks(done) == (3, 2)
+    assert analytics_insights.streaks(np.zeros(5, dtype=np.int64)) == (0, 0)
+
+
+def test_current_streak_survives_an_unfinished_last_day():
+    assert analytics_insights.streaks(np.array([0, 1, 1, 0])) == (2, 2)
+    assert analytics_insights.streaks(np.array([1, 1, 0, 0])) == (2, 0)
+
+
+def test_rolling_rate_sums_counts_over_trailing_window():
+    totals = np.array([2, 0, 4, 2])
+    done = np.array([1, 0, 4, 0])
+
+    rates = analytics_insights.rolling_completion_rate(totals, done, 2)
+
+    np.testing.assert_allclose(rates, [50.0, 50.0, 100.0, 66.66666667])
+    assert np.isnan(analytics_insights.rolling_completion_rate(np.zeros(2), np.zeros(2), 7)).all()
+
+
+def test_weekday_profile_starts_from_first_day_weekday():
+    # 2026-03-01 is a Sunday
+    profile = analytics_insights.weekday_profile(
+        date(2026, 3, 1), np.array([4, 2, 0, 0, 0, 0, 0, 2]), np.array([1, 2, 0, 0, 0, 0, 0, 1])
+    )
+
+    assert profile[6] == {"weekday": 6, "total": 6, "completed": 2, "completion_rate": 33.33}
+    assert profile[0] == {"weekday": 0, "total": 2, "completed": 2, "completion_rate": 100.0}
+    assert profile[1]["completion_rate"] == 0.0
+
+
+def test_trend_slope_ignores_days_without_tasks():
+    rates = np.array([10.0, np.nan, 30.0, np.nan, 50.0])
+
+    assert analytics_insights.trend_slope(rates) == 10.0
+    assert analytics_insights.trend_slope(np.array([np.nan, 40.0])) == 0.0
+    assert analytics_insights.trend_direction(0.5) == "up"
+    assert analytics_insights.trend_direction(-0.01) == "stable"
+
+
+def test_compute_insights_over_sparse_rows():
+    totals, done = analytics_insights.dense_daily_counts(
+        np.array([0, 2, 3]), np.array([2, 1, 3]), np.array([2, 1, 0]), 4
+    )
+
+    insights = analytics_insights.compute_insights(date(2026, 3, 1), totals, done)
+
+    assert insights["total_tasks"] == 6
+    assert insights["completion_rate"] == 50.0
+    assert insights["active_days"] == 2
+    assert (insights["longest_streak"], insights["current_streak"]) == (1, 1)
+    assert insights["rolling_7d_rate"] == 50.0
+    assert insights["rolling_data"][1] == {"date": "2026-03-02", "rate_7d": 100.0, "rate_30d": 100.0}
+    assert insights["trend"] == "down"
+
+
+def test_insights_endpoint_rejects_oversized_range(client_authenticated):
+    response = client_authenticated.get(
+        "/api/v1/analytics/insights?start_date=1990-01-01&end_date=2026-01-01"
+    )
+
+    assert response.status_code == 400
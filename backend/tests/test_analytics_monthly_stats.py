@@ -0,0 +1,43 @@
+"""Tests for the grouped monthly analytics aggregation."""
+
+from datetime import date
+
+from app.services.analytics_service import AnalyticsService
+
+
+def test_build_monthly_breakdown_folds_rollup_rows():
+    # (progress_date, total, done, low, medium, high); day 31 has an entry without priority
+    rows = [
+        (date(2026, 5, 1), 3, 2, 1, 0, 2),
+        (date(2026, 5, 8), 4, 1, 0, 4, 0),
+        (date(2026, 5, 31), 1, 1, 0, 0, 0),
+    ]
+
+    breakdown = AnalyticsService._build_monthly_breakdown(rows)
+
+    assert breakdown["total"] == 8
+    assert breakdown["completed"] == 4
+    assert breakdown["daily_completion_data"] == [
+        {"day": 1, "total": 3, "completed": 2, "rate": 66.67},
+        {"day": 8, "total": 4, "completed": 1, "rate": 25.0},
+        {"day": 31, "total": 1, "completed": 1, "rate": 100.0},
+    ]
+    assert breakdown["priority_distribution"] == [
+        {"priority": "low", "count": 1},
+        {"priority": "medium", "count": 4},
+        {"priority": "high", "count": 2},
+    ]
+    assert breakdown["weekly_comparison"] == [
+        {"week": 1, "total": 3, "completed": 2, "rate": 66.67},
+        {"week": 2, "total": 4, "completed": 1, "rate": 25.0},
+        {"week": 5, "total": 1, "completed": 1, "rate": 100.0},
+    ]
+
+
+def test_build_monthly_breakdown_empty_month():
+    breakdown = AnalyticsService._build_monthly_breakdown([])
+
+    assert breakdown["total"] == 0
+    assert breakdown["daily_completion_data"] == []
+    assert breakdown["weekly_comparison"] == []
+    assert [item["count"] for item in breakdown["priority_distribution"]] == [0, 0, 0]
@@ -0,0 +1,63 @@
+"""Tests for range-aggregated heatmap and completion trend analytics."""
+
+from datetime import date
+from unittest.mock import MagicMock
+
+from app.services.analytics_service import AnalyticsService
+
+
+def test_heatmap_fills_missing_days_from_grouped_counts():
+    service = AnalyticsService(db=MagicMock())
+    service._entry_counts_by_bucket = MagicMock(
+        return_value=[(date(2026, 3, 2), 4, 4), (date(2026, 3, 4), 3, 1)]
+    )
+
+    heatmap = service.get_heatmap_data("user-1", date(2026, 3, 1), date(2026, 3, 4))
+
+    assert [cell["level"] for cell in heatmap.data] == ["none", "high", "none", "low"]
+    assert heatmap.data[0] == {
+        "date": "2026-03-01",
+        "value": 0,
+        "level": "none",
+        "total": 0,
+        "completed": 0,
+    }
+    assert heatmap.data[3]["value"] == 33.33
+    service._entry_counts_by_bucket.assert_called_once_with(
+        "user-1", "day", date(2026, 3, 1), date(2026, 3, 4)
+    )
+
+
+def test_heatmap_cell_levels():
+    assert AnalyticsService._heatmap_cell(date(2026, 1, 1), 2, 0)["level"] == "none"
+    assert AnalyticsService._heatmap_cell(date(2026, 1, 1), 2, 1)["level"] == "medium"
+    assert AnalyticsService._heatmap_cell(date(2026, 1, 1), 2, 2)["level"] == "high"
+
+
+def test_weekly_trend_clips_calendar_weeks_to_range():
+    service = AnalyticsService(db=MagicMock())
+    service._entry_counts_by_bucket = MagicMock(
+        return_value=[(date(2026, 3, 2), 2, 1), (date(2026, 3, 9), 2, 2)]
+    )
+
+    trend = service.get_completion_rate_trend(
+        "user-1", "weekly", date(2026, 3, 4), date(2026, 3, 12)
+    )
+
+    assert trend.data == [
+        {"week": 1, "start_date": "2026-03-04", "end_date": "2026-03-08", "rate": 50.0},
+        {"week": 2, "start_date": "2026-03-09", "end_date": "2026-03-12", "rate": 100.0},
+    ]
+    assert trend.trend == "up"
+    assert trend.average_rate == 75.0
+
+
+def test_monthly_trend_queries_whole_calendar_months():
+    service = AnalyticsService(db=MagicMock())
+    service._entry_counts_by_bucket = MagicMock(return_value=[])
+
+    service.get_completion_rate_trend("user-1", "monthly", date(2026, 1, 31), date(2026, 2, 10))
+
+    service._entry_counts_by_bucket.assert_called_once_with(
+        "user-1", "month", date(2026, 1, 1), date(2026, 2, 28)
+    )
@@ -0,0 +1,204 @@
+"""Tests for the batch backlog mutation path (PostgreSQL parts skip without a database)."""
+import uuid
+from datetime import date, timedelta
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import event
+
+from app.models import BacklogDailyLink, BacklogTaskStatus, DailyProgressDay, User
+from app.schemas.backlog_task import (
+    MAX_BATCH_OPERATIONS,
+    BacklogTaskBatchRequest,
+    BacklogTaskCreate,
+    BacklogTaskSchedule,
+    BacklogTaskScheduleRange,
+)
+from app.services.backlog_link_summary_service import BacklogLinkSummaryService
+from app.services.backlog_task_service import BacklogTaskService
+
+
+def _request(*operations):
+    return BacklogTaskBatchRequest.model_validate({"operations": list(operations)})
+
+
+def test_batch_request_validates_each_operation_shape():
+    request = _request(
+        {"op": "create", "data": {"title": "a"}},
+        {"op": "schedule", "task_id": str(uuid.uuid4()), "plan_date": "2026-03-01"},
+    )
+    assert [operation.op for operation in request.operations] == ["create", "schedule"]
+
+    with pytest.raises(ValidationError):
+        _request({"op": "schedule", "plan_date": "2026-03-01"})
+    with pytest.raises(ValidationError):
+        _request({"op": "delete", "task_id": str(uuid.uuid4())})
+    with pytest.raises(ValidationError):
+        _request(*[{"op": "complete", "task_id": str(uuid.uuid4())}] * (MAX_BATCH_OPERATIONS + 1))
+
+
+def test_batch_endpoint_rejects_empty_operations(client_authenticated):
+    response = client_authenticated.post("/api/v1/backlog-tasks/batch", json={"operations": []})
+
+    assert response.status_code == 422
+
+
+def test_bulk_delete_endpoint_validates_task_ids(client_authenticated):
+    url = "/api/v1/backlog-tasks/bulk-delete"
+    assert client_authenticated.post(url, json={"task_ids": []}).status_code == 422
+    assert client_authenticated.post(url, json={"task_ids": ["not-a-uuid"]}).status_code == 422
+    too_many = [str(uuid.uuid4()) for _ in range(MAX_BATCH_OPERATIONS + 1)]
+    assert client_authenticated.post(url, json={"task_ids": too_many}).status_code == 422
+
+
+def test_schedule_range_request_expands_range_and_assignments():
+    first, second = uuid.uuid4(), uuid.uuid4()
+    request = BacklogTaskScheduleRange(
+        task_ids=[first, second],
+        start_date=date(2026, 3, 2),
+        end_date=date(2026, 3, 3),
+        assignments=[
+            {"task_id": str(first), "plan_date": "2026-03-01"},
+            {"task_id": str(first), "plan_date": "2026-03-03"},
+        ],
+    )
+
+    assert request.occurrences() == [
+        (first, date(2026, 3, 1)),
+        (first, date(2026, 3, 2)),
+        (second, date(2026, 3, 2)),
+        (first, date(2026, 3, 3)),
+        (second, date(2026, 3, 3)),
+    ]
+    for invalid in (
+        {},
+        {"task_ids": [str(first)]},
+        {"start_date": "2026-03-01"},
+        {"task_ids": [str(first)], "start_date": "2026-03-02", "end_date": "2026-03-01"},
+        {"task_ids": [str(first)], "start_date": "2026-03-01", "end_date": "2026-04-01"},
+        {"task_ids": [str(uuid.uuid4()) for _ in range(20)], "start_date": "2026-03-01",
+         "end_date": "2026-03-31"},
+    ):
+        with pytest.raises(ValidationError):
+            BacklogTaskScheduleRange.model_validate(invalid)
+
+
+def test_schedule_range_endpoint_rejects_invalid_range(client_authenticated):
+    response = client_authenticated.post(
+        "/api/v1/backlog-tasks/schedule-range",
+        json={"task_ids": [str(uuid.uuid4())], "start_date": "2026-03-02", "end_date": "2026-03-01"},
+    )
+
+    assert response.status_code == 422
+
+
+def _user(session) -> str:
+    user = User(
+        username=f"batch_{uuid.uuid4().hex[:8]}",
+        email=f"{uuid.uuid4().hex[:8]}@example.com",
+        hashed_password="x",
+    )
+    session.add(user)
+    session.flush()
+    return str(user.id)
+
+
+def test_apply_batch_commits_once_and_reports_results_in_order(pg_session):
+    user_id = _user(pg_session)
+    service = BacklogTaskService(pg_session)
+    created = service.apply_batch(
+        user_id,
+        _request(
+            {"op": "create", "data": {"title": "write report"}},
+            {"op": "create", "data": {"title": "read paper", "progress": 100}},
+        ).operations,
+    )
+    report_id, paper_id = (str(result.task.id) for result in created.results)
+    assert created.results[1].task.occurrence_count == 1
+
+    commits = []
+    event.listen(pg_session, "after_commit", lambda _session: commits.append(1))
+    monday = date.today() + timedelta(days=7 - date.today().weekday())
+    result = service.apply_batch(
+        user_id,
+        _request(
+            {"op": "schedule", "task_id": report_id, "plan_date": str(monday)},
+            {"op": "schedule", "task_id": report_id, "plan_date": str(monday + timedelta(days=1))},
+            {"op": "update", "task_id": report_id, "data": {"title": "write the report"}},
+            {"op": "schedule", "task_id": paper_id, "plan_date": str(monday)},
+            {"op": "complete", "task_id": str(uuid.uuid4())},
+            {"op": "complete", "task_id": report_id},
+        ).operations,
+    )
+
+    assert len(commits) == 1
+    assert [(r.index, r.ok, r.error) for r in result.results] == [
+        (0, True, None),
+        (1, True, None),
+        (2, True, None),
+        (3, False, "Unable to schedule a completed task"),
+        (4, False, "Backlog task not found"),
+        (5, True, None),
+    ]
+    assert (result.succeeded, result.failed) == (4, 2)
+
+    report = result.results[-1].task
+    assert report.title == "write the report"
+    assert report.status == BacklogTaskStatus.DONE
+    assert report.occurrence_count == 3
+    assert report.last_plan_date == monday + timedelta(days=1)
+    assert pg_session.query(DailyProgressDay).filter_by(user_id=user_id).count() == 3
+
+    links = {
+        link.plan_date: link
+        for link in pg_session.query(BacklogDailyLink).filter_by(backlog_task_id=report.id)
+    }
+    # Scheduled entries keep the title they were created with; future links get the snapshot
+    assert links[monday].daily_progress_entry.title == "write report"
+    assert links[monday].progress_after == 100
+    assert links[date.today()].daily_progress_entry.title == "write the report"
+    assert BacklogLinkSummaryService(pg_session).verify(user_id) == 0
+
+
+def test_schedule_range_inserts_in_bulk_and_commits_once(pg_session):
+    user_id = _user(pg_session)
+    service = BacklogTaskService(pg_session)
+    tasks = [service.create_task(user_id, BacklogTaskCreate(title=f"habit {n}")) for n in range(3)]
+    done = service.create_task(user_id, BacklogTaskCreate(title="done", progress=100))
+    monday = date.today() + timedelta(days=7 - date.today().weekday())
+    service.schedule_task(user_id, str(tasks[0].id), BacklogTaskSchedule(plan_date=monday))
+    existing = service.get_link_for_date(str(tasks[0].id), monday)
+
+    commits, inserts = [], []
+    event.listen(pg_session, "after_commit", lambda _session: commits.append(1))
+
+    def capture(_conn, _cursor, statement, *_args):
+        if statement.startswith("INSERT") and "user_daily_stats" not in statement:
+            inserts.append(statement.split()[2])
+
+    connection = pg_session.connection()
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        result = service.schedule_range(
+            user_id,
+            BacklogTaskScheduleRange(
+                task_ids=[task.id for task in tasks] + [done.id],
+                start_date=monday,
+                end_date=monday + timedelta(days=6),
+                assignments=[{"task_id": str(uuid.uuid4()), "plan_date": str(monday)}],
+            ),
+        )
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+
+    assert len(commits) == 1
+    # Day containers, entries and links: one multi-row INSERT each
+    assert inserts == ["daily_progress_days", "daily_progress_entries", "backlog_daily_links"]
+    assert result.scheduled == 21
+    assert [task.id for task in result.tasks] == [task.id for task in tasks]
+    assert all(task.occurrence_count == 7 for task in result.tasks)
+    assert all(task.scheduled_date == monday + timedelta(days=6) for task in result.tasks)
+    assert result.completed == [done.id] and len(result.not_found) == 1
+    assert service.get_link_for_date(str(tasks[0].id), monday).id == existing.id
+    assert pg_session.query(DailyProgressDay).filter_by(user_id=user_id).count() == 8
+    assert BacklogLinkSummaryService(pg_session).verify(user_id) == 0
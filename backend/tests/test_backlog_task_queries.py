@@ -0,0 +1,346 @@
+"""SQL-side backlog list ordering, link progress and occurrence summary queries (PostgreSQL only)."""
+import uuid
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import event
+
+from app.models import (
+    BacklogDailyLink,
+    BacklogTask,
+    BacklogTaskStatus,
+    DailyProgressDay,
+    DailyProgressEntry,
+    DailyProgressEntryStatus,
+    TaskPriority,
+    User,
+)
+from app.schemas.backlog_task import BacklogTaskSchedule
+from app.services.backlog_link_summary_service import BacklogLinkSummaryService
+from app.services.backlog_task_service import BacklogTaskService
+from app.services.daily_progress_service import DailyProgressService
+from app.services.task_data_repair_service import TaskDataRepairService
+
+
+def _user(session) -> str:
+    user = User(
+        username=f"order_{uuid.uuid4().hex[:8]}",
+        email=f"{uuid.uuid4().hex[:8]}@example.com",
+        hashed_password="x",
+    )
+    session.add(user)
+    session.flush()
+    return str(user.id)
+
+
+def _task(session, user_id, title, *, priority=TaskPriority.MEDIUM, created, plan_dates=(), **fields):
+    task = BacklogTask(
+        user_id=user_id,
+        title=title,
+        priority=priority,
+        created_at=datetime(2026, 1, 1, *created),
+        **fields,
+    )
+    session.add(task)
+    session.flush()
+    for plan_date in plan_dates:
+        day = session.query(DailyProgressDay).filter_by(
+            user_id=user_id, progress_date=plan_date
+        ).first()
+        if day is None:
+            day = DailyProgressDay(user_id=user_id, progress_date=plan_date)
+            session.add(day)
+            session.flush()
+        entry = DailyProgressEntry(daily_progress_day_id=day.id, title=title)
+        session.add(entry)
+        session.flush()
+        session.add(
+            BacklogDailyLink(backlog_task_id=task.id, daily_task_id=entry.id, plan_date=plan_date)
+        )
+    BacklogLinkSummaryService(session).refresh([task.id])
+    return task
+
+
+def _titles(tasks):
+    return [task.title for task in tasks]
+
+
+def test_pending_orders_scheduled_tasks_by_last_plan_date_between_unscheduled(pg_session):
+    user_id = _user(pg_session)
+    _task(pg_session, user_id, "low", priority=TaskPriority.LOW, created=(12,))
+    _task(pg_session, user_id, "u1", created=(10,))
+    _task(pg_session, user_id, "s_a", created=(9,), plan_dates=[date(2026, 1, 20)])
+    _task(pg_session, user_id, "s_b", created=(8,), plan_dates=[date(2026, 1, 2), date(2026, 1, 5)])
+    _task(pg_session, user_id, "u2", created=(7,))
+    _task(pg_session, user_id, "s_c", created=(6,), plan_dates=[date(2026, 1, 30)])
+    _task(pg_session, user_id, "high", priority=TaskPriority.HIGH, created=(1,))
+    _task(pg_session, user_id, "done", created=(11,), status=BacklogTaskStatus.DONE)
+
+    service = BacklogTaskService(pg_session)
+    page = service.get_user_tasks(user_id, tab="pending")
+
+    assert page.total == 7
+    assert _titles(page.items) == ["high", "u1", "s_b", "s_a", "u2", "s_c", "low"]
+
+    page = service.get_user_tasks(user_id, tab="pending", limit=3, offset=2)
+    assert page.total == 7
+    assert _titles(page.items) == ["s_b", "s_a", "u2"]
+
+
+def test_in_progress_and_done_tab_orderings(pg_session):
+    user_id = _user(pg_session)
+    in_progress = BacklogTaskStatus.IN_PROGRESS
+    _task(pg_session, user_id, "p20", created=(9,), status=in_progress, progress=20)
+    _task(pg_session, user_id, "p80_old", created=(1,), status=in_progress, progress=80)
+    _task(pg_session, user_id, "p80_new", created=(2,), status=in_progress, progress=80)
+    _task(
+        pg_session, user_id, "high", priority=TaskPriority.HIGH, created=(0,),
+        status=in_progress, progress=10,
+    )
+    done = BacklogTaskStatus.DONE
+    _task(
+        pg_session, user_id, "done_early", created=(5,), status=done,
+        completed_at=datetime(2026, 2, 1),
+    )
+    _task(
+        pg_session, user_id, "done_late", created=(4,), status=done,
+        completed_at=datetime(2026, 3, 1),
+    )
+    _task(
+        pg_session, user_id, "done_updated", created=(3,), status=done,
+        updated_at=datetime(2026, 2, 15),
+    )
+
+    service = BacklogTaskService(pg_session)
+
+    page = service.get_user_tasks(user_id, tab="in_progress")
+    assert _titles(page.items) == ["high", "p80_new", "p80_old", "p20"]
+
+    page = service.get_user_tasks(user_id, tab="done", limit=2)
+    assert page.total == 3
+    assert _titles(page.items) == ["done_late", "done_updated"]
+
+
+def test_cursor_pages_follow_each_tab_ordering(pg_session):
+    user_id = _user(pg_session)
+    in_progress, done = BacklogTaskStatus.IN_PROGRESS, BacklogTaskStatus.DONE
+    # Shared created_at values so pages split inside ties broken by id
+    for n in range(4):
+        _task(pg_session, user_id, f"u{n}", created=(n % 2,))
+        _task(pg_session, user_id, f"s{n}", created=(n % 2,), plan_dates=[date(2026, 1, 10 + n % 2)])
+        _task(pg_session, user_id, f"lo{n}", priority=TaskPriority.LOW, created=(1,))
+        _task(pg_session, user_id, f"p{n}", created=(2,), status=in_progress, progress=50)
+        _task(
+            pg_session, user_id, f"d{n}", created=(n % 2,), status=done,
+            completed_at=datetime(2026, 2, 1),
+        )
+
+    service = BacklogTaskService(pg_session)
+    for tab in ("pending", "in_progress", "done", "active"):
+        expected = [task.id for task in service.get_user_tasks(user_id, tab=tab).items]
+        walked, cursor = [], None
+        while True:
+            page = service.get_user_tasks(
+                user_id, tab=tab, limit=3, cursor=cursor, include_total=False
+            )
+            assert page.total is None
+            walked += [task.id for task in page.items]
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        assert walked == expected, tab
+
+
+def test_batch_daily_task_progress_carries_last_snapshot(pg_session):
+    user_id = _user(pg_session)
+    today = date.today()
+    past = [today - timedelta(days=n) for n in (30, 20, 10)]
+    task = _task(
+        pg_session, user_id, "long", created=(1,), progress=90,
+        plan_dates=past + [today],
+    )
+    snapshots = dict(zip(past, (40, None, 70)))
+    for link in task.daily_links:
+        link.progress_after = snapshots.get(link.plan_date)
+    pg_session.flush()
+
+    entry_by_date = {link.plan_date: str(link.daily_task_id) for link in task.daily_links}
+    progress = BacklogTaskService(pg_session).batch_daily_task_progress(
+        list(entry_by_date.values()) + [str(uuid.uuid4())]
+    )
+
+    assert len(progress) == 4
+    assert progress[entry_by_date[past[0]]] == {"progress_after": 40, "progress_delta": 40}
+    # No snapshot recorded: falls back to the backlog's current progress
+    assert progress[entry_by_date[past[1]]] == {"progress_after": 90, "progress_delta": 50}
+    assert progress[entry_by_date[past[2]]] == {"progress_after": 70, "progress_delta": 30}
+    assert progress[entry_by_date[today]] == {"progress_after": 90, "progress_delta": 20}
+
+
+def test_detail_builds_occurrences_in_one_query(pg_session):
+    user_id = _user(pg_session)
+    today = date.today()
+    past = [today - timedelta(days=n) for n in (30, 20, 10)]
+    task = _task(
+        pg_session, user_id, "long", created=(1,), progress=90,
+        plan_dates=past + [today],
+    )
+    for link in task.daily_links:
+        link.progress_after = {past[0]: 40, past[2]: 70}.get(link.plan_date)
+    pg_session.flush()
+
+    service = BacklogTaskService(pg_session)
+    task = service.get_task(str(task.id))
+    statements = []
+
+    def capture(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    connection = pg_session.connection()
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        detail = service.to_detail(task)
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+
+    assert len(statements) == 1
+    assert [occ.plan_date for occ in detail.occurrences] == [today] + past[::-1]
+    assert [(occ.progress_after, occ.progress_delta) for occ in detail.occurrences] == [
+        (90, 20), (70, 0), (90, 50), (40, 40),
+    ]
+    assert all(occ.daily_title == "long" and occ.daily_progress_day_id for occ in detail.occurrences)
+    assert detail.occurrence_count == 4
+
+
+def test_backfill_progress_snapshots_in_chunks(pg_session):
+    user_id = _user(pg_session)
+    days = [date(2026, 3, d) for d in (1, 2, 3, 4)]
+    # Carries 40, then the newest DONE link after it takes the task progress
+    done_late = _task(pg_session, user_id, "a", created=(1,), progress=90, plan_dates=days)
+    # No DONE link: the newest link without a snapshot takes the task progress
+    todo_only = _task(pg_session, user_id, "b", created=(2,), progress=60, plan_dates=days[:3])
+    # Recorded snapshot last: the newest missing one before it is the target
+    snapshot_last = _task(pg_session, user_id, "c", created=(3,), progress=70, plan_dates=days[:3])
+    links = {task.id: sorted(task.daily_links, key=lambda link: link.plan_date) for task in (
+        done_late, todo_only, snapshot_last
+    )}
+    links[done_late.id][0].progress_after = 40
+    for link in links[done_late.id][2:]:
+        link.daily_progress_entry.status = DailyProgressEntryStatus.DONE
+    links[done_late.id][3].daily_progress_entry.status = DailyProgressEntryStatus.TODO
+    links[snapshot_last.id][2].progress_after = 20
+    pg_session.flush()
+
+    service = BacklogTaskService(pg_session)
+    count, checkpoint = service.backfill_progress_snapshots_chunk(user_id=user_id, chunk_size=2)
+    assert checkpoint is not None
+    rest, checkpoint = service.backfill_progress_snapshots_chunk(
+        user_id=user_id, after_id=checkpoint, chunk_size=2
+    )
+    assert count + rest == 8
+    assert service.backfill_progress_snapshots_chunk(user_id=user_id, after_id=checkpoint) == (0, None)
+
+    def progress(task):
+        return [link.progress_after for link in links[task.id]]
+
+    assert progress(done_late) == [40, 40, 90, 90]
+    assert progress(todo_only) == [0, 0, 60]
+    assert progress(snapshot_last) == [0, 70, 20]
+    assert service.backfill_progress_snapshots(user_id) == 0
+
+
+def test_delete_tasks_uses_set_based_statements_and_fixes_shared_entries(pg_session):
+    user_id, other_user_id = _user(pg_session), _user(pg_session)
+    days = [date(2026, 3, d) for d in range(1, 6)]
+    habit = _task(pg_session, user_id, "habit", created=(1,), plan_dates=days[:3])
+    once = _task(pg_session, user_id, "once", created=(2,))
+    kept = _task(pg_session, user_id, "kept", created=(3,), plan_dates=days[3:])
+    foreign = _task(pg_session, other_user_id, "foreign", created=(4,))
+    # An entry created from habit but linked to kept goes with habit
+    shared = next(link for link in kept.daily_links if link.plan_date == days[4])
+    shared.daily_progress_entry.backlog_task_id = habit.id
+    kept.daily_task_id, kept.scheduled_date = shared.daily_task_id, days[4]
+    pg_session.flush()
+    habit_entry_ids = [link.daily_task_id for link in habit.daily_links] + [shared.daily_task_id]
+
+    statements = []
+
+    def capture(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    connection = pg_session.connection()
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        deleted = BacklogTaskService(pg_session).delete_tasks(
+            [habit.id, once.id, foreign.id, uuid.uuid4()], user_id=user_id
+        )
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+
+    assert set(deleted) == {habit.id, once.id}
+    deletes = [
+        statement.split()[2]
+        for statement in statements
+        if statement.startswith("DELETE") and "user_daily_stats" not in statement
+    ]
+    assert deletes == ["backlog_daily_links", "daily_progress_entries", "backlog_tasks"]
+    assert pg_session.query(BacklogTask).filter_by(user_id=user_id).all() == [kept]
+    assert pg_session.get(BacklogTask, foreign.id) is not None
+    assert not pg_session.query(DailyProgressEntry).filter(
+        DailyProgressEntry.id.in_(habit_entry_ids)
+    ).count()
+    assert (kept.scheduled_date, kept.daily_task_id) == (days[3], None)
+    assert _summary(kept) == (1, days[3], [days[3]])
+    assert BacklogLinkSummaryService(pg_session).verify(user_id) == 0
+
+
+def _summary(task):
+
+    return task.occurrence_count, task.last_plan_date, task.linked_dates
+
+
+def test_occurrence_summary_follows_link_mutations(pg_session):
+    user_id = _user(pg_session)
+    days = [date(2026, 3, d) for d in (4, 1, 9, 6)]
+    task = _task(pg_session, user_id, "task", created=(1,), plan_dates=days[:2])
+    assert _summary(task) == (2, date(2026, 3, 4), [date(2026, 3, 1), date(2026, 3, 4)])
+
+    backlog = BacklogTaskService(pg_session)
+    for plan_date in days[2:]:
+        backlog.schedule_task(user_id, str(task.id), BacklogTaskSchedule(plan_date=plan_date))
+    assert task.is_scheduled
+    assert _summary(task) == (4, date(2026, 3, 9), [date(2026, 3, 1), date(2026, 3, 4), date(2026, 3, 6)])
+
+    daily = DailyProgressService(pg_session)
+    link = backlog.get_link_for_date(str(task.id), date(2026, 3, 9))
+    daily.delete_entry(str(link.daily_task_id))
+    assert _summary(task) == (3, date(2026, 3, 6), [date(2026, 3, 1), date(2026, 3, 4), date(2026, 3, 6)])
+
+    daily.delete_day(str(daily.get_day_by_date(user_id, date(2026, 3, 1)).id))
+    assert _summary(task) == (2, date(2026, 3, 6), [date(2026, 3, 4), date(2026, 3, 6)])
+    assert BacklogLinkSummaryService(pg_session).verify(user_id) == 0
+
+
+def test_merge_moves_occurrence_summary_to_keeper(pg_session):
+    user_id = _user(pg_session)
+    keeper = _task(pg_session, user_id, "dup", created=(2,), plan_dates=[date(2026, 3, 1)])
+    merge = _task(
+        pg_session, user_id, "dup", created=(1,), plan_dates=[date(2026, 3, 1), date(2026, 3, 2)]
+    )
+
+    assert TaskDataRepairService(pg_session).merge_backlogs(user_id, str(keeper.id), str(merge.id))
+    assert _summary(keeper) == (2, date(2026, 3, 2), [date(2026, 3, 1), date(2026, 3, 2)])
+    assert BacklogLinkSummaryService(pg_session).verify(user_id) == 0
+
+
+def test_rebuild_repairs_stale_summaries(pg_session):
+    user_id = _user(pg_session)
+    stale = _task(pg_session, user_id, "stale", created=(1,), plan_dates=[date(2026, 3, 1)])
+    _task(pg_session, user_id, "fresh", created=(2,), plan_dates=[date(2026, 3, 2)])
+    stale.occurrence_count, stale.last_plan_date, stale.linked_dates = 0, None, []
+    pg_session.flush()
+
+    summaries = BacklogLinkSummaryService(pg_session)
+    assert summaries.verify(user_id) == 1
+    assert summaries.rebuild(user_id) == 1
+    assert summaries.verify(user_id) == 0
+    assert _summary(stale) == (1, date(2026, 3, 1), [date(2026, 3, 1)])
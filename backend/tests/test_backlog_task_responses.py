@@ -0,0 +1,51 @@
+"""Tests for bulk backlog response assembly."""
+import uuid
+from datetime import date, datetime
+from unittest.mock import MagicMock
+
+from app.models.backlog_task import BacklogTask, BacklogTaskStatus
+from app.models.task_context import TaskContext
+from app.models.task_priority import TaskPriority
+from app.services.backlog_task_service import BacklogTaskService
+
+
+def _task(title: str, **summary) -> BacklogTask:
+    return BacklogTask(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        title=title,
+        context=TaskContext.WORK,
+        priority=TaskPriority.MEDIUM,
+        status=BacklogTaskStatus.PENDING,
+        progress=0,
+        origin="inbox",
+        created_at=datetime(2026, 3, 1),
+        updated_at=datetime(2026, 3, 1),
+        **summary,
+    )
+
+
+def test_to_responses_reads_stored_occurrence_summary():
+    db = MagicMock()
+    service = BacklogTaskService(db=db)
+    scheduled = _task(
+        "scheduled",
+        occurrence_count=2,
+        last_plan_date=date(2026, 3, 5),
+        linked_dates=[date(2026, 3, 2), date(2026, 3, 5)],
+    )
+    inbox = _task("inbox", occurrence_count=0, linked_dates=[])
+
+    responses = service.to_responses([scheduled, inbox], dup_counts={str(inbox.id): 3})
+
+    db.query.assert_not_called()
+    db.execute.assert_not_called()
+    assert [r.title for r in responses] == ["scheduled", "inbox"]
+    assert responses[0].occurrence_count == 2
+    assert responses[0].is_scheduled is True
+    assert responses[0].last_plan_date == date(2026, 3, 5)
+    assert responses[0].linked_dates == [date(2026, 3, 2), date(2026, 3, 5)]
+    assert responses[0].possible_duplicate_count == 0
+    assert responses[1].is_scheduled is False
+    assert responses[1].linked_dates == []
+    assert responses[1].possible_duplicate_count == 3
@@ -0,0 +1,86 @@
+"""Composite backlog operations commit once (PostgreSQL only)."""
+import uuid
+from datetime import date, timedelta
+
+from sqlalchemy import event
+
+from app.models import BacklogTask, DailyProgressDay, DailyProgressEntryStatus, User
+from app.schemas.backlog_task import BacklogTaskCreate, BacklogTaskSchedule
+from app.schemas.daily_progress import DailyProgressDayCreate, DailyProgressEntryAdd
+from app.services.backlog_task_service import BacklogTaskService
+from app.services.daily_progress_service import DailyProgressService
+
+
+def _user(session) -> str:
+    user = User(
+        username=f"uow_{uuid.uuid4().hex[:8]}",
+        email=f"{uuid.uuid4().hex[:8]}@example.com",
+        hashed_password="x",
+    )
+    session.add(user)
+    session.flush()
+    return str(user.id)
+
+
+def _count_commits(session):
+    """Outer commits only; releasing a SAVEPOINT also fires after_commit."""
+    commits = []
+
+    def on_commit(committed):
+        if not committed.in_nested_transaction():
+            commits.append(1)
+
+    event.listen(session, "after_commit", on_commit)
+    return commits
+
+
+def test_composite_backlog_operations_commit_once(pg_session):
+    user_id = _user(pg_session)
+    service = BacklogTaskService(pg_session)
+    commits = _count_commits(pg_session)
+
+    task = service.create_task(user_id, BacklogTaskCreate(title="habit", progress=50))
+    assert len(commits) == 1
+    assert task.occurrence_count == 1
+
+    service.schedule_task(
+        user_id, str(task.id), BacklogTaskSchedule(plan_date=date.today() + timedelta(days=1))
+    )
+    assert len(commits) == 2
+
+    completed = service.complete_task(str(task.id))
+    assert len(commits) == 3
+    assert completed.status.value == "done"
+    today_link = service.get_link_for_date(str(task.id), date.today())
+    assert today_link.progress_after == 100
+    assert today_link.daily_progress_entry.status == DailyProgressEntryStatus.DONE
+
+    day = DailyProgressService(pg_session).get_day_by_date(user_id, date.today())
+    entry = service.add_to_daily_progress_day(
+        user_id, str(day.id), DailyProgressEntryAdd(title="one-off")
+    )
+    assert len(commits) == 4
+    assert entry.backlog_task_id is not None
+
+
+def test_flush_only_day_insert_race_keeps_outer_transaction(pg_session):
+    user_id = _user(pg_session)
+    plan_date = date(2026, 3, 1)
+    # Inserted outside the ORM, as if by a concurrent request
+    pg_session.execute(
+        DailyProgressDay.__table__.insert().values(
+            id=uuid.uuid4(), user_id=user_id, progress_date=plan_date, title="existing"
+        )
+    )
+    pending = BacklogTask(user_id=user_id, title="unsaved work")
+    pg_session.add(pending)
+    pg_session.flush()
+
+    service = DailyProgressService(pg_session, flush_only=True)
+    day, created = service.create_or_merge_day(
+        user_id, DailyProgressDayCreate(progress_date=plan_date, notes="merged")
+    )
+
+    assert not created
+    assert day.title == "existing" and day.notes == "merged"
+    assert pg_session.get(BacklogTask, pending.id) is not None
@@ -0,0 +1,226 @@
+"""Day range rendering for the daily progress list (PostgreSQL only)."""
+import uuid
+from datetime import date, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.api.v1.deps import get_current_user, get_db
+from app.main import app
+from app.models import (
+    BacklogDailyLink,
+    BacklogTask,
+    DailyProgressDay,
+    DailyProgressEntry,
+    DailyProgressEntryStatus,
+    User,
+)
+from app.models.task_context import TaskContext
+from app.services.daily_progress_service import DailyProgressService
+
+START = date(2026, 3, 1)
+
+
+def _seed(session, days=12) -> str:
+    user = User(
+        username=f"range_{uuid.uuid4().hex[:8]}",
+        email=f"{uuid.uuid4().hex[:8]}@example.com",
+        hashed_password="x",
+    )
+    session.add(user)
+    session.flush()
+    habit = BacklogTask(user_id=user.id, title="habit", progress=60)
+    session.add(habit)
+    session.flush()
+    for offset in range(days):
+        day = DailyProgressDay(user_id=user.id, progress_date=START + timedelta(days=offset))
+        session.add(day)
+        session.flush()
+        if offset % 4 == 3:
+            continue  # an empty day
+        session.add(
+            DailyProgressEntry(
+                daily_progress_day_id=day.id,
+                title="read",
+                context=TaskContext.LEARNING,
+                status=DailyProgressEntryStatus.DONE,
+            )
+        )
+        if offset % 2 == 0:
+            entry = DailyProgressEntry(
+                daily_progress_day_id=day.id,
+                title="habit",
+                context=TaskContext.WORK,
+                backlog_task_id=habit.id,
+            )
+            session.add(entry)
+            session.flush()
+            session.add(
+                BacklogDailyLink(
+                    backlog_task_id=habit.id,
+                    daily_task_id=entry.id,
+                    plan_date=day.progress_date,
+                    progress_after=min(offset * 5, 100) or None,
+                )
+            )
+    session.flush()
+    return str(user.id)
+
+
+def _render(session, user_id, context=None):
+    statements = []
+
+    def capture(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    service = DailyProgressService(session)
+    connection = session.connection()
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        days = service.get_user_days(user_id, context=context, with_entries=True)
+        responses = service.to_day_responses(days, context=context)
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+    return responses, len(statements)
+
+
+def _per_day(session, user_id, context=None):
+    """The former rendering: lazy entries and one progress batch per day."""
+    session.expire_all()
+    service = DailyProgressService(session)
+    responses = [service.to_day_response(day, context=context) for day in service.get_user_days(user_id)]
+    if context is not None:
+        responses = [day for day in responses if day.total_tasks > 0]
+    return responses
+
+
+def _key(response):
+    entries = sorted(
+        (entry.model_dump() for entry in response.daily_progress_entries),
+        key=lambda entry: str(entry["id"]),
+    )
+    return {**response.model_dump(exclude={"daily_progress_entries"}), "entries": entries}
+
+
+def test_range_rendering_is_constant_queries_and_matches_per_day(pg_session):
+    user_id = _seed(pg_session)
+
+    responses, queries = _render(pg_session, user_id)
+
+    # Days, their entries, their summaries, and backlog progress for the whole range
+    assert queries == 4
+    assert len(responses) == 12
+    assert [_key(day) for day in responses] == [_key(day) for day in _per_day(pg_session, user_id)]
+    linked = [
+        entry
+        for day in responses
+        for entry in day.daily_progress_entries
+        if entry.backlog_task_id is not None
+    ]
+    assert len(linked) == 6 and all(entry.progress_after is not None for entry in linked)
+
+
+def test_range_context_filter_runs_in_sql(pg_session):
+    user_id = _seed(pg_session)
+
+    responses, queries = _render(pg_session, user_id, context=TaskContext.WORK)
+
+    assert queries == 4
+    assert [day.progress_date for day in responses] == [
+        START + timedelta(days=offset) for offset in (10, 8, 6, 4, 2, 0)
+    ]
+    assert all(day.total_tasks == 1 and day.completion_rate == 0.0 for day in responses)
+    assert [_key(day) for day in responses] == [
+        _key(day) for day in _per_day(pg_session, user_id, context=TaskContext.WORK)
+    ]
+
+
+def test_day_pages_default_to_a_window_and_continue_by_cursor(pg_session):
+    user_id = _seed(pg_session, days=40)
+    service = DailyProgressService(pg_session)
+
+    window = service.get_day_page(user_id)
+    assert len(window.items) == 31 and window.total == 40 and window.next_cursor
+    assert window.items[0].progress_date == START + timedelta(days=39)
+
+    dates, cursor = [], None
+    while True:
+        page = service.get_day_page(user_id, context=TaskContext.WORK, limit=8, cursor=cursor)
+        dates += [day.progress_date for day in page.items]
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+    assert dates == [
+        day.progress_date for day in service.get_user_days(user_id, context=TaskContext.WORK)
+    ]
+
+    closed = service.get_day_page(user_id, START, START + timedelta(days=39))
+    assert len(closed.items) == 40 and closed.next_cursor is None
+    assert service.get_day_page(user_id, limit=5, include_total=False).total is None
+
+
+def test_compact_day_counts_are_one_aggregate_query(pg_session):
+    user_id = _seed(pg_session)
+    service = DailyProgressService(pg_session)
+    responses, _queries = _render(pg_session, user_id)
+
+    statements = []
+
+    def capture(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    connection = pg_session.connection()
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        first = service.get_day_count_page(user_id, limit=7, include_total=False)
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+    rest = service.get_day_count_page(user_id, limit=7, cursor=first.next_cursor)
+
+    assert len(statements) == 1 and "GROUP BY" in statements[0]
+    assert rest.next_cursor is None
+    fields = ("id", "progress_date", "title", "total_tasks", "completed_tasks", "completion_rate")
+    assert [day.model_dump(include=set(fields)) for day in first.items + rest.items] == [
+        day.model_dump(include=set(fields)) for day in responses
+    ]
+
+    work = service.get_day_count_page(user_id, context=TaskContext.WORK)
+    assert [(day.total_tasks, day.completed_tasks) for day in work.items] == [(1, 0)] * 6
+    assert work.total == 6
+
+
+def test_list_endpoint_pages_and_compact_mode(pg_session):
+    user_id = _seed(pg_session)
+    user = pg_session.get(User, user_id)
+
+    def fake_get_db():
+        yield pg_session
+
+    app.dependency_overrides[get_current_user] = lambda: user
+    app.dependency_overrides[get_db] = fake_get_db
+    try:
+        client = TestClient(app)
+        full = client.get("/api/v1/daily-progress/?limit=5").json()
+        compact = client.get(
+            f"/api/v1/daily-progress/?limit=5&compact=true&cursor={full['next_cursor']}"
+        ).json()
+        uncounted = client.get("/api/v1/daily-progress/?limit=5&include_total=false").json()
+        invalid = client.get("/api/v1/daily-progress/?cursor=not-a-cursor")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert len(full["daily_progress_days"]) == 5 and full["total"] == compact["total"] == 12
+    assert "daily_progress_entries" in full["daily_progress_days"][0]
+    assert uncounted["total"] is None
+    assert [day["progress_date"] for day in compact["daily_progress_days"]] == [
+        (START + timedelta(days=offset)).isoformat() for offset in (6, 5, 4, 3, 2)
+    ]
+    assert set(compact["daily_progress_days"][0]) == {
+        "id",
+        "progress_date",
+        "title",
+        "total_tasks",
+        "completed_tasks",
+        "completion_rate",
+    }
+    assert invalid.status_code == 422
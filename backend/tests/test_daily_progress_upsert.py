@@ -0,0 +1,66 @@
+"""create_or_merge_day as a single upsert (PostgreSQL only)."""
+import uuid
+from datetime import date
+
+from sqlalchemy import event
+
+from app.models import DailyProgressDay, MonthlyPlan, User
+from app.schemas.daily_progress import DailyProgressDayCreate
+from app.services.daily_progress_service import DailyProgressService
+
+
+def _user(session) -> str:
+    user = User(
+        username=f"upsert_{uuid.uuid4().hex[:8]}",
+        email=f"{uuid.uuid4().hex[:8]}@example.com",
+        hashed_password="x",
+    )
+    session.add(user)
+    session.flush()
+    return str(user.id)
+
+
+def test_create_or_merge_day_is_one_statement_applying_merge_rules(pg_session):
+    user_id = _user(pg_session)
+    plans = [MonthlyPlan(user_id=user_id, year=2026, month=month) for month in (3, 4)]
+    pg_session.add_all(plans)
+    pg_session.flush()
+    service = DailyProgressService(pg_session, flush_only=True)
+    plan_date = date(2026, 3, 1)
+
+    statements = []
+
+    def capture(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    connection = pg_session.connection()
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        day, created = service.create_or_merge_day(
+            user_id, DailyProgressDayCreate(progress_date=plan_date, notes="first \n")
+        )
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+
+    assert created and len(statements) == 1
+    assert "ON CONFLICT (user_id, progress_date) DO UPDATE" in statements[0]
+    assert (day.title, day.notes) == ("2026-03-01 每日进度", "first \n")
+
+    same, created = service.create_or_merge_day(
+        user_id,
+        DailyProgressDayCreate(
+            progress_date=plan_date, title="Focus", notes=" second ", monthly_plan_id=plans[0].id
+        ),
+    )
+    assert not created and same is day
+    assert (day.title, day.notes, day.monthly_plan_id) == ("Focus", "first\n---\nsecond", plans[0].id)
+
+    # Blank title / notes keep the stored values; a set monthly plan is not replaced
+    service.create_or_merge_day(
+        user_id,
+        DailyProgressDayCreate(
+            progress_date=plan_date, title="  ", notes="\n", monthly_plan_id=plans[1].id
+        ),
+    )
+    assert (day.title, day.notes, day.monthly_plan_id) == ("Focus", "first\n---\nsecond", plans[0].id)
+    assert pg_session.query(DailyProgressDay).filter_by(user_id=user_id).count() == 1
@@ -0,0 +1,27 @@
+"""Tests for sargable date-range query helpers."""
+from datetime import date
+
+from sqlalchemy import Column, Date
+from sqlalchemy.dialects import postgresql
+
+from app.db.date_ranges import date_in_period, period_bounds
+
+
+def test_period_bounds_are_half_open():
+    assert period_bounds(2026) == (date(2026, 1, 1), date(2027, 1, 1))
+    assert period_bounds(2026, 2) == (date(2026, 2, 1), date(2026, 3, 1))
+    assert period_bounds(2026, 12) == (date(2026, 12, 1), date(2027, 1, 1))
+    assert period_bounds(2026, 12, 31) == (date(2026, 12, 31), date(2027, 1, 1))
+
+
+def test_date_in_period_compares_the_bare_column():
+    progress_date = Column("progress_date", Date)
+
+    sql = str(
+        date_in_period(progress_date, 2026, 3).compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+    assert sql == "progress_date >= '2026-03-01' AND progress_date < '2026-04-01'"
+    assert "EXTRACT" not in sql.upper()
@@ -0,0 +1,70 @@
+"""Fuzzy-duplicate counts from the normalized_title index (PostgreSQL only)."""
+import uuid
+from datetime import date, datetime
+
+from app.models import BacklogTask, User
+from app.services.task_data_repair_service import TaskDataRepairService
+
+
+def _user(session) -> str:
+    user = User(
+        username=f"dup_{uuid.uuid4().hex[:8]}",
+        email=f"{uuid.uuid4().hex[:8]}@example.com",
+        hashed_password="x",
+    )
+    session.add(user)
+    session.flush()
+    return str(user.id)
+
+
+def _task(session, user_id, title, created_at):
+    task = BacklogTask(user_id=user_id, title=title, created_at=created_at)
+    session.add(task)
+    session.flush()
+    return str(task.id)
+
+
+def test_counts_same_normalized_title_within_window(pg_session):
+    user_id = _user(pg_session)
+    other_user = _user(pg_session)
+    first = _task(pg_session, user_id, "Read book", datetime(2026, 3, 1))
+    second = _task(pg_session, user_id, "  read BOOK ", datetime(2026, 3, 8))
+    late = _task(pg_session, user_id, "read book", datetime(2026, 3, 8, 0, 0, 1))
+    undated = _task(pg_session, user_id, "read book", None)
+    unrelated = _task(pg_session, user_id, "Gym", datetime(2026, 3, 2))
+    _task(pg_session, other_user, "read book", datetime(2026, 3, 2))
+
+    service = TaskDataRepairService(pg_session)
+
+    assert service.compute_fuzzy_duplicate_counts(user_id, [first, second, late]) == {
+        first: 1,
+        second: 2,
+        late: 1,
+    }
+    counts = service.compute_fuzzy_duplicate_counts(user_id)
+    assert counts[undated] == 0
+    assert counts[unrelated] == 0
+    assert service.compute_fuzzy_duplicate_counts(user_id, []) == {}
+
+
+def test_normalized_title_trims_unicode_whitespace_like_python(pg_session):
+    user_id = _user(pg_session)
+    plain = _task(pg_session, user_id, "任务", datetime(2026, 3, 1))
+    full_width = _task(pg_session, user_id, "任务　", datetime(2026, 3, 2))
+    tabbed = _task(pg_session, user_id, "\t任务\n", datetime(2026, 3, 3))
+    pg_session.expire_all()
+
+    service = TaskDataRepairService(pg_session)
+
+    titles = {
+        task.normalized_title
+        for task in pg_session.query(BacklogTask).filter(BacklogTask.user_id == user_id)
+    }
+    assert titles == {"任务"}
+    assert service.compute_fuzzy_duplicate_counts(user_id) == {
+        plain: 2,
+        full_width: 2,
+        tabbed: 2,
+    }
+    match = service._find_matching_backlog(user_id, " 任务　", date(2026, 3, 1))
+    assert str(match.id) == plain
@@ -0,0 +1,109 @@
+"""Tests for the shared keyset (cursor) pagination helpers."""
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.db.pagination import (
+    InvalidCursorError,
+    SortKey,
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+)
+from app.models import BacklogTask, QuickNote, User
+from app.services.quick_note_service import QuickNoteService
+
+
+def _sql(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+def test_cursor_round_trips_sort_key_types():
+    values = [
+        datetime(2026, 3, 1, 8, 30, 15, 123456),
+        datetime(2026, 3, 1, tzinfo=timezone.utc),
+        date(2026, 3, 2),
+        uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        2,
+        True,
+        None,
+        "text",
+    ]
+
+    cursor = encode_cursor(values)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, len(values)) == values
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["not base64!", encode_cursor([1, 2]), "W3siZHQiOiJub3BlIn1d", "e30"],
+)
+def test_decode_rejects_malformed_or_foreign_cursors(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, 1)
+
+
+def test_uniform_direction_uses_row_value_comparison():
+    keys = (SortKey(QuickNote.created_at), SortKey(QuickNote.id))
+    clause = keyset_after(keys, [datetime(2026, 1, 1), uuid.uuid4()])
+
+    sql = _sql(clause)
+    assert "(quick_notes.created_at, quick_notes.id) >" in sql
+    assert " OR " not in sql
+
+    descending = (SortKey(QuickNote.created_at, descending=True), SortKey(QuickNote.id, descending=True))
+    assert "(quick_notes.created_at, quick_notes.id) <" in _sql(
+        keyset_after(descending, [datetime(2026, 1, 1), uuid.uuid4()])
+    )
+
+
+def test_mixed_directions_and_nulls_expand_per_key():
+    keys = (
+        SortKey(BacklogTask.last_plan_date, nullable=True),
+        SortKey(BacklogTask.created_at, descending=True),
+        SortKey(BacklogTask.id),
+    )
+
+    sql = _sql(keyset_after(keys, [date(2026, 1, 2), datetime(2026, 1, 1), uuid.uuid4()]))
+    assert "backlog_tasks.last_plan_date > " in sql
+    assert "backlog_tasks.last_plan_date IS NULL" in sql
+    assert "backlog_tasks.created_at < " in sql
+
+    # A NULL cursor value only matches NULLs ahead of it on the next keys
+    sql = _sql(keyset_after(keys, [None, datetime(2026, 1, 1), uuid.uuid4()]))
+    assert "backlog_tasks.last_plan_date > " not in sql
+    assert "backlog_tasks.last_plan_date IS NULL AND backlog_tasks.created_at < " in sql
+
+
+def test_quick_note_cursor_pages_match_offset_pages(pg_session):
+    user = User(
+        username=f"keyset_{uuid.uuid4().hex[:8]}",
+        email=f"{uuid.uuid4().hex[:8]}@example.com",
+        hashed_password="x",
+    )
+    pg_session.add(user)
+    pg_session.flush()
+    start = datetime(2026, 1, 1)
+    for n in range(7):
+        # Pairs of notes share created_at, so the id tie-break decides page edges
+        pg_session.add(
+            QuickNote(user_id=user.id, content=f"note {n}", created_at=start + timedelta(minutes=n // 2))
+        )
+    pg_session.flush()
+    service = QuickNoteService(pg_session)
+
+    first = service.list_notes(user.id, limit=3)
+    second = service.list_notes(user.id, limit=3, cursor=first.next_cursor, include_total=False)
+    last = service.list_notes(user.id, limit=3, cursor=second.next_cursor)
+
+    assert first.total == 7 and second.total is None
+    assert last.next_cursor is None
+    by_offset = [note.id for note in service.list_notes(user.id, limit=10).items]
+    assert [note.id for note in first.items + second.items + last.items] == by_offset
+    assert [note.id for note in service.list_notes(user.id, limit=3, offset=3).items] == [
+        note.id for note in second.items
+    ]
@@ -3,6 +3,7 @@
 from datetime import date
 from types import SimpleNamespace
 
+from app.db.pagination import Page
 from app.mcp.tools.daily_progress import (
     dump_daily_progress,
     list_day_responses,
@@ -55,9 +56,12 @@ def test_list_day_responses_filters_empty_days_when_context_set():
     )
 
     class FakeService:
-        def get_user_days(self, user_id, start_date=None, end_date=None):
-            del user_id, start_date, end_date
-            return [day_a, day_b]
+        def get_day_page(self, user_id, start_date=None, end_date=None, **options):
+            del user_id, start_date, end_date, options
+            return Page(items=[day_a, day_b], total=2)
+
+        def to_day_responses(self, days, *, context=None):
+            return [self.to_day_response(day, context=context) for day in days]
 
         def to_day_response(self, day, *, context=None):
             entries = [
@@ -73,16 +77,16 @@ def test_list_day_responses_filters_empty_days_when_context_set():
                 completion_rate=0.0,
             )
 
-    responses = list_day_responses(
+    page = list_day_responses(
         FakeService(),
         "user-1",
         start_date=date(2026, 5, 26),
         end_date=date(2026, 5, 27),
         context=TaskContext.WORK,
     )
-    assert len(responses) == 1
-    assert responses[0].id == "day-a"
-    assert responses[0].total_tasks == 1
+    assert page.total == 1 and page.next_cursor is None
+    assert page.items[0].id == "day-a"
+    assert page.items[0].total_tasks == 1
 
 
 def test_list_day_responses_keeps_all_days_without_context():
@@ -92,9 +96,12 @@ def test_list_day_responses_keeps_all_days_without_context():
     day_b = SimpleNamespace(id="day-b", daily_progress_entries=[])
 
     class FakeService:
-        def get_user_days(self, user_id, start_date=None, end_date=None):
-            del user_id, start_date, end_date
-            return [day_a, day_b]
+        def get_day_page(self, user_id, start_date=None, end_date=None, **options):
+            del user_id, start_date, end_date, options
+            return Page(items=[day_a, day_b], total=2)
+
+        def to_day_responses(self, days, *, context=None):
+            return [self.to_day_response(day, context=context) for day in days]
 
         def to_day_response(self, day, *, context=None):
             entries = list(day.daily_progress_entries)
@@ -106,14 +113,14 @@ def test_list_day_responses_keeps_all_days_without_context():
                 completion_rate=0.0,
             )
 
-    responses = list_day_responses(
+    page = list_day_responses(
         FakeService(),
         "user-1",
         start_date=None,
         end_date=None,
         context=None,
     )
-    assert len(responses) == 2
+    assert len(page.items) == 2
 
 
 def test_mcp_server_lists_daily_progress_tool_only():
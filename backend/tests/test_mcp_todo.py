@@ -3,6 +3,7 @@
 import pytest
 from fastmcp.exceptions import ToolError
 
+from app.db.pagination import Page
 from app.mcp.helpers import tool_error
 from app.mcp.tools.todo import _resolve_task_id
 
@@ -17,9 +18,11 @@ class _FakeBacklogTaskService:
     def __init__(self, tasks_by_tab: dict[str, list[_FakeTask]]) -> None:
         self.tasks_by_tab = tasks_by_tab
 
-    def get_user_tasks(self, user_id: str, tab: str, q: str | None = None, limit: int = 50):
-        del user_id, q, limit
-        return list(self.tasks_by_tab.get(tab, [])), len(self.tasks_by_tab.get(tab, []))
+    def get_user_tasks(
+        self, user_id: str, tab: str, q: str | None = None, limit: int = 50, include_total: bool = True
+    ):
+        del user_id, q, limit, include_total
+        return Page(items=list(self.tasks_by_tab.get(tab, [])))
 
 
 def test_tool_error_raises_tool_error():
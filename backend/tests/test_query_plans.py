@@ -0,0 +1,173 @@
+"""EXPLAIN-based checks that date-filtered daily progress queries can use indexes.
+
+Uses the ``pg_session`` fixture: needs a migrated PostgreSQL database at
+settings.DATABASE_URL and is skipped otherwise.
+"""
+import json
+import uuid
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import event, func, text
+from sqlalchemy.orm import Session
+
+from app.models import (
+    BacklogDailyLink,
+    BacklogTask,
+    DailyProgressDay,
+    DailyProgressEntry,
+    DailyProgressEntryStatus,
+    User,
+)
+from app.services.analytics_service import AnalyticsService
+from app.services.backlog_task_service import BacklogTaskService
+from app.services.daily_progress_service import DailyProgressService
+from app.services.user_daily_stats_service import UserDailyStatsService
+
+INDEXED_TABLES = {
+    "daily_progress_days",
+    "daily_progress_entries",
+    "user_daily_stats",
+    "backlog_daily_links",
+}
+
+
+def _seed(session: Session) -> tuple:
+    user = User(
+        username=f"plan_{uuid.uuid4().hex[:8]}",
+        email=f"{uuid.uuid4().hex[:8]}@example.com",
+        hashed_password="x",
+    )
+    session.add(user)
+    session.flush()
+
+    backlog = BacklogTask(user_id=user.id, title="recurring")
+    session.add(backlog)
+    session.flush()
+
+    start = date(2025, 1, 1)
+    for offset in range(400):
+        day = DailyProgressDay(user_id=user.id, progress_date=start + timedelta(days=offset))
+        session.add(day)
+        session.flush()
+        for n in range(3):
+            entry = DailyProgressEntry(
+                daily_progress_day_id=day.id,
+                title=f"task {n}",
+                status=DailyProgressEntryStatus.DONE if n else DailyProgressEntryStatus.TODO,
+            )
+            session.add(entry)
+        if offset % 7 == 0:
+            session.flush()
+            session.add(
+                BacklogDailyLink(
+                    backlog_task_id=backlog.id, daily_task_id=entry.id, plan_date=day.progress_date
+                )
+            )
+    session.flush()
+    UserDailyStatsService(session).rebuild(str(user.id))
+    session.execute(text("ANALYZE daily_progress_days, daily_progress_entries, user_daily_stats, backlog_daily_links"))
+    return str(user.id), str(backlog.id), start
+
+
+DATE_COLUMNS = ("progress_date", "plan_date")
+
+
+def _scanned_tables(plan: dict, found: dict) -> dict:
+    """{table: [(node type, row filter applied after the scan)]} for every scan node."""
+    if "Relation Name" in plan:
+        found.setdefault(plan["Relation Name"], []).append(
+            (plan["Node Type"], plan.get("Filter", ""))
+        )
+    for child in plan.get("Plans", []):
+        _scanned_tables(child, found)
+    return found
+
+
+def _capture_plans(session: Session, run) -> list:
+    """Run ``run()`` and EXPLAIN every statement it issued against the indexed tables."""
+    connection = session.connection()
+    statements = []
+
+    def capture(_conn, _cursor, statement, parameters, _context, _executemany):
+        if statement.lstrip().upper().startswith("SELECT") and any(
+            table in statement for table in INDEXED_TABLES
+        ):
+            statements.append((statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        run()
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+
+    # With sequential scans priced out, any predicate an index can serve will use it.
+    session.execute(text("SET LOCAL enable_seqscan = off"))
+    plans = []
+    for statement, parameters in statements:
+        raw = connection.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters).scalar()
+        plan = raw if isinstance(raw, list) else json.loads(raw)
+        plans.append((statement, _scanned_tables(plan[0]["Plan"], {})))
+    return plans
+
+
+def _assert_index_scans(plans: list) -> None:
+    """No seq scans, and date predicates are index conditions rather than row filters."""
+    assert plans
+    for statement, tables in plans:
+        for table, scans in tables.items():
+            if table not in INDEXED_TABLES:
+                continue
+            for node_type, row_filter in scans:
+                assert node_type != "Seq Scan", f"{table} seq-scanned by:\n{statement}"
+                assert not any(col in row_filter for col in DATE_COLUMNS), (
+                    f"{table} filters {row_filter} outside the index in:\n{statement}"
+                )
+
+
+def test_analytics_queries_use_indexes(pg_session):
+    user_id, _backlog_id, start = _seed(pg_session)
+    service = AnalyticsService(pg_session)
+
+    def run():
+        service.get_dashboard_stats(user_id)
+        service.get_yearly_stats(user_id, 2025)
+        service.get_monthly_stats(user_id, 2025, 3)
+        service.get_heatmap_data(user_id, start, start + timedelta(days=90))
+        for period in ("daily", "weekly", "monthly"):
+            service.get_completion_rate_trend(user_id, period, start, start + timedelta(days=120))
+        service.get_insights(user_id, start, start + timedelta(days=399))
+
+    _assert_index_scans(_capture_plans(pg_session, run))
+
+
+def test_entry_and_link_lookups_use_indexes(pg_session):
+    user_id, backlog_id, start = _seed(pg_session)
+    daily = DailyProgressService(pg_session)
+    backlog = BacklogTaskService(pg_session)
+    day = daily.get_day_by_date(user_id, start)
+
+    def run():
+        daily.get_day_entries(str(day.id))
+        pg_session.query(func.count(DailyProgressEntry.id)).filter(
+            DailyProgressEntry.daily_progress_day_id == day.id,
+            DailyProgressEntry.status == DailyProgressEntryStatus.DONE,
+        ).scalar()
+        backlog.get_link_for_date(backlog_id, start)
+
+    _assert_index_scans(_capture_plans(pg_session, run))
+
+
+def test_extract_predicate_is_not_sargable(pg_session):
+    """Guard: the pattern the date-range helpers replace is caught by the assertion."""
+    user_id, _backlog_id, _start = _seed(pg_session)
+
+    def run():
+        pg_session.query(func.count(DailyProgressDay.id)).filter(
+            DailyProgressDay.user_id == user_id,
+            func.extract("year", DailyProgressDay.progress_date) == 2025,
+        ).scalar()
+
+    plans = _capture_plans(pg_session, run)
+    with pytest.raises(AssertionError, match="outside the index"):
+        _assert_index_scans(plans)
@@ -2,6 +2,7 @@
 from fastapi.testclient import TestClient
 
 from app.core.config import settings
+from app.db.pagination import Page
 
 
 def test_list_quick_notes_ok_when_authenticated(monkeypatch, client_authenticated):
@@ -10,7 +11,7 @@ def test_list_quick_notes_ok_when_authenticated(monkeypatch, client_authenticate
             pass
 
         def list_notes(self, user_id, **kwargs):
-            return [], 0
+            return Page(items=[], total=0)
 
         def to_response(self, note):
             raise NotImplementedError
@@ -21,7 +22,7 @@ def test_list_quick_notes_ok_when_authenticated(monkeypatch, client_authenticate
     )
     response = client_authenticated.get("/api/v1/quick-notes")
     assert response.status_code == 200
-    assert response.json() == {"notes": [], "total": 0}
+    assert response.json() == {"notes": [], "total": 0, "next_cursor": None}
 
 
 def test_upload_quick_note_image_forbidden_without_permission(
@@ -0,0 +1,134 @@
+"""Tests for cross-type keyword search."""
+import re
+import uuid
+from datetime import date
+
+import pytest
+from fastmcp.exceptions import ToolError
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from app.mcp.tools.search import handle_search
+from app.models import (
+    BacklogTask,
+    DailyProgressDay,
+    DailyProgressEntry,
+    DailySummary,
+    QuickNote,
+    SummaryType,
+    User,
+)
+from app.services.search_service import SearchService, highlight_snippet
+
+
+def test_highlight_snippet_centres_on_first_match():
+    content = "a" * 100 + " 今天学习了索引 " + "b" * 100
+
+    snippet, highlights = highlight_snippet(content, "索引", radius=10)
+
+    assert snippet.startswith("…") and snippet.endswith("…")
+    assert [snippet[start:end] for start, end in highlights] == ["索引"]
+
+
+def test_highlight_snippet_marks_every_term_case_insensitively():
+    snippet, highlights = highlight_snippet("Fix the INDEX bug in index.py", "index bug")
+
+    assert snippet == "Fix the INDEX bug in index.py"
+    assert [snippet[start:end] for start, end in highlights] == ["INDEX", "bug", "index"]
+
+
+def test_highlight_snippet_without_verbatim_match_keeps_text_start():
+    snippet, highlights = highlight_snippet("postgres  tuning\nnotes", "postgrse", radius=5)
+
+    assert snippet == "postgres t…"
+    assert highlights == []
+
+
+def test_match_conditions_use_trigram_indexable_operators():
+    query = SearchService(db=None)._quick_note_matches("user-1", "100%")
+    sql = str(query.compile(dialect=postgresql.dialect()))
+
+    assert "quick_notes.content ILIKE" in sql and "ESCAPE" in sql
+    assert re.search(r"<%+ quick_notes.content", sql)
+    assert "word_similarity" in sql
+
+
+def test_search_endpoint_requires_auth(client):
+    assert client.get("/api/v1/search?q=x").status_code == 401
+
+
+def test_search_endpoint_rejects_unknown_types(client_authenticated):
+    response = client_authenticated.get("/api/v1/search?q=x&types=quick_note,emails")
+
+    assert response.status_code == 400
+    assert "backlog_task, quick_note, daily_entry, daily_summary" in response.json()["detail"]
+
+
+def test_mcp_search_validates_payload():
+    with pytest.raises(ToolError, match="q is required"):
+        handle_search({"action": "search", "q": "  "})
+    with pytest.raises(ToolError, match="types must be a subset"):
+        handle_search({"q": "x", "types": "quick_note,emails"})
+
+
+@pytest.fixture
+def trgm_session(pg_session):
+    installed = pg_session.execute(
+        text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+    ).scalar()
+    if not installed:
+        pytest.skip("requires the pg_trgm extension")
+    return pg_session
+
+
+def test_search_ranks_and_scopes_results_per_user(trgm_session):
+    session = trgm_session
+    user, other = (
+        User(
+            username=f"search_{uuid.uuid4().hex[:8]}",
+            email=f"{uuid.uuid4().hex[:8]}@example.com",
+            hashed_password="x",
+        )
+        for _ in range(2)
+    )
+    session.add_all([user, other])
+    session.flush()
+    day = DailyProgressDay(user_id=user.id, progress_date=date(2026, 3, 1))
+    session.add(day)
+    session.flush()
+    session.add_all(
+        [
+            BacklogTask(user_id=user.id, title="整理索引笔记", description="GIN 与 btree"),
+            BacklogTask(user_id=user.id, title="周报", description="顺便复习索引"),
+            QuickNote(user_id=user.id, content="trigram 索引让模糊搜索变快"),
+            DailyProgressEntry(daily_progress_day_id=day.id, title="设计索引"),
+            DailySummary(
+                daily_progress_day_id=day.id,
+                user_id=user.id,
+                summary_type=SummaryType.DAILY,
+                content="今天的索引调优完成",
+            ),
+            QuickNote(user_id=other.id, content="别人的索引"),
+        ]
+    )
+    session.flush()
+    service = SearchService(session)
+
+    results = service.search(str(user.id), "索引").results
+
+    assert {hit.type for hit in results} == {
+        "backlog_task",
+        "quick_note",
+        "daily_entry",
+        "daily_summary",
+    }
+    assert len(results) == 5
+    # A title match outranks a description-only match of the same task type
+    backlog = [hit.title for hit in results if hit.type == "backlog_task"]
+    assert backlog == ["整理索引笔记", "周报"]
+    entry = next(hit for hit in results if hit.type == "daily_entry")
+    assert entry.daily_progress_day_id == day.id and entry.occurred_on == date(2026, 3, 1)
+    assert all(hit.snippet[start:end] == "索引" for hit in results for start, end in hit.highlights)
+
+    only_notes = service.search(str(user.id), "索引", types=["quick_note"], limit=1).results
+    assert [hit.type for hit in only_notes] == ["quick_note"]
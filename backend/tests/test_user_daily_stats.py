@@ -0,0 +1,107 @@
+"""Tests for the user_daily_stats rollup maintenance."""
+
+import uuid
+from datetime import date
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from app.cache.analytics import analytics_cache
+from app.models import DailyProgressDay, DailyProgressEntry, User
+from app.models.daily_progress import DailyProgressEntryStatus
+from app.schemas.analytics import DashboardStats
+from app.services.daily_progress_service import DailyProgressService
+from app.services.user_daily_stats_service import UserDailyStatsService
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_refresh_days_without_dates_is_noop():
+    db = MagicMock()
+
+    UserDailyStatsService(db).refresh_days(uuid.uuid4(), [None])
+
+    db.flush.assert_not_called()
+    db.execute.assert_not_called()
+
+
+def test_refresh_days_upserts_then_drops_empty_days():
+    db = MagicMock()
+
+    UserDailyStatsService(db).refresh_days(uuid.uuid4(), [date(2026, 3, 2), date(2026, 3, 2)])
+
+    db.flush.assert_called_once()
+    upsert, cleanup = [_compile(call.args[0]) for call in db.execute.call_args_list]
+    assert upsert.startswith("INSERT INTO user_daily_stats")
+    assert "GROUP BY daily_progress_days.user_id, daily_progress_days.progress_date" in upsert
+    assert "ON CONFLICT (user_id, progress_date) DO UPDATE" in upsert
+    assert cleanup.startswith("DELETE FROM user_daily_stats")
+    assert "NOT (EXISTS" in cleanup
+
+
+def test_rebuild_for_one_user_scopes_delete_and_source():
+    db = MagicMock()
+    user_id = uuid.uuid4()
+
+    UserDailyStatsService(db).rebuild(user_id)
+
+    stale, upsert = [_compile(call.args[0]) for call in db.execute.call_args_list]
+    assert "WHERE user_daily_stats.user_id =" in stale
+    assert "WHERE daily_progress_days.user_id =" in upsert
+
+
+def test_entry_status_change_refreshes_its_day_before_commit():
+    db = MagicMock()
+    service = DailyProgressService(db)
+    entry = MagicMock(daily_progress_day_id="day-1")
+    service.get_entry = MagicMock(return_value=entry)
+    service.stats = MagicMock()
+    service.stats.refresh_for_day_ids.side_effect = lambda _ids: db.commit.assert_not_called()
+
+    service.update_entry_status("entry-1", DailyProgressEntryStatus.DONE)
+
+    service.stats.refresh_for_day_ids.assert_called_once_with(["day-1"])
+    db.commit.assert_called_once()
+
+
+def test_full_rebuild_invalidates_every_affected_users_analytics(pg_session):
+    user = User(
+        username=f"rollup_{uuid.uuid4().hex[:8]}",
+        email=f"{uuid.uuid4().hex[:8]}@example.com",
+        hashed_password="x",
+    )
+    pg_session.add(user)
+    pg_session.flush()
+    day = DailyProgressDay(user_id=user.id, progress_date=date(2026, 3, 2))
+    pg_session.add(day)
+    pg_session.flush()
+    pg_session.add(DailyProgressEntry(daily_progress_day_id=day.id, title="read"))
+    pg_session.commit()
+
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return DashboardStats(
+            total_goals=len(calls),
+            active_goals=0,
+            completed_goals=0,
+            total_monthly_plans=0,
+            total_daily_progress_days=0,
+            total_tasks=0,
+            completed_tasks=0,
+            overall_completion_rate=0.0,
+        )
+
+    user_id = str(user.id)
+    analytics_cache.get_or_compute(user_id, "dashboard", DashboardStats, compute)
+    cached = analytics_cache.get_or_compute(user_id, "dashboard", DashboardStats, compute)
+    assert cached.total_goals == 1
+
+    UserDailyStatsService(pg_session).rebuild()
+    pg_session.commit()
+
+    fresh = analytics_cache.get_or_compute(user_id, "dashboard", DashboardStats, compute)
+    assert fresh.total_goals == 2
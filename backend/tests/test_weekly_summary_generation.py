@@ -0,0 +1,164 @@
+"""Weekly summary generation (PostgreSQL only)."""
+import uuid
+from datetime import date, timedelta
+
+from sqlalchemy import event
+
+from app.models import (
+    DailyProgressDay,
+    DailyProgressEntry,
+    DailyProgressEntryPriority,
+    DailyProgressEntryStatus,
+    DailySummary,
+    SummaryType,
+    User,
+    WeeklySummary,
+)
+from app.services.weekly_summary_service import WeeklySummaryService
+
+YEAR, WEEK = 2026, 10
+MONDAY = date(2026, 3, 2)
+
+
+def _seed(session, monday=MONDAY) -> str:
+    user = User(
+        username=f"weekly_{uuid.uuid4().hex[:8]}",
+        email=f"{uuid.uuid4().hex[:8]}@example.com",
+        hashed_password="x",
+    )
+    session.add(user)
+    session.flush()
+    priorities = list(DailyProgressEntryPriority)
+    # Five days of the week plus one outside it
+    for offset in (6, 0, 2, 3, 4, 7):
+        day = DailyProgressDay(user_id=user.id, progress_date=monday + timedelta(days=offset))
+        session.add(day)
+        session.flush()
+        for index in range(offset % 4):
+            session.add(
+                DailyProgressEntry(
+                    daily_progress_day_id=day.id,
+                    title=f"task {offset}-{index}",
+                    priority=priorities[index % 3],
+                    status=(
+                        DailyProgressEntryStatus.DONE
+                        if index % 2 == 0
+                        else DailyProgressEntryStatus.TODO
+                    ),
+                )
+            )
+        if offset == 2:
+            session.add(
+                DailySummary(
+                    daily_progress_day_id=day.id,
+                    user_id=user.id,
+                    summary_type=SummaryType.DAILY,
+                    content="steady",
+                )
+            )
+    session.flush()
+    return str(user.id)
+
+
+def test_generate_weekly_summary_batches_loads_and_counts(pg_session):
+    user_id = _seed(pg_session)
+    pg_session.expire_all()
+    service = WeeklySummaryService(pg_session)
+
+    statements = []
+
+    def capture(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    connection = pg_session.connection()
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        summary = service.generate_weekly_summary(user_id, YEAR, WEEK)
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+
+    reads = [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+    # Days, entries, daily summaries, the existing weekly summary and the refresh
+    assert len(reads) == 5
+    daily = summary.stats["daily_data"]
+    assert [item["date"] for item in daily] == [
+        (MONDAY + timedelta(days=offset)).isoformat() for offset in (0, 2, 3, 4, 6)
+    ]
+    assert [(item["total_tasks"], item["completed_tasks"]) for item in daily] == [
+        (0, 0),
+        (2, 1),
+        (3, 2),
+        (0, 0),
+        (2, 1),
+    ]
+    assert daily[1]["daily_summary"] == {"summary_type": "daily", "content": "steady"}
+    assert daily[2]["completion_rate"] == 66.67
+    assert (summary.total_tasks, summary.completed_tasks, summary.completion_rate) == (7, 4, 57.14)
+    assert summary.stats["priority_distribution"] == {
+        "high": {"total": 1, "completed": 1},
+        "medium": {"total": 3, "completed": 0},
+        "low": {"total": 3, "completed": 3},
+    }
+
+
+def test_bulk_chunks_match_per_user_generation(pg_session):
+    # A week no other test writes to, since a chunk covers every user with progress in it
+    year, week = 2031, 10
+    monday, _sunday = WeeklySummaryService(pg_session).get_week_date_range(year, week)
+    user_ids = sorted((_seed(pg_session, monday) for _ in range(3)), key=uuid.UUID)
+    pg_session.add(
+        WeeklySummary(
+            user_id=user_ids[0],
+            year=year,
+            week_number=week,
+            start_date=monday,
+            end_date=monday + timedelta(days=6),
+            stats={},
+            summary_text="kept",
+        )
+    )
+    pg_session.flush()
+    service = WeeklySummaryService(pg_session)
+
+    statements = []
+
+    def capture(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    connection = pg_session.connection()
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        first, checkpoint = service.generate_weekly_summaries_chunk(
+            year, week, chunk_size=2, task_id="bulk-1"
+        )
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+    second, last = service.generate_weekly_summaries_chunk(
+        year, week, after_user_id=checkpoint, chunk_size=2, task_id="bulk-1"
+    )
+
+    # Users, per-day rows, priority rows and one multi-row upsert
+    assert len(statements) == 4 and "ON CONFLICT" in statements[-1]
+    assert [user_id for user_id, _summary_id in first + second] == user_ids
+    assert checkpoint == user_ids[1] and last == user_ids[2]
+    assert service.generate_weekly_summaries_chunk(year, week, after_user_id=last) == ([], None)
+
+    bulk = {
+        summary.user_id: summary
+        for summary in pg_session.query(WeeklySummary).filter(
+            WeeklySummary.user_id.in_(user_ids), WeeklySummary.year == year
+        ).populate_existing()
+    }
+    assert len(bulk) == 3 and bulk[uuid.UUID(user_ids[0])].summary_text == "kept"
+    assert {summary.auto_generated for summary in bulk.values()} == {"bulk-1"}
+
+    def _totals(summary):
+        return summary.total_tasks, summary.completed_tasks, summary.completion_rate
+
+    expected = {
+        str(user_id): (dict(summary.stats), _totals(summary)) for user_id, summary in bulk.items()
+    }
+    for user_id in user_ids:
+        pg_session.expire_all()
+        summary = service.generate_weekly_summary(user_id, year, week)
+        assert (summary.stats, _totals(summary)) == expected[user_id]
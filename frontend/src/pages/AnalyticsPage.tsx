@@ -68,14 +68,13 @@ export default function AnalyticsPage() {
   const loadAnalytics = async () => {
     try {
       setLoading(true);
-      const [dashboard, yearly, trend] = await Promise.all([
-        analyticsService.getDashboardStats(),
-        analyticsService.getYearlyStats(selectedYear),
-        analyticsService.getCompletionRateTrend("daily", undefined, undefined, 90),
-      ]);
-      setDashboardStats(dashboard);
-      setYearlyStats(yearly);
-      setCompletionTrend(trend);
+      const bundle = await analyticsService.getBundle(
+        ["dashboard", "yearly", "trend"],
+        { period: "daily", days: 90, year: selectedYear }
+      );
+      setDashboardStats(bundle.dashboard);
+      setYearlyStats(bundle.yearly);
+      setCompletionTrend(bundle.trend);
     } catch (error) {
       console.error("Failed to load analytics:", error);
     } finally {
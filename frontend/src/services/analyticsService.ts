@@ -5,6 +5,8 @@ import type {
   MonthlyStats,
   CompletionRateTrend,
   HeatmapData,
+  AnalyticsBundle,
+  AnalyticsView,
 } from "@/types/analytics";
 
 class AnalyticsService {
@@ -70,6 +72,34 @@ class AnalyticsService {
       `${this.baseUrl}/heatmap?${params.toString()}`
     );
   }
+
+  /**
+   * Get several analytics views in one request
+   */
+  async getBundle(
+    views: AnalyticsView[],
+    options: {
+      period?: "daily" | "weekly" | "monthly";
+      startDate?: string;
+      endDate?: string;
+      days?: number;
+      year?: number;
+      month?: number;
+    } = {}
+  ): Promise<AnalyticsBundle> {
+    const params = new URLSearchParams();
+    params.append("views", views.join(","));
+    if (options.period) params.append("period", options.period);
+    if (options.startDate) params.append("start_date", options.startDate);
+    if (options.endDate) params.append("end_date", options.endDate);
+    if (options.days) params.append("days", options.days.toString());
+    if (options.year) params.append("year", options.year.toString());
+    if (options.month) params.append("month", options.month.toString());
+
+    return await api.get<AnalyticsBundle>(
+      `${this.baseUrl}/bundle?${params.toString()}`
+    );
+  }
 }
 
 export const analyticsService = new AnalyticsService();
@@ -4,6 +4,11 @@ import type {
   BacklogTaskDetail,
   BacklogTaskCreate,
   BacklogTaskUpdate,
+  BacklogTaskBatchOperation,
+  BacklogTaskBatchResult,
+  BacklogTaskBulkDeleteResult,
+  BacklogTaskScheduleRange,
+  BacklogTaskScheduleRangeResult,
   BacklogTab,
   BacklogContextFilter,
   BacklogPriorityFilter,
@@ -16,11 +21,15 @@ import type { TaskPriority } from "@/types/taskPriority";
 interface BacklogTaskListResponse {
   tasks: BacklogTask[];
   total: number;
+  /** Pass as `cursor` to fetch the next page; null on the last page */
+  next_cursor?: string | null;
 }
 
 export interface BacklogListPageOptions {
   limit?: number;
   offset?: number;
+  /** next_cursor of the previous page; takes precedence over offset */
+  cursor?: string | null;
 }
 
 class BacklogTaskService {
@@ -54,7 +63,8 @@ class BacklogTaskService {
 
     if (options?.limit != null) {
       params.append("limit", String(options.limit));
-      params.append("offset", String(options.offset ?? 0));
+      if (options.cursor) params.append("cursor", options.cursor);
+      else params.append("offset", String(options.offset ?? 0));
     }
 
     return params;
@@ -99,6 +109,20 @@ class BacklogTaskService {
     return await api.post<BacklogTask>(`${this.baseUrl}/${id}/revert`);
   }
 
+  async batch(operations: BacklogTaskBatchOperation[]): Promise<BacklogTaskBatchResult> {
+    return await api.post<BacklogTaskBatchResult>(`${this.baseUrl}/batch`, { operations });
+  }
+
+  async scheduleRange(body: BacklogTaskScheduleRange): Promise<BacklogTaskScheduleRangeResult> {
+    return await api.post<BacklogTaskScheduleRangeResult>(`${this.baseUrl}/schedule-range`, body);
+  }
+
+  async bulkDelete(ids: string[]): Promise<BacklogTaskBulkDeleteResult> {
+    return await api.post<BacklogTaskBulkDeleteResult>(`${this.baseUrl}/bulk-delete`, {
+      task_ids: ids,
+    });
+  }
+
   contextFilterToParam(filter: BacklogContextFilter): TaskContext | undefined {
     return filter === "all" ? undefined : filter;
   }
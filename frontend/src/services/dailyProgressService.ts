@@ -8,33 +8,82 @@ import type {
   DailyProgressEntryUpdate,
   DailyProgressEntryStatus,
   DailyProgressDayHead,
+  DailyProgressDayCount,
 } from "@/types/dailyProgress";
 import type { TaskContext } from "@/types/taskContext";
 
 export type DailyProgressContextFilter = TaskContext | "all";
 
-interface DailyProgressListResponse {
-  daily_progress_days: DailyProgressDay[];
-  total: number;
+interface DailyProgressListResponse<T = DailyProgressDay> {
+  daily_progress_days: T[];
+  /** All matching days; null when the request set include_total=false */
+  total: number | null;
+  /** Pass as `cursor` to load older days; null on the last page */
+  next_cursor?: string | null;
+}
+
+export interface DailyProgressPageOptions {
+  startDate?: string;
+  endDate?: string;
+  context?: DailyProgressContextFilter;
+  /** Days per page; the server defaults to 31, or 366 for a closed date range */
+  limit?: number;
+  /** next_cursor of the previous page */
+  cursor?: string | null;
 }
 
 export class DailyProgressService {
   private baseUrl = "/daily-progress";
 
+  private buildListParams(options: DailyProgressPageOptions, compact = false): string {
+    const params = new URLSearchParams();
+    if (options.startDate) params.append("start_date", options.startDate);
+    if (options.endDate) params.append("end_date", options.endDate);
+    if (options.context && options.context !== "all") params.append("context", options.context);
+    if (options.limit != null) params.append("limit", String(options.limit));
+    if (options.cursor) params.append("cursor", options.cursor);
+    if (compact) params.append("compact", "true");
+    return params.toString() ? `?${params.toString()}` : "";
+  }
+
+  /** Every day in the range (all pages), newest first */
   async getAll(
-    startDate?: string,
-    endDate?: string,
+    startDate: string,
+    endDate: string,
     context: DailyProgressContextFilter = "all",
   ): Promise<DailyProgressDay[]> {
-    const params = new URLSearchParams();
-    if (startDate) params.append("start_date", startDate);
-    if (endDate) params.append("end_date", endDate);
-    if (context !== "all") params.append("context", context);
+    // Without both bounds (e.g. a cleared date input) following next_cursor would
+    // walk the whole history, so only the most recent page is returned
+    if (!startDate || !endDate) {
+      return (await this.getPage({ startDate, endDate, context })).daily_progress_days;
+    }
+    // The list is paged; follow next_cursor so no day in the range is dropped
+    const days: DailyProgressDay[] = [];
+    let cursor: string | null | undefined;
+    do {
+      const response = await this.getPage({ startDate, endDate, context, cursor });
+      days.push(...response.daily_progress_days);
+      cursor = response.next_cursor;
+    } while (cursor);
+    return days;
+  }
+
+  /** Newest days first; without a date range only the most recent window */
+  async getPage(
+    options: DailyProgressPageOptions = {},
+  ): Promise<DailyProgressListResponse> {
+    return await api.get<DailyProgressListResponse>(
+      `${this.baseUrl}/${this.buildListParams(options)}`,
+    );
+  }
 
-    const response = await api.get<DailyProgressListResponse>(
-      `${this.baseUrl}/${params.toString() ? `?${params.toString()}` : ""}`,
+  /** Same pages as getPage, but only per-day counts (calendar and list views) */
+  async getDayCounts(
+    options: DailyProgressPageOptions = {},
+  ): Promise<DailyProgressListResponse<DailyProgressDayCount>> {
+    return await api.get<DailyProgressListResponse<DailyProgressDayCount>>(
+      `${this.baseUrl}/${this.buildListParams(options, true)}`,
     );
-    return response.daily_progress_days;
   }
 
   /** No nested entries; 404 → null */
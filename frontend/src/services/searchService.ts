@@ -0,0 +1,16 @@
+import api from "./api";
+import type { SearchResponse, SearchType } from "@/types/search";
+
+class SearchService {
+  private baseUrl = "/search/";
+
+  async search(q: string, types?: SearchType[], limit = 20): Promise<SearchResponse> {
+    const params = new URLSearchParams({ q: q.trim(), limit: String(limit) });
+    if (types?.length) {
+      params.set("types", types.join(","));
+    }
+    return api.get<SearchResponse>(`${this.baseUrl}?${params.toString()}`);
+  }
+}
+
+export const searchService = new SearchService();
@@ -20,6 +20,8 @@ export interface AdminUserListItem {
 export interface AdminUserListResponse {
   items: AdminUserListItem[];
   total: number;
+  /** Pass as `cursor` to fetch the next page; null on the last page */
+  next_cursor?: string | null;
 }
 
 export interface RoleListItem {
@@ -110,3 +110,16 @@ export interface HeatmapData {
   end_date: string;
   data: HeatmapDataPoint[];
 }
+
+/** Analytics view names accepted by the bundle endpoint */
+export type AnalyticsView = "dashboard" | "yearly" | "monthly" | "heatmap" | "trend";
+
+/** Several analytics views fetched in one request */
+export interface AnalyticsBundle {
+  views: AnalyticsView[];
+  dashboard: DashboardStats | null;
+  yearly: YearlyStats | null;
+  monthly: MonthlyStats | null;
+  heatmap: HeatmapData | null;
+  trend: CompletionRateTrend | null;
+}
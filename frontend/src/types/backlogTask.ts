@@ -76,6 +76,50 @@ export interface BacklogTaskUpdate {
   progress_plan_date?: string;
 }
 
+export type BacklogTaskBatchOperation =
+  | { op: "create"; data: BacklogTaskCreate }
+  | { op: "update"; task_id: string; data: BacklogTaskUpdate }
+  | { op: "complete"; task_id: string }
+  | { op: "schedule"; task_id: string; plan_date: string };
+
+export interface BacklogTaskBatchItemResult {
+  index: number;
+  op: BacklogTaskBatchOperation["op"];
+  ok: boolean;
+  task: BacklogTask | null;
+  error: string | null;
+}
+
+/** results[i] answers operations[i]; all successful operations commit together */
+export interface BacklogTaskBatchResult {
+  results: BacklogTaskBatchItemResult[];
+  succeeded: number;
+  failed: number;
+}
+
+export interface BacklogTaskScheduleRange {
+  /** Each of these tasks goes on every date from start_date to end_date (max 31 days) */
+  task_ids?: string[];
+  start_date?: string;
+  end_date?: string;
+  assignments?: { task_id: string; plan_date: string }[];
+}
+
+export interface BacklogTaskScheduleRangeResult {
+  /** (task, date) occurrences created or refreshed */
+  scheduled: number;
+  tasks: BacklogTask[];
+  not_found: string[];
+  /** Completed tasks, which cannot be scheduled */
+  completed: string[];
+}
+
+export interface BacklogTaskBulkDeleteResult {
+  deleted: string[];
+  /** Ids that do not exist or belong to another user */
+  not_found: string[];
+}
+
 export type BacklogTab = "pending" | "in_progress" | "done" | "active";
 
 export type BacklogContextFilter = TaskContext | "all";
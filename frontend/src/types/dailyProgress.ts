@@ -74,6 +74,16 @@ export interface DailyProgressDay {
   updated_at: string;
 }
 
+/** Per-day entry counts from `GET /daily-progress/?compact=true` (no entries) */
+export interface DailyProgressDayCount {
+  id: string;
+  progress_date: string;
+  title?: string | null;
+  total_tasks: number;
+  completed_tasks: number;
+  completion_rate: number;
+}
+
 export interface DailySummaryInDay {
   id: string;
   daily_progress_day_id: string;
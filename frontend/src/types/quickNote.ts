@@ -9,6 +9,8 @@ export interface QuickNote {
 export interface QuickNoteList {
   notes: QuickNote[];
   total: number;
+  /** Pass as `cursor` to fetch the next page; null on the last page */
+  next_cursor?: string | null;
 }
 
 export interface QuickNoteListFilters {
@@ -0,0 +1,19 @@
+export type SearchType = "backlog_task" | "quick_note" | "daily_entry" | "daily_summary";
+
+export interface SearchHit {
+  type: SearchType;
+  id: string;
+  title: string | null;
+  snippet: string;
+  /** [start, end) character offsets of matched terms within snippet */
+  highlights: [number, number][];
+  score: number;
+  occurred_on: string | null;
+  daily_progress_day_id: string | null;
+}
+
+export interface SearchResponse {
+  q: string;
+  types: SearchType[];
+  results: SearchHit[];
+}
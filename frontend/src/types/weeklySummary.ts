@@ -61,6 +61,8 @@ export interface WeeklySummaryUpdate {
 export interface WeeklySummaryListResponse {
   summaries: WeeklySummary[];
   total: number;
+  /** Pass as `cursor` to fetch the next page; null on the last page */
+  next_cursor?: string | null;
 }
 
 export interface WeeklySummaryGenerateRequest {